@@ -0,0 +1,108 @@
+"""
+Benchmarks building the guided_json extraction requests.
+
+Compares building the payload dict and encoding it per request (as the prompt modules
+used to) with rendering it from the pre-serialized templates. With --endpoint, also
+measures time to first token against a vLLM server for a cold prompt (a nonce in front
+of the system prompt defeats prefix caching) and a warm one sharing the cached prefix.
+
+Run from src/backend:
+    python -m benchmarks.bench_payloads [--endpoint http://localhost:8000 --model <path>]
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import httpx
+
+from demo_data import demo_data
+from llm.journal_prompt import MEDICAL_JOURNAL_SCHEMA, build_medical_journal_payload
+from llm.transcription_prompt import TRANSCRIPTION_SCHEMA, build_transcription_payload
+
+
+def legacy_payload(model_path: str, system_prompt: str, text: str, schema: dict) -> bytes:
+    payload = {
+        "model": model_path,
+        "messages": [
+            {"role": "system", "content": system_prompt.strip()},
+            {"role": "user", "content": text.strip()},
+        ],
+        "guided_json": json.loads(json.dumps(schema)),  # the schema literal was rebuilt on every call
+        "temperature": 0.0,
+    }
+    return httpx.Request("POST", "http://localhost", json=payload).content
+
+
+def time_per_call(build, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_serialization(model_path: str, iterations: int) -> dict:
+    request = demo_data[0]
+    cases = {
+        "transcription": (request["transcription"], TRANSCRIPTION_SCHEMA, build_transcription_payload),
+        "medical_journal": (request["journal"], MEDICAL_JOURNAL_SCHEMA, build_medical_journal_payload),
+    }
+    results = {}
+    for name, (llm_request, schema, build) in cases.items():
+        legacy = time_per_call(lambda: legacy_payload(model_path, llm_request.prompt, llm_request.input_text, schema), iterations)
+        template = time_per_call(lambda: build(model_path, llm_request.prompt, llm_request.input_text), iterations)
+        results[name] = {
+            "bytes": len(build(model_path, llm_request.prompt, llm_request.input_text)),
+            "legacy_us": round(legacy, 2),
+            "template_us": round(template, 2),
+            "speedup": round(legacy / template, 2),
+        }
+    return results
+
+
+async def time_to_first_token(client: httpx.AsyncClient, endpoint_url: str, body: bytes) -> float:
+    start = time.perf_counter()
+    async with client.stream("POST", f"{endpoint_url}/v1/chat/completions", content=body, headers={"Content-Type": "application/json"}) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.startswith("data:") and '"content"' in line:
+                return time.perf_counter() - start
+    return time.perf_counter() - start
+
+
+async def bench_prefill(endpoint_url: str, model_path: str, rounds: int) -> dict:
+    request = demo_data[0]["journal"]
+    cold, warm = [], []
+    async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
+        # Prime the shared prefix once
+        await time_to_first_token(client, endpoint_url, build_medical_journal_payload(model_path, request.prompt, request.input_text, stream=True))
+        for _ in range(rounds):
+            nonce = f"Request {uuid.uuid4()}.\n"
+            cold.append(await time_to_first_token(client, endpoint_url, build_medical_journal_payload(model_path, nonce + request.prompt, request.input_text, stream=True)))
+            warm.append(await time_to_first_token(client, endpoint_url, build_medical_journal_payload(model_path, request.prompt, request.input_text, stream=True)))
+    cold_ms, warm_ms = sum(cold) / rounds * 1000, sum(warm) / rounds * 1000
+    return {
+        "rounds": rounds,
+        "cold_ttft_ms": round(cold_ms, 1),
+        "warm_ttft_ms": round(warm_ms, 1),
+        "saved_prefill_ms": round(cold_ms - warm_ms, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="model", help="Model path sent in the requests")
+    parser.add_argument("--iterations", type=int, default=2000, help="Payloads built per serialization case")
+    parser.add_argument("--endpoint", help="vLLM server to measure time to first token against")
+    parser.add_argument("--rounds", type=int, default=5, help="Cold/warm request pairs sent to the server")
+    args = parser.parse_args()
+
+    results = {"serialization": bench_serialization(args.model, args.iterations)}
+    if args.endpoint:
+        results["prefill"] = asyncio.run(bench_prefill(args.endpoint.rstrip("/"), args.model, args.rounds))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
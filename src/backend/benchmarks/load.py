@@ -0,0 +1,249 @@
+"""
+Load driver for the backend API.
+
+Runs a mix of the traffic the backend sees in production against a running instance
+for a fixed duration:
+
+    dashboards   clients polling GET /db/summaries/ (the dashboard's list refresh)
+    llm          clients calling POST /llm/transcription and /llm/medical_journal back to back
+    pipelines    clients creating a summary, queueing its processing and waiting until it
+                 is completed or failed
+
+Alongside, it probes GET /llm/scheduler/stats, which does no I/O, so its latency tracks
+the server's event-loop lag, and it measures the driver's own event-loop lag to tell
+when the driver itself is the bottleneck. The report (p50/p95/p99 latency, errors and
+requests/s per operation) is printed as JSON, to be compared across commits.
+
+Start the mock vLLM server and the backend, then run from src/backend:
+    python -m benchmarks.mock_vllm --port 8001 &
+    VLLM_ENDPOINT_URL=http://localhost:8001 uvicorn main:app --port 8080 &
+    python -m benchmarks.load --base-url http://localhost:8080 --dashboards 20 --llm 8 --pipelines 4 --duration 60
+"""
+from datetime import datetime, timezone
+from demo_data import demo_data
+import argparse
+import asyncio
+import httpx
+import json
+import platform
+import subprocess
+import time
+import uuid
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def summarize(samples: list[float]) -> dict:
+    """Returns latency percentiles of samples in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 2)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+class Recorder:
+    """Latency samples and error counts per operation."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, dict[str, int]] = {}
+
+    def record(self, operation: str, seconds: float):
+        self.latencies.setdefault(operation, []).append(seconds)
+
+    def error(self, operation: str, reason: str):
+        errors = self.errors.setdefault(operation, {})
+        errors[reason] = errors.get(reason, 0) + 1
+
+    async def timed(self, operation: str, request) -> httpx.Response | None:
+        start = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError as e:
+            self.error(operation, type(e).__name__)
+            return None
+        if response.is_error:
+            self.error(operation, str(response.status_code))
+            return None
+        self.record(operation, time.perf_counter() - start)
+        return response
+
+    def report(self, duration: float) -> dict:
+        operations = {}
+        for operation in sorted(set(self.latencies) | set(self.errors)):
+            latencies = self.latencies.get(operation, [])
+            operations[operation] = {
+                **summarize(latencies),
+                "errors": self.errors.get(operation, {}),
+                "rps": round(len(latencies) / duration, 2),
+            }
+        return operations
+
+
+###############
+## Scenarios ##
+###############
+async def dashboard_client(client: httpx.AsyncClient, recorder: Recorder, deadline: float, interval: float, params: dict):
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        await recorder.timed("dashboard_poll", client.get("/db/summaries/", params=params))
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+async def llm_client(client: httpx.AsyncClient, recorder: Recorder, deadline: float, unique: bool, n: int):
+    i = n
+    while time.monotonic() < deadline:
+        request = demo_data[i % len(demo_data)]
+        i += 1
+        for operation, path, llm_request in (("llm_transcription", "/llm/transcription", request["transcription"]),
+                                             ("llm_medical_journal", "/llm/medical_journal", request["journal"])):
+            input_text = llm_request.input_text
+            if unique:
+                # A nonce keeps the extraction cache from answering repeated inputs
+                input_text = f"[{uuid.uuid4()}]\n{input_text}"
+            body = {"prompt": llm_request.prompt, "input_text": input_text}
+            await recorder.timed(operation, client.post(path, json=body, params={"priority": "reprocess"}))
+
+
+async def pipeline_client(client: httpx.AsyncClient, recorder: Recorder, deadline: float, unique: bool, poll_interval: float, keep: bool, n: int):
+    i = n
+    while time.monotonic() < deadline:
+        request = demo_data[i % len(demo_data)]
+        i += 1
+        start = time.perf_counter()
+        summary = {
+            "title": f"Load test #{i}",
+            "date": datetime.now(timezone.utc).isoformat(),
+            "ambulance_notes": "",
+            "timeline_events": [],
+            "medical_journal": {"critical_information": [], "current_medications": [], "allergy_information": []},
+            "status": "live",
+            "ai_summary": "",
+        }
+        response = await recorder.timed("pipeline_create", client.post("/db/summaries/", json=summary))
+        if response is None:
+            await asyncio.sleep(poll_interval)
+            continue
+        summary_id = response.json()["_id"]
+
+        nonce = f"[{uuid.uuid4()}]\n" if unique else ""
+        body = {
+            "transcription": {"prompt": request["transcription"].prompt, "input_text": nonce + request["transcription"].input_text},
+            "journal": {"prompt": request["journal"].prompt, "input_text": nonce + request["journal"].input_text},
+            "priority": "live",
+        }
+        if await recorder.timed("pipeline_enqueue", client.post(f"/db/summaries/{summary_id}/process", json=body)) is not None:
+            status = None
+            while status not in TERMINAL_STATUSES and time.monotonic() < deadline:
+                await asyncio.sleep(poll_interval)
+                response = await recorder.timed("pipeline_poll", client.get(f"/db/summaries/{summary_id}"))
+                status = response.json().get("status") if response is not None else None
+            if status == "completed":
+                recorder.record("pipeline_end_to_end", time.perf_counter() - start)
+            elif status == "failed":
+                recorder.error("pipeline_end_to_end", "failed")
+            else:
+                recorder.error("pipeline_end_to_end", "unfinished")
+
+        if not keep:
+            await recorder.timed("pipeline_delete", client.delete(f"/db/summaries/{summary_id}"))
+
+
+async def server_probe(client: httpx.AsyncClient, recorder: Recorder, deadline: float, interval: float):
+    while time.monotonic() < deadline:
+        await recorder.timed("server_probe", client.get("/llm/scheduler/stats"))
+        await asyncio.sleep(interval)
+
+
+async def loop_lag_monitor(samples: list[float], deadline: float, interval: float):
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, time.monotonic() - start - interval))
+
+
+############
+## Runner ##
+############
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    started_at = datetime.now(timezone.utc)
+    recorder = Recorder()
+    lag_samples: list[float] = []
+    connections = args.dashboards + args.llm + args.pipelines + 2
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    timeout = httpx.Timeout(args.timeout)
+    params = {"view": args.dashboard_view, "limit": args.dashboard_limit}
+
+    async with httpx.AsyncClient(base_url=args.base_url.rstrip("/"), limits=limits, timeout=timeout) as client:
+        start = time.monotonic()
+        deadline = start + args.duration
+        tasks = [loop_lag_monitor(lag_samples, deadline, 0.01), server_probe(client, recorder, deadline, 0.1)]
+        tasks += [dashboard_client(client, recorder, deadline, args.poll_interval, params) for _ in range(args.dashboards)]
+        tasks += [llm_client(client, recorder, deadline, not args.allow_cache_hits, n) for n in range(args.llm)]
+        tasks += [pipeline_client(client, recorder, deadline, not args.allow_cache_hits, 0.25, args.keep, n) for n in range(args.pipelines)]
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - start
+
+    operations = recorder.report(elapsed)
+    completed = sum(len(samples) for operation, samples in recorder.latencies.items() if operation not in ("server_probe", "pipeline_end_to_end"))
+    return {
+        "commit": git_commit(),
+        "started_at": started_at.isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "base_url": args.base_url, "duration": args.duration, "dashboards": args.dashboards,
+            "poll_interval": args.poll_interval, "dashboard_view": args.dashboard_view, "dashboard_limit": args.dashboard_limit,
+            "llm": args.llm, "pipelines": args.pipelines, "allow_cache_hits": args.allow_cache_hits,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "requests_per_second": round(completed / elapsed, 2),
+        "server_loop_lag": operations.get("server_probe", {"count": 0}),
+        "driver_loop_lag": summarize(lag_samples),
+        "operations": operations,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run")
+    parser.add_argument("--dashboards", type=int, default=10, help="Dashboards polling the summary list")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between a dashboard's polls")
+    parser.add_argument("--dashboard-view", choices=["full", "list"], default="full")
+    parser.add_argument("--dashboard-limit", type=int, default=1000)
+    parser.add_argument("--llm", type=int, default=4, help="Concurrent clients calling the /llm endpoints")
+    parser.add_argument("--pipelines", type=int, default=2, help="Concurrent clients running full incident pipelines")
+    parser.add_argument("--allow-cache-hits", action="store_true", help="Send repeated inputs instead of unique ones")
+    parser.add_argument("--keep", action="store_true", help="Keep the summaries created by pipeline clients")
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--output", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    encoded = json.dumps(report, indent=2)
+    print(encoded)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(encoded + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Local stand-in for the vllm-openai server, for benchmarks and development without GPUs.
+
+Serves /v1/chat/completions (streaming and non-streaming), /v1/models and /health.
+Responses to guided_json requests are generated from the schema, so they parse and
+validate like the real model's output; the same request body always gets the same
+response. Latency follows a simple model of a vLLM server:
+
+    prefill_latency per 1000 prompt tokens (only the tokens after a cached prefix)
+    + token_latency per generated token, slowed down by batch_slowdown per running request
+
+Run from src/backend:
+    python -m benchmarks.mock_vllm --port 8001 --token-latency 0.02
+
+and point the backend at it with VLLM_ENDPOINT_URL=http://localhost:8001.
+"""
+from collections import OrderedDict
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+import uvicorn
+
+# Roughly 4 characters per token for Llama 3 tokenizers on English text
+CHARS_PER_TOKEN = 4
+
+WORDS = (
+    "patient reports chest pain shortness of breath onset minutes ago history of hypertension "
+    "medication dose daily ambulance arrived conscious oriented blood pressure pulse oxygen "
+    "saturation administered transported stable allergy penicillin rash no known"
+).split()
+
+
+class MockSettings:
+    def __init__(self, token_latency: float = 0.02, prefill_latency: float = 0.05, batch_slowdown: float = 0.002,
+                 max_num_seqs: int = 256, max_tokens: int = 512, error_rate: float = 0.0, prefix_cache_size: int = 64):
+        self.token_latency = token_latency
+        self.prefill_latency = prefill_latency
+        self.batch_slowdown = batch_slowdown
+        self.max_num_seqs = max_num_seqs
+        self.max_tokens = max_tokens
+        self.error_rate = error_rate
+        self.prefix_cache_size = prefix_cache_size
+
+
+def generate_instance(schema: dict, rng: random.Random, key: str = ""):
+    """Generates a value that validates against a (guided_json subset of) JSON schema."""
+    schema_type = schema.get("type", "string")
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        value = {name: generate_instance(subschema, rng, name) for name, subschema in properties.items()}
+        for name in schema.get("required", []):
+            value.setdefault(name, generate_instance({"type": "string"}, rng, name))
+        return value
+    if schema_type == "array":
+        return [generate_instance(schema.get("items", {}), rng, key) for _ in range(rng.randint(1, 4))]
+    if schema_type == "integer":
+        return rng.randint(1, 20)
+    if schema_type == "number":
+        return round(rng.uniform(0, 100), 2)
+    if schema_type == "boolean":
+        return rng.random() < 0.5
+    if key == "timestamp":
+        return f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}"
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12))).capitalize()
+
+
+def generate_content(payload: dict, rng: random.Random, max_tokens: int) -> str:
+    if "guided_json" in payload:
+        return json.dumps(generate_instance(payload["guided_json"], rng), ensure_ascii=False)
+    words = [rng.choice(WORDS) for _ in range(min(max_tokens, rng.randint(20, 80)))]
+    return " ".join(words).capitalize() + "."
+
+
+def split_tokens(content: str) -> list[str]:
+    return [content[i:i + CHARS_PER_TOKEN] for i in range(0, len(content), CHARS_PER_TOKEN)]
+
+
+def create_app(settings: MockSettings) -> FastAPI:
+    app = FastAPI(title="Mock vLLM", description="OpenAI-compatible stand-in for benchmarks")
+    state = {"running": 0, "requests": 0}
+    slots = asyncio.Semaphore(settings.max_num_seqs)
+    prefix_cache: OrderedDict[str, None] = OrderedDict()
+
+    def prefill_seconds(messages: list[dict]) -> tuple[float, int]:
+        prompt_chars = sum(len(message.get("content", "")) for message in messages)
+        uncached_chars = prompt_chars
+        if messages and messages[0].get("role") == "system":
+            prefix = hashlib.sha256(messages[0]["content"].encode()).hexdigest()
+            if prefix in prefix_cache:
+                prefix_cache.move_to_end(prefix)
+                uncached_chars -= len(messages[0]["content"])
+            else:
+                prefix_cache[prefix] = None
+                while len(prefix_cache) > settings.prefix_cache_size:
+                    prefix_cache.popitem(last=False)
+        prompt_tokens = prompt_chars // CHARS_PER_TOKEN
+        return settings.prefill_latency * uncached_chars / CHARS_PER_TOKEN / 1000, prompt_tokens
+
+    def token_delay() -> float:
+        return settings.token_latency * (1 + settings.batch_slowdown * state["running"])
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "mock", "object": "model", "owned_by": "mock"}]}
+
+    @app.get("/metrics/mock")
+    async def mock_metrics():
+        return {**state, "cached_prefixes": len(prefix_cache)}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.body()
+        payload = json.loads(body)
+        rng = random.Random(hashlib.sha256(body).digest())
+        if settings.error_rate and random.random() < settings.error_rate:
+            return JSONResponse({"object": "error", "message": "Injected failure"}, status_code=503)
+
+        content = generate_content(payload, rng, payload.get("max_tokens") or settings.max_tokens)
+        tokens = split_tokens(content)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        model = payload.get("model", "mock")
+        state["requests"] += 1
+
+        await slots.acquire()
+        state["running"] += 1
+        try:
+            prefill, prompt_tokens = prefill_seconds(payload.get("messages", []))
+            await asyncio.sleep(prefill)
+        except BaseException:
+            state["running"] -= 1
+            slots.release()
+            raise
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens), "total_tokens": prompt_tokens + len(tokens)}
+
+        if not payload.get("stream"):
+            try:
+                await asyncio.sleep(token_delay() * len(tokens))
+            finally:
+                state["running"] -= 1
+                slots.release()
+            return {
+                "id": completion_id, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            }
+
+        include_usage = bool((payload.get("stream_options") or {}).get("include_usage"))
+
+        async def event_stream():
+            try:
+                for token in tokens:
+                    await asyncio.sleep(token_delay())
+                    chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                             "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                final = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                         "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+                yield f"data: {json.dumps(final)}\n\n"
+                # Like vLLM, token counts are only streamed when asked for, in a last chunk without choices
+                if include_usage:
+                    usage_chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                                   "choices": [], "usage": usage}
+                    yield f"data: {json.dumps(usage_chunk)}\n\n"
+                yield "data: [DONE]\n\n"
+            finally:
+                state["running"] -= 1
+                slots.release()
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--token-latency", type=float, default=0.02, help="Seconds per generated token with an empty batch")
+    parser.add_argument("--prefill-latency", type=float, default=0.05, help="Seconds per 1000 uncached prompt tokens")
+    parser.add_argument("--batch-slowdown", type=float, default=0.002, help="Relative slowdown of decoding per running request")
+    parser.add_argument("--max-num-seqs", type=int, default=256, help="Requests decoded concurrently; the rest wait")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    args = parser.parse_args()
+
+    settings = MockSettings(token_latency=args.token_latency, prefill_latency=args.prefill_latency, batch_slowdown=args.batch_slowdown,
+                            max_num_seqs=args.max_num_seqs, error_rate=args.error_rate)
+    uvicorn.run(create_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+from collections import OrderedDict
+from typing import Awaitable, Callable
+import asyncio
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed; compressing them costs more than it saves
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "64"))
+
+# Only types worth compressing; event streams are excluded, as they must not be buffered
+COMPRESSIBLE_TYPES = (b"application/json", b"text/plain", b"text/html")
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Picks the content coding for a response from an Accept-Encoding header.
+
+    Prefers brotli (when the brotli package is installed) over gzip, and honours q=0.
+
+    Returns:
+        str | None: "br", "gzip", or None for an uncompressed response.
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing JSON responses with the coding the client accepts.
+
+    Responses smaller than minimum_size, already encoded (Content-Encoding set) or
+    streamed in several body messages are passed through unchanged.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoding = negotiate_encoding(_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        start_message = None
+
+        async def send_wrapper(message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                content_type = _header(headers, b"content-type", decode=False) or b""
+                if _header(headers, b"content-encoding") is None and content_type.startswith(COMPRESSIBLE_TYPES):
+                    # Hold the start until the body shows whether it is worth compressing
+                    start_message = message
+                    return
+            elif message["type"] == "http.response.body" and start_message is not None:
+                held, start_message = start_message, None
+                body = message.get("body", b"")
+                if message.get("more_body", False) or len(body) < self.minimum_size:
+                    await send(held)
+                    await send(message)
+                    return
+                body = compress(body, encoding)
+                headers = [(name, value) for name, value in held.get("headers", []) if name.lower() != b"content-length"]
+                headers += [(b"content-encoding", encoding.encode()), (b"content-length", str(len(body)).encode()), (b"vary", b"Accept-Encoding")]
+                await send({**held, "headers": headers})
+                await send({**message, "body": body})
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _header(headers, name: bytes, decode: bool = True):
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1") if decode else value
+    return None
+
+
+class EncodedResponseCache:
+    """
+    Cache of encoded response bodies, keyed by a version or ETag of the data.
+
+    Concurrent requests for the same key share one build of the body, and each
+    compressed variant is made at most once per entry, so pollers asking for an
+    unchanged resource cost neither a database read nor an encoding.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.max_entries = max_entries
+        self.minimum_size = minimum_size
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    async def get(self, key: str, build: Callable[[], Awaitable[tuple[bytes, dict]]], encoding: str | None) -> tuple[bytes, dict]:
+        """
+        Returns the body for key in the given content coding, and the headers to send with it.
+
+        Args:
+            key (str): Identifies the data and every request parameter that shapes the body.
+            build: Coroutine function returning the uncompressed body and its extra headers.
+            encoding (str | None): The negotiated content coding.
+        """
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.stats["hits"] += 1
+                self._entries.move_to_end(key)
+                break
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                entry = await self._build(key, build)
+                break
+            self.stats["coalesced"] += 1
+            try:
+                entry = await asyncio.shield(inflight)
+                break
+            except asyncio.CancelledError:
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # Only the building request was cancelled (e.g. its client disconnected): retry
+
+        headers = dict(entry["headers"])
+        if encoding is None or len(entry[None]) < self.minimum_size:
+            return entry[None], headers
+        if encoding not in entry:
+            entry[encoding] = compress(entry[None], encoding)
+        headers["Content-Encoding"] = encoding
+        headers["Vary"] = "Accept-Encoding"
+        return entry[encoding], headers
+
+    async def _build(self, key: str, build: Callable[[], Awaitable[tuple[bytes, dict]]]) -> dict:
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            body, headers = await build()
+            entry = {None: body, "headers": headers}
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            future.set_result(entry)
+            return entry
+        except asyncio.CancelledError:
+            # Waiters see the future cancelled and one of them builds the entry instead
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
+
+    def snapshot(self) -> dict:
+        return {**self.stats, "entries": len(self._entries), "inflight": len(self._inflight)}
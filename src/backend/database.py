@@ -0,0 +1,56 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from dotenv import load_dotenv
+from metrics import MongoCommandMetrics
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Check if environment variables are loaded
+MONGODB_ROOT_USER = os.getenv('MONGODB_ROOT_USER')
+MONGODB_ROOT_PASSWORD = os.getenv('MONGODB_ROOT_PASSWORD')
+MONGODB_HOST = os.getenv('MONGODB_HOST', 'mongo-db')
+MONGODB_PORT = os.getenv('MONGODB_PORT', '27017')
+
+# Connection pool of each server process; with several workers the server sees workers * MONGODB_MAX_POOL_SIZE connections at most
+MONGODB_MAX_POOL_SIZE = int(os.getenv('MONGODB_MAX_POOL_SIZE', '50'))
+MONGODB_MIN_POOL_SIZE = int(os.getenv('MONGODB_MIN_POOL_SIZE', '5'))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv('MONGODB_MAX_IDLE_TIME_MS', '300000'))
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGODB_SERVER_SELECTION_TIMEOUT_MS', '5000'))
+
+if not MONGODB_ROOT_USER or not MONGODB_ROOT_PASSWORD:
+    logger.error("Environment variables for MongoDB credentials are not set")
+    raise RuntimeError("Environment variables for MongoDB credentials are not set")
+
+# MongoDB connection, shared by the API and the job workers. Creating the client does no I/O:
+# connections are opened by the first command, or ahead of requests by ping_database at startup
+MONGO_URI = f"mongodb://{MONGODB_ROOT_USER}:{MONGODB_ROOT_PASSWORD}@{MONGODB_HOST}:{MONGODB_PORT}/"
+try:
+    client = AsyncIOMotorClient(
+        MONGO_URI,
+        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+        minPoolSize=MONGODB_MIN_POOL_SIZE,
+        maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+        serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+        event_listeners=[MongoCommandMetrics()],
+    )
+    db = client.documents
+    logger.info("Connected to MongoDB")
+except Exception as e:
+    logger.error(f"Failed to connect to MongoDB: {e}")
+    raise RuntimeError(f"Failed to connect to MongoDB: {e}")
+
+
+async def ping_database(timeout: float | None = None):
+    """
+    Checks that MongoDB answers, which also starts filling the connection pool up to MONGODB_MIN_POOL_SIZE.
+
+    Raises:
+        pymongo.errors.PyMongoError: If MongoDB cannot be reached.
+        asyncio.TimeoutError: If it did not answer within timeout seconds.
+    """
+    await asyncio.wait_for(client.admin.command("ping"), timeout)
@@ -6,7 +6,7 @@ demo_data = [
             prompt="You are an expert medical information extractor. Your task is to analyze a patient's medical journal entries and extract **vital information for immediate presentation to a medical doctor or surgeon** in an emergency situation.\n\nBased on the provided medical journal entries, identify and extract the following categories of information, and output them in JSON format according to the schema provided in the API request.\n\nThe categories are:\n\n1.  **Contraindications**: Identify any conditions or history that are absolute or relative contraindications for common emergency treatments (e.g., thrombolysis, certain medications).  Focus on critical contraindications.\n2.  **Current Medications**: List the patient's current medications, including the medication name and the reason for prescription (if available).\n3.  **Relevant Medical History**: Extract significant past medical history that is immediately relevant in an emergency setting. This includes conditions that might influence treatment decisions or patient management.\n4.  **Allergies**:  Report any known allergies. If no allergies are explicitly mentioned, state 'No Known Allergies Documented' and emphasize the need for verification.\n\n**Focus on extracting information that is immediately actionable and critical for a doctor/surgeon in an emergency.** Be concise and medically precise.  If a category is not explicitly mentioned or clearly inferable from the journal entries, you can leave it as an empty list or with a 'not found' indication in the JSON, as appropriate for the schema.\n\nAnalyze the following medical journal entries provided below and output the extracted vital information in JSON format.\n\n**Medical Journal Entries:**",
             input_text="**Journal Entries (Chronological Order - Most Recent at the End)**\n\n**Entry 1:**\n**Date:** 2014-05-15\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Just my yearly check-up, feeling generally well.'\n**Doctor's Notes:**  Patient in good general health. Blood pressure 130/85 mmHg, slightly elevated, advise to monitor diet and exercise. Cholesterol within normal limits.  Weight stable. No new complaints. Advised on healthy lifestyle. Next annual check-up scheduled.\n\n**Entry 2:**\n**Date:** 2014-09-22\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Upper Respiratory Infection\n**Patient Description:** 'Started with a sore throat a few days ago, now I have a cough and feel quite congested.'\n**Doctor's Notes:**  Symptoms consistent with viral upper respiratory infection. Lungs clear on auscultation. Throat mildly erythematous. Advised rest, fluids, and symptomatic treatment with paracetamol and nasal saline spray.  Advised to return if symptoms worsen or persist beyond a week.\n\n**Entry 3:**\n**Date:** 2015-03-10\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Lower Back Pain\n**Patient Description:** 'Woke up with a stiff and painful lower back.  Must have slept awkwardly.'\n**Doctor's Notes:**  Musculoskeletal lower back pain, likely muscle strain. No signs of radiculopathy.  Advised rest, heat application, and over-the-counter ibuprofen if needed.  Recommended gentle stretching exercises as tolerated.\n\n**Entry 4:**\n**Date:** 2015-07-01\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Feeling fine, just the annual check.'\n**Doctor's Notes:**  General health remains good. Blood pressure 128/80 mmHg, improved. Cholesterol still within normal limits. Weight stable. Discussed importance of regular exercise and healthy diet.  Flu vaccination offered and accepted.\n\n**Entry 5:**\n**Date:** 2015-11-18\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Possible Influenza\n**Patient Description:** 'Fever, chills, muscle aches, headache - feels like the flu.'\n**Doctor's Notes:**  Symptoms highly suggestive of influenza.  Febrile (38.9°C).  Advised rest, fluids, and paracetamol for fever and pain.  Discussed importance of flu vaccination for future seasons.\n\n**Entry 6:**\n**Date:** 2016-02-29\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Skin Rash - Contact Dermatitis?\n**Patient Description:** 'Itchy red rash on my wrist.  Started a few days ago, getting worse.'\n**Doctor's Notes:**  Localized erythematous, slightly vesicular rash on the right wrist.  Possible contact dermatitis.  Questioned about new soaps, lotions, or jewelry.  Advised to avoid potential irritants. Prescribed topical hydrocortisone cream.\n\n**Entry 7:**\n**Date:** 2016-06-10\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Another year, another check-up.  No complaints.'\n**Doctor's Notes:**  Stable good health. Blood pressure 132/84 mmHg. Cholesterol and weight stable.  Discussed age-appropriate health screenings.  Recommended colonoscopy screening in the next year due to age.\n\n**Entry 8:**\n**Date:** 2016-12-05\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Acute Gastroenteritis\n**Patient Description:** 'Started vomiting last night, and now I have diarrhea.  Feel terrible.'\n**Doctor's Notes:**  Symptoms consistent with acute gastroenteritis, likely viral.  Mildly dehydrated. Advised oral rehydration with electrolyte solutions, bland diet.  Anti-emetic prescribed for nausea.  Advised to return if dehydration worsens or symptoms persist for more than 48 hours.\n\n**Entry 9:**\n**Date:** 2017-01-15\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Follow-up Colonoscopy Scheduling\n**Patient Description:** 'Just here to schedule that colonoscopy you mentioned at my last check-up.'\n**Doctor's Notes:**  Scheduled screening colonoscopy.  Provided bowel preparation instructions and appointment details.\n\n**Entry 10:**\n**Date:** 2017-02-28\n**Doctor:** Dr.  [Name Redacted], Gastroenterologist (Referral)\n**Reason for Visit:**  Screening Colonoscopy\n**Patient Description:**  (Procedure notes - Patient under sedation, no verbal description)\n**Doctor's Notes:**  Screening colonoscopy performed.  Two small benign polyps removed and sent for histology.  No other abnormalities detected.  Advised follow-up colonoscopy in 5 years if histology confirms benign findings.  Patient tolerated procedure well.\n\n**Entry 11:**\n**Date:** 2017-07-20\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Feeling well, just the usual check.'\n**Doctor's Notes:**  Good general health. Blood pressure 135/86 mmHg, slightly elevated, continue to monitor.  Cholesterol and weight stable.  Colonoscopy results reviewed - benign polyps, routine follow-up recommended.\n\n**Entry 12:**\n**Date:** 2018-04-03\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Right Shoulder Pain\n**Patient Description:** 'Pain in my right shoulder, especially when I lift my arm.  Started gradually.'\n**Doctor's Notes:**  Right shoulder pain, possible rotator cuff tendinitis.  Range of motion limited and painful.  Advised rest, ice, and physiotherapy referral.  Prescribed naproxen for pain relief.\n\n**Entry 13:**\n**Date:** 2018-05-15\n**Doctor:** [Name Redacted], Physiotherapist (Referral)\n**Reason for Visit:**  Right Shoulder Pain - Physiotherapy\n**Patient Description:**  (Physiotherapy notes - Patient undergoing treatment, no verbal description)\n**Doctor's Notes:**  Physiotherapy initiated for right rotator cuff tendinitis.  Treatment plan includes exercises, manual therapy, and pain management strategies.\n\n**Entry 14:**\n**Date:** 2018-08-01\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Follow-up Shoulder Pain\n**Patient Description:** 'Shoulder is much better with physiotherapy, still a little stiff sometimes.'\n**Doctor's Notes:**  Significant improvement in right shoulder pain with physiotherapy.  Range of motion improved.  Advised to continue physiotherapy exercises at home.  Discharge from formal physiotherapy planned, but advised to return if pain recurs.\n\n**Entry 15:**\n**Date:** 2018-09-28\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Headache and Dizziness\n**Patient Description:** 'Sudden headache yesterday, and I've been feeling dizzy on and off today.'\n**Doctor's Notes:**  Report of new onset headache and dizziness. Neurological exam unremarkable. Blood pressure slightly elevated at 140/90 mmHg.  Advised rest and monitoring of symptoms.  Ordered blood pressure monitoring at home for one week.  Advised return if symptoms worsen or persist.\n\n**Entry 16:**\n**Date:** 2019-01-10\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly check-up, feeling generally okay.'\n**Doctor's Notes:**  General health check. Blood pressure consistently elevated in home readings and in office (145/92 mmHg).  Started on low-dose antihypertensive medication (Lisinopril).  Advised on lifestyle modifications (diet, exercise, stress reduction).  Repeat blood pressure check in 4 weeks.\n\n**Entry 17:**\n**Date:** 2019-02-07\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Blood Pressure Follow-up\n**Patient Description:** 'Starting the blood pressure medication, feeling alright.'\n**Doctor's Notes:**  Blood pressure check after starting Lisinopril.  BP now 135/86 mmHg, improvement noted.  Medication tolerated well, no side effects reported. Continue current dose and monitor regularly.  Repeat blood pressure and blood work (renal function, electrolytes) in 3 months.\n\n**Entry 18:**\n**Date:** 2019-05-15\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Blood Pressure and Medication Follow-up\n**Patient Description:** 'Medication seems to be working, feeling fine.'\n**Doctor's Notes:**  Blood pressure well controlled on Lisinopril (130/82 mmHg).  Blood work results reviewed - renal function and electrolytes normal.  Continue current medication and lifestyle modifications.  Annual check-up scheduled for next year.\n\n**Entry 19:**\n**Date:** 2020-03-20\n**Doctor:** Dr. [Name Redacted], Emergency Department Physician\n**Reason for Visit:**  **Emergency Visit - Suspected Stroke**\n**Patient Description:**  (From ED notes and family report)  'Sudden onset of left-sided weakness, slurred speech, and severe headache at home.  Brought in by ambulance.'\n**Doctor's Notes:**  **Presented to ED with acute onset of neurological symptoms suggestive of stroke.**  Left-sided hemiparesis, facial droop, dysarthria.  CT scan of the head performed urgently. **CT scan reveals intracerebral hemorrhage in the right basal ganglia.**  **Thrombolysis is contraindicated due to hemorrhage.**  Neurology consult obtained.  Admitted to Neurology service for close monitoring and supportive care.  **Contraindication to thrombolytic therapy clearly documented in patient chart and flagged.**\n\n**Entry 20:**\n**Date:** 2020-03-21 to 2020-03-28\n**Doctor:** Dr. [Name Redacted], Neurologist (Inpatient Notes - Summarized)\n**Reason for Visit:**  Inpatient Management of Cerebral Hemorrhage\n**Patient Description:**  (Inpatient notes - Patient under neurological observation and treatment)\n**Doctor's Notes:**  Inpatient stay for management of intracerebral hemorrhage.  Blood pressure carefully controlled.  Neurological status monitored closely.  Gradual improvement in left-sided weakness noted during hospitalization.  Physiotherapy and speech therapy initiated.  Discharged home with residual mild left-sided weakness and speech therapy referrals.  **Reinforced contraindication to thrombolysis due to history of intracranial hemorrhage.  This is a permanent contraindication.**\n\n**Entry 21:**\n**Date:** 2020-04-22\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Post-Hemorrhage Follow-up\n**Patient Description:** 'Home from the hospital after the stroke.  Still a bit weak on my left side, but getting better slowly.'\n**Doctor's Notes:**  Post-discharge follow-up after cerebral hemorrhage.  Mild residual left hemiparesis and mild dysarthria present.  Blood pressure well controlled on Lisinopril.  Continuing physiotherapy and speech therapy as outpatient.  Discussed long-term management and rehabilitation.  \n\n**Entry 22:**\n**Date:** 2020-07-15\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Follow-up Rehabilitation\n**Patient Description:** 'Rehab is going okay.  Still working on my strength and speech.'\n**Doctor's Notes:**  Progressing with rehabilitation after cerebral hemorrhage.  Strength in left side improving, speech clearer.  Continuing outpatient physiotherapy and speech therapy.  Blood pressure remains well controlled.\n\n**Entry 23:**\n**Date:** 2020-10-29\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Follow-up and General Health\n**Patient Description:** 'Feeling much stronger now.  Speech is almost back to normal.'\n**Doctor's Notes:**  Significant recovery post-cerebral hemorrhage.  Minimal residual left hemiparesis.  Speech essentially normal.  Continuing maintenance physiotherapy exercises.  Blood pressure stable.  Discussed ongoing healthy lifestyle and medication adherence.\n\n**Entry 24:**\n**Date:** 2021-01-25\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling pretty good considering everything that happened last year.'\n**Doctor's Notes:**  Good recovery from cerebral hemorrhage.  Minimal residual deficits.  Blood pressure well controlled.  Discussed long-term stroke risk reduction strategies.\n\n**Entry 25:**\n**Date:** 2021-06-08\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Knee Pain - Right Knee\n**Patient Description:** 'Right knee has been hurting, especially after walking.  Think I might have twisted it.'\n**Doctor's Notes:**  Right knee pain, possible knee sprain or osteoarthritis flare-up.  Examination reveals mild swelling and tenderness.  Advised rest, ice, compression, and elevation (RICE).  Prescribed topical diclofenac gel.  Considered referral to orthopedics if pain persists.\n\n**Entry 26:**\n**Date:** 2021-09-15\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Follow-up Knee Pain\n**Patient Description:** 'Knee is better, but still gets sore after longer walks.'\n**Doctor's Notes:**  Knee pain improved with conservative management.  Advised continued activity modification and weight management.  No acute orthopedic intervention needed at this time.\n\n**Entry 27:**\n**Date:** 2022-02-10\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check, feeling okay.'\n**Doctor's Notes:**  Stable health. Blood pressure well controlled.  Minimal residual effects from cerebral hemorrhage.  Discussed upcoming flu season and vaccination.\n\n**Entry 28:**\n**Date:** 2022-08-22\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Allergic Reaction - Possible Insect Sting\n**Patient Description:** 'Got stung by something in the garden, my arm is swollen and itchy.'\n**Doctor's Notes:**  Localized allergic reaction to possible insect sting on left forearm.  Erythema, edema, and pruritus present.  No signs of anaphylaxis.  Prescribed oral antihistamine (cetirizine) and topical hydrocortisone cream.\n\n**Entry 29:**\n**Date:** 2023-01-30\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up.'\n**Doctor's Notes:**  Routine annual check-up.  Blood pressure stable and well-controlled.  No new health concerns reported.  General health remains stable.\n\n**Entry 30:**\n**Date:** 2024-02-15\n**Doctor:** Dr. Astrid Olsen, General Practitioner\n**Reason for Visit:**  Mild Cough and Sore Throat\n**Patient Description:** 'Just a mild cough and sore throat for a couple of days.  Probably just a cold.'\n**Doctor's Notes:**  Mild upper respiratory symptoms, likely viral. Lungs clear. Throat mildly erythematous.  Advised symptomatic treatment with rest, fluids, and over-the-counter remedies.  No antibiotics indicated.\n\n**Entry 31:**\n**Date:** 2024-05-02 **(Date of the Accident in Transcript)**\n**Event:**  Motor Vehicle Accident -  Patient involved in a car accident and subsequently experienced cardiac arrest (as per the transcript).  Patient transported by ambulance to Haukeland University Hospital.  **Pre-hospital care documented in Ambulance Report (separate document).  Patient Journal entry created to link to the incident.** "),
         "transcription": LLMRequest(
-            prompt="You are an expert medical summarizer. Your task is to analyze medical incident reports and extract key information.\n\nThe JSON output MUST contain the following fields:\n\n*   `concise_summary`: A brief paragraph summarizing the entire medical incident.\n*   `relevant_medical_info`: A list of strings, each string containing immediately relevant medical information for doctors and surgeons.  This should include initial patient condition, changes in condition, medical interventions, vital signs (initial and post-ROSC if applicable), suspected medical problems/diagnoses, and any relevant environmental factors.\n*   `timeline_events`: A list of objects, where each object represents a timeline event with the following keys:\n    *   `timestamp`: The timestamp of the event in the format '[MM:SS]'.\n    *   `event`: A concise description of the event that occurred at that timestamp.\n\nBe concise and focus on the most medically relevant details.\nFor the `relevant_medical_info` section, use bullet points or markdown lists within the strings to format the information clearly, if appropriate.\nAnalyze the following medical incident report and provide the output in the specified JSON format.",
+            prompt="You are an expert medical summarizer. Your task is to analyze medical incident reports and extract key information.\n\nThe JSON output MUST contain the following fields:\n\n*   `concise_summary`: A brief paragraph summarizing the entire medical incident.\n*   `relevant_medical_info`: A list of strings, each string containing immediately relevant medical information for doctors and surgeons.  This should include initial patient condition, changes in condition, medical interventions, vital signs (initial and post-ROSC if applicable), suspected medical problems/diagnoses, and any relevant environmental factors.\n*   `timeline_events`: A list of objects, where each object represents a timeline event with the following keys:\n    *   `timestamp`: The timestamp of the event in the format '[MM:SS]'.\n    *   `description`: A concise description of the event that occurred at that timestamp.\n\nBe concise and focus on the most medically relevant details.\nFor the `relevant_medical_info` section, use bullet points or markdown lists within the strings to format the information clearly, if appropriate.\nAnalyze the following medical incident report and provide the output in the specified JSON format.",
             input_text="[00:00] Dispatch (Voice, English, Norwegian accent, clear and calm): Emergency services, police, fire, ambulance. What is your emergency?\n\n[00:03] Caller (Voice, English, slightly panicked, Norwegian accent): Yes, hello! I think there's been a bad accident here on Liljeveien. Two cars. One looks really, really bad… wrecked.\n\n[00:07] Dispatch: Liljeveien, confirmed. What type of accident? Are there any injuries? Can you be more specific about the location on Liljeveien?\n\n[00:11] Caller: Car accident, yes.  The one car… it's like, really smashed up. I can see someone inside, in the driver's seat, and they're not moving. The other car, it looks okay, just… parked weirdly in the street, I think. I don't know if they are involved, maybe they stopped to help?\n\n[00:19] Dispatch: Okay, stay calm. Liljeveien, can you give me a house number or landmark? And can you check if the person in the damaged car is breathing? Ambulance and police are being dispatched now. Fire department will be alerted if necessary.\n\n[00:25] Caller: Uhm… it's right by number 12, I think.  The blue house.  I… I'm getting closer to the car now. (Sound of wind and distant traffic, footsteps crunching on gravel) Just a second…  Okay, I'm looking in the window… uh…  I can't see him breathing. His… his face looks kind of blue.  Oh god.\n\n[00:36] Dispatch: Blue face, confirmed. Is the person conscious? Can you try to get a response? Can you open the car door, if it's safe to do so?  And can you tell me if the vehicle is smoking or leaking any fluids?\n\n[00:42] Caller:  No response, no.  He's completely still.  The door…  it's really jammed, I don't think I can open it.  And… no smoke, no fire, but…  I smell gasoline, a little bit.  (Sound of car horn honking weakly, probably accidentally pressed)  Oh, the horn is stuck.\n\n[00:52] Dispatch:  Gasoline smell, noted.  Do not attempt to force the door if it's jammed.  Stay a safe distance from the vehicle in case of fire risk.  Are you able to see if there are any other people in either vehicle?\n\n[00:59] Caller:  No, just the one guy in the bad car, I think.  The other car looks empty.  It's just… sitting in the middle of the road, kind of blocking traffic.  No one else around, just me and… and him.  He really doesn't look good.\n\n[01:08] Dispatch: Okay.  Stay on the line.  Ambulance is en route, estimated time of arrival is approximately five minutes.  Police are also responding.  Do you know how to perform CPR, cardiopulmonary resuscitation?\n\n[01:15] Caller:  CPR…  I… I took a course, like, years ago.  But I'm really nervous.  I… I don't know if I can remember what to do.\n\n[01:21] Dispatch:  I can guide you.  It's important to start chest compressions if he's not breathing.  Are you willing to try?  It could save his life.\n\n[01:26] Caller:  Okay… okay, I'll try.  Just… tell me what to do.  My hands are shaking.\n\n[01:30] Dispatch:  Take a deep breath.  Approach the car carefully.  If you can safely access the patient, place the heel of one hand in the center of his chest, between the nipples. Place your other hand on top.  Push hard and fast, about two inches deep, at a rate of about 100-120 compressions per minute.  Like the beat of “Staying Alive.”\n\n[01:45] Caller:  Okay…  center of the chest…  push hard…  (Sound of heavy breathing and exertion, rhythmic thumping sounds starting)  Is this right?  Am I doing it right?\n\n[01:52] Dispatch:  Yes, that sounds right. Keep going.  Don't stop until the ambulance arrives or he starts breathing again.  We are getting closer.  Can you hear sirens in the distance?\n\n[01:59] Caller:  I… I think so, yeah.  Sirens…  (Sirens faintly approaching in the background)  My arms are getting tired.\n\n[02:05] Dispatch:  Keep going, you're doing great.  Just a little longer.  The ambulance is almost there.  Focus on pushing hard and fast.\n\n[02:10] (Radio static, sounds of sirens getting louder and closer)\n\n[02:13] Dispatch (Radio, clearer voice, switching to professional tone): Ambulance Bergen Central, message for Ambulance 1.  Traffic accident reported, Liljeveien number 12, blue house.  Two vehicles involved, possible cardiac arrest on driver of one vehicle.  Caller reports blue in the face and no respiration.  First party caller is initiating CPR under dispatcher guidance.  Police and fire department are en route.  Possible gasoline leak reported, exercise caution.\n\n[02:25] Paramedic 1 (Radio, male voice, English, Norwegian accent, slightly strained): Ambulance 1, received dispatch. En route to Liljeveien 12.  Requesting update on patient condition if available.  And confirm fire department is responding due to possible fuel leak.\n\n[02:32] Dispatch (Radio):  Confirmed Ambulance 1.  Caller still on the line, continuing CPR.  Patient is pulseless and apneic, cyanotic.  Fire department is responding, confirmed gasoline smell.  Accident location residential street, Liljeveien number 12, blue house.  No further updates at this time.\n\n[02:45] (Sound of sirens getting very loud, then screeching tires and vehicle doors opening rapidly)\n\n[02:48] Firefighter 1 (Voice, male, English, Norwegian accent, yelling slightly over background noise): Fire department on scene! Scene safety assessment!  Where's the accident?  Possible fuel leak reported!  Officer, can you block off the street further down? We need space.\n\n[02:55] Police Officer 1 (Voice, male, English, Norwegian accent, firm and procedural): Police on scene, securing perimeter.  Blocking off Liljeveien at the next intersection.  Where's the damaged vehicle?  And where's the patient?\n\n[03:02] Paramedic 1 (Voice, male, English, Norwegian accent, authoritative, approaching scene rapidly): Ambulance is here!  Where's the patient?  First responder, caller, where are you? We are medical!\n\n[03:08] Caller (Voice, still stressed, pointing): Over here! By the smashed car!  He's in there!  I've been doing CPR like you said!  I don't know if it's working.\n\n[03:14] Paramedic 2 (Voice, female, English, Norwegian accent, professional and calm, moving quickly with equipment): Okay, let's get to the patient. Fire department, can you assess vehicle stability and potential hazards?  Is that fuel leak confirmed?  Officer, crowd control, please.  Keep bystanders back.\n\n[03:22] Firefighter 2 (Voice, male, English, Norwegian accent, checking vehicle): Checking for leaks now.  Fuel smell is present, but no active leak visible at this moment.  Vehicle is unstable due to damage, stand clear until stabilized.  Battery disconnected for safety.  We'll need to use hydraulic tools to get the door open.  Driver's side is heavily compromised.\n\n[03:35] Paramedic 1 (To Caller): You did a great job initiating CPR.  Thank you for your help.  We'll take over patient care now. (To Paramedic 2) Get the monitor and jump bag.  Let's assess.  (To Firefighter 1)  How long for extrication? We need access ASAP.\n\n[03:45] Paramedic 2:  Monitor and bag here.  Gloves on.  (Sound of ripping gloves)  Let's see…  (Looking into the car)  Patient is male, approximately 60s, cyanotic, no visible chest rise.  Still trapped in the vehicle.\n\n[03:53] Firefighter 1:  Hydraulic tools are ready.  We'll start with a door pop and then maybe need to spread the frame if it's too crushed.  Give us two minutes, max. We'll create access.  Stand clear of the tools during operation.\n\n[04:02] Paramedic 1:  Okay, stand back everyone.  Fire department, proceed with extrication.  Paramedic 2, prepare for rapid patient extraction and immediate assessment.  We need to get him out and onto the stretcher as quickly as possible.  Suspect prolonged downtime.  Likely cardiac arrest.\n\n[04:15] (Sounds of hydraulic tools whirring and groaning, metal screeching and bending)\n\n[04:22] Firefighter 2:  Door is popping…  Almost there…  Door is open!  Clear to access patient.  Careful, sharp edges.  Vehicle is still unstable, minimal movement please.\n\n[04:30] Paramedic 2:  Access gained.  (Reaching into the car)  Okay, confirming no pulse, no respiration.  Pupils are fixed and dilated.  Skin is cold and clammy.  Let's get him out.  Fire, can you assist with extraction?  We need to maintain spinal precautions.\n\n[04:40] Firefighter 1:  We'll assist.  Neck stabilization maintained?  On three, we lift and move to your stretcher.  One, two, three.  (Sounds of careful lifting and movement, grunting)\n\n[04:48] Paramedic 1:  Carefully onto the stretcher.  Good.  Let's move him away from the vehicle to a safe zone.  Officer, can you clear a path to the ambulance?\n\n[04:55] Police Officer 1:  Path clear to the ambulance.  Bystanders are being kept back.  Scene is secure as possible given the circumstances.\n\n[05:02] (Sounds of stretcher wheels rolling rapidly on pavement, moving away from the accident scene)\n\n[05:05] Paramedic 2:  Moving to ambulance.  (Inside ambulance, sounds become slightly muffled)  Okay, transferring to ambulance cot.  One, two, three.  Connected to monitor.  Let's get a rhythm strip.  (Sound of monitor beeping, then silence, then flatline tone)\n\n[05:15] Paramedic 1:  Asystole.  As expected.  Start high-quality CPR.  Rate and depth, focus on chest recoil.  Paramedic 2, establish IV access, right arm preferred.  Prepare epinephrine 1mg.  And get the airway bag ready for intubation.\n\n[05:28] Paramedic 2:  IV start kit open.  Alcohol swab.  Tourniquet applied.  Finding a vein…  Got it.  18 gauge in the right AC.  Saline lock attached.  Flushing with saline.  Epinephrine 1mg drawn up, ready to administer.  Airway bag is open.  Laryngoscope and tubes are ready.\n\n[05:45] Paramedic 1:  Excellent.  Administer epinephrine 1mg IV push.  Flush with 20cc saline.  Continue CPR.  Ventilation with bag-valve-mask, 100% oxygen.  Rate of 10 breaths per minute.  Check airway for obstructions.\n\n[05:58] Paramedic 2:  Epinephrine pushed and flushed.  Ventilating with BVM, good chest rise.  Airway clear, no obvious obstructions.  Re-checking rhythm in two minutes.  (Sound of timer beeping)\n\n[06:08] Paramedic 1 (To Dispatch via radio): Ambulance 1 to Bergen Central Dispatch.  Patient extricated from vehicle.  60-year-old male, found in cardiac arrest, asystole on monitor.  CPR in progress, epinephrine 1mg administered.  Requesting physician car if available and ETA to Haukeland University Hospital.  ETA from scene to hospital approximately 15 minutes, transporting code 3.\n\n[06:20] Dispatch (Radio):  Received Ambulance 1.  Physician car dispatched, estimated ETA to your location is approximately 10 minutes.  Haukeland Hospital emergency department notified and prepared for critical patient arrival.  Advise of any changes in patient condition.\n\n[06:30] Paramedic 1 (Radio):  Copy that Dispatch.  Will advise of any changes.  (To Paramedic 2)  Two minutes are up.  Rhythm check.\n\n[06:35] Paramedic 2:  Rhythm check…  Still asystole.  No change.  (Flatline tone continues)\n\n[06:38] Paramedic 1:  Okay, continue CPR.  Prepare for intubation.  We need to secure the airway.  Laryngoscope ready?  Suction ready?\n\n[06:45] Paramedic 2:  Laryngoscope ready.  Blade selected - Miller 4.  Suction is ready and functioning.  Endotracheal tube size 7.5 with stylet, also ready.  Confirming cuff inflation on the tube.  (Sound of air being injected into tube cuff) Cuff inflated and holding pressure.\n\n[07:00] Paramedic 1:  Pre-oxygenate with BVM for 30 seconds.  (Sound of BVM ventilation) Okay, suction available.  Visualize cords.  (Sound of laryngoscope insertion and manipulation, brief silence, then sound of tube insertion) Tube inserted.  Stylet removed.  Inflate cuff.  (Sound of air being injected into tube cuff again)  Confirm tube placement.  Auscultate bilateral lung sounds and epigastrium.\n\n[07:15] Paramedic 2:  Auscultating…  Bilateral lung sounds present and equal.  No epigastric sounds.  Good chest rise with ventilation.  Tube depth at 22 cm at the teeth.  Secure tube with commercial holder.  (Sound of securing the endotracheal tube)  Tube secured.  Attaching to mechanical ventilator.  Setting initial settings - rate 10, tidal volume 500ml, FiO2 100%.\n\n[07:35] Paramedic 1:  Mechanical ventilation initiated.  Continue CPR without interruptions for ventilation.  Re-assess rhythm in another two minutes.  Let's think differential diagnosis.  Possible causes of cardiac arrest in this scenario…  Likely cardiac event, given the circumstances of the accident.  Possible myocardial infarction leading to sudden cardiac arrest and then the collision.  No obvious signs of trauma to suggest traumatic arrest, but we can't rule it out completely until further assessment at the hospital.\n\n[07:55] Paramedic 2:  Agreed.  Age, presentation, sudden onset…  Cardiac event is high on the differential.  But we need to consider the ‘Hs and Ts' - Hypovolemia, Hypoxia, Hydrogen ions (acidosis), Hypo/hyperkalemia, Hypothermia, Toxins, Tamponade, Tension pneumothorax, Thrombosis (coronary or pulmonary), Trauma.  We've addressed hypoxia with ventilation.  No obvious signs of hypovolemia.  Trauma seems less likely as primary cause, but we need to keep it in mind.  Toxins, less likely in this acute presentation.  Thromboembolic event…  possible.  Cardiac tamponade or tension pneumothorax… unlikely without significant trauma.\n\n[08:25] Paramedic 1:  Good systematic approach.  Let's focus on reversible causes while continuing resuscitation efforts.  Second dose of epinephrine due in a few minutes.  Prepare epinephrine 1mg again.  And let's run a 12-lead EKG as soon as we can get a stable rhythm reading, even if it's still asystole, to look for any ST elevations or other clues.\n\n[08:40] Paramedic 2:  Preparing second dose of epinephrine.  12-lead EKG pads are ready.  Timer is almost up for rhythm re-check.  (Timer beeps)  Rhythm check…  Still asystole.\n\n[08:48] Paramedic 1:  Administer second dose of epinephrine 1mg IV push.  Flush with saline.  Continue CPR.  And let's get that 12-lead EKG now, even with asystole.  Just to have it for the hospital.  Attach 12-lead pads.\n\n[09:00] Paramedic 2:  Epinephrine pushed and flushed.  12-lead EKG pads attached.  Starting 12-lead acquisition…  (Sound of EKG machine humming briefly, then printing)  12-lead complete.  Rhythm showing asystole, as expected.  Will label and document time of EKG.\n\n[09:15] Paramedic 1:  Good.  Document everything meticulously.  Time of interventions, medications, rhythm checks, EKG.  Hospital will need a full report.  How's our ETA to Haukeland?\n\n[09:22] Paramedic 2 (Checking GPS/radio):  Dispatch is estimating 8 minutes to hospital arrival based on current traffic.  Physician car still en route, ETA unknown but likely delayed due to traffic and distance.\n\n[09:30] Paramedic 1:  Okay, 8 minutes.  Let's maximize our efforts during transport.  Continue high-quality CPR.  Consider fluid bolus, 500ml normal saline, to address potential hypovolemia, even if not obvious.  And prepare for possible refractory cardiac arrest.  We may need to consider advanced interventions at the hospital if we don't achieve ROSC (Return of Spontaneous Circulation) en route.\n\n[09:45] Paramedic 2:  Fluid bolus of 500ml normal saline prepared.  Ready to administer.  Administering now via IV push.  Fluid bolus complete.  Continuing CPR.  Ventilation maintained via mechanical ventilator.\n\n[10:00] Paramedic 1:  Good.  Re-assess rhythm in another two minutes.  And check for any signs of ROSC, even transiently.  Look for any gasping, eye movement, any signs of spontaneous breathing or pulse.  Although with asystole, ROSC is less likely at this point without further interventions.\n\n[10:10] Paramedic 2:  Two minutes are up.  Rhythm check…  Still asystole.  No change.  No signs of ROSC.  Still pulseless and apneic.\n\n[10:18] Paramedic 1:  Okay, continue CPR and mechanical ventilation.  No ROSC yet.  Prepare for third dose of epinephrine.  And let's contact Haukeland Hospital directly.  Radio to Bergen Central and request direct medical control patch to Haukeland Emergency Department physician. We need to discuss further management options en route, given the prolonged arrest and lack of response to initial interventions.\n\n[10:30] Paramedic 2 (Radio):  Ambulance 1 to Bergen Central Dispatch.  Requesting medical control patch to Haukeland University Hospital Emergency Department physician for consult regarding critical cardiac arrest patient en route.\n\n[10:35] Dispatch (Radio):  Received Ambulance 1.  Patching you through to Haukeland Emergency Department now.  Stand by for connection.  (Sound of radio static and brief ringing tone, then a new voice)\n\n[10:40] Hospital Physician (Radio, female voice, English, clear and authoritative, hospital background noise): Haukeland Emergency Department physician, Dr. Hansen, speaking.  Ambulance 1, go ahead with your report.\n\n[10:45] Paramedic 1 (Radio):  Dr. Hansen, this is Paramedic 1 from Ambulance 1.  We are en route to Haukeland with a 60-year-old male patient in cardiac arrest following a motor vehicle accident.  Suspect cardiac etiology as primary cause, possibly myocardial infarction leading to arrest and accident.  Patient found pulseless and apneic at scene, initial rhythm asystole.  CPR initiated immediately, mechanical ventilation established, intubated, two doses of epinephrine 1mg IV administered, 500ml normal saline bolus given.  Currently still in asystole, no ROSC achieved.  ETA to hospital approximately 6 minutes.  Requesting guidance on further management en route.\n\n[11:05] Hospital Physician (Radio):  Received Ambulance 1.  Patient 60-year-old male, prolonged cardiac arrest, asystole, no ROSC despite epinephrine and fluids.  Given the prolonged downtime and lack of response, prognosis is guarded.  Continue high-quality CPR and ventilation.  Administer third dose of epinephrine 1mg now.  Upon arrival at hospital, we will be prepared to initiate advanced cardiac life support protocols in the resuscitation room.  Consider potential for underlying reversible causes, but in asystole refractory to initial epinephrine doses, consider termination of resuscitation efforts if no ROSC achieved upon arrival, in consultation with ED team.  Do you have any questions?\n\n[11:30] Paramedic 1 (Radio):  Understood Dr. Hansen.  Administering third dose of epinephrine now.  Will continue CPR and ventilation en route.  We will prepare for possible termination of resuscitation upon arrival if no ROSC.  No further questions at this time.  Ambulance 1, out.  (To Paramedic 2)  Administer third dose of epinephrine 1mg.\n\n[11:40] Paramedic 2:  Third dose of epinephrine 1mg IV push administered.  Flushing with saline.  Continuing CPR.  ETA to hospital is approximately 5 minutes now, according to dispatch.\n\n**[11:52] Paramedic 2: Rhythm check… Wait… hold on…  (Sound of monitor beeping with a more regular rhythm now, not flatline) We have a rhythm change! Sinus tachycardia!**\n\n**[11:55] Paramedic 1: Stop compressions! Check for a pulse! (Checking pulse) I feel a weak pulse! ROSC! We have ROSC!**\n\n**[11:58] Paramedic 2:  BP is… low, 82 over 45 mmHg. Heart rate is rapid, 135 bpm. SpO2 is 89%.  Still hypoxic.**\n\n**[12:02] Paramedic 1:  Okay, pulse is weak and thready. BP is very low. Continue ventilation, 100% oxygen.  Monitor closely. Repeat vitals in one minute.**\n\n**[12:05] Paramedic 2: Repeating vitals… BP is still 82/45 mmHg. HR 135 bpm. SpO2 is now 90%.  Minimal improvement in oxygenation.**\n\n**[12:10] Paramedic 1 (Radio to Dispatch): Ambulance 1 to Bergen Central Dispatch.  Patient has achieved ROSC en route!  Sinus tachycardia, weak pulse, BP 82/45, HR 135, SpO2 90%. Still critical but ROSC achieved. ETA to hospital remains approximately 4 minutes.**\n\n**[12:18] Dispatch (Radio): Received Ambulance 1. ROSC achieved, noted. Continue transport code 3. Hospital advised of change in patient condition.**\n\n[12:20] Paramedic 1: Okay, ROSC achieved, but he is still extremely unstable. We need to get him to definitive care ASAP.  Continue monitoring, document everything.\n\n[12:30] Paramedic 2:  Vitals stable for now, but very tenuous. BP 84/47, HR 130, SpO2 91%.  Still critical.\n\n[12:38] Dispatch (Radio): Ambulance 1, Dispatch.  Hospital is standing by for your arrival.\n\n[12:45] (Sounds of ambulance sirens becoming louder, then slowing down, brakes engaging, ambulance coming to a stop)\n\n[12:50] Paramedic 1: We've arrived at Haukeland Hospital Emergency Department.  Directly to resuscitation bay 1. (Ambulance doors opening, sounds of hospital environment becoming clearer) Clear path! Critical patient arriving! ROSC achieved en route, still unstable!\n\n[12:58] Hospital Staff 1 (Voice, male, English, Norwegian accent, taking charge immediately): Resuscitation room 1 clear!  Bring him in!  Transfer to hospital cot! Quickly!  We are ready for handover!\n\n[13:05] Paramedic 2: (Moving patient to hospital cot) Transferring now!  ROSC achieved en route, patient unstable! (Sound of patient being moved to hospital cot)\n\n[13:10] Paramedic 1 (Giving verbal report, slightly breathless): 60-year-old male, cardiac arrest at MVA scene, prolonged downtime, initial rhythm asystole. CPR, intubation, mechanical ventilation, three epi doses, saline bolus given. ROSC achieved approximately two minutes ago in ambulance. Current vitals: BP 82/45, HR 135, SpO2 90%.  Patient unstable, suspected cardiac etiology.\n\n[13:25] Hospital Staff 2 (Voice, female, English, Norwegian accent, acknowledging report):  ROSC en route, unstable, vitals noted. Thank you paramedics. We have him now.\n\n[13:30] (Sound of hospital resuscitation room activity starting, more voices of hospital staff, beeping monitors, sounds fading out as focus shifts to hospital care).\n\n[13:40] Dispatch (Radio, final communication): Ambulance 1, Bergen Central Dispatch.  Confirming patient handover at Haukeland University Hospital Emergency Department.  Incident concluded.  Return to base when available. Good work on scene and during transport, Ambulance 1.\n\n[13:50] Paramedic 1 (Radio, tired voice): Ambulance 1, received Dispatch. Patient handover complete at Haukeland. Returning to base when available. Thank you. (To Paramedic 2, quietly) Let's head back.\n\n[13:58] (Sound of ambulance doors closing, faint sound of sirens briefly as ambulance pulls away, then fades to silence. Radio static.)\n\n[15:00] (End of Transcript)"
         )
     },
@@ -15,7 +15,7 @@ demo_data = [
             prompt="You are an expert medical information extractor. Your task is to analyze a patient's medical journal entries and extract **vital information for immediate presentation to a medical doctor or surgeon** in an emergency situation.\n\nBased on the provided medical journal entries, identify and extract the following categories of information, and output them in JSON format according to the schema provided in the API request.\n\nThe categories are:\n\n1.  **Contraindications**: Identify any conditions or history that are absolute or relative contraindications for common emergency treatments (e.g., thrombolysis, certain medications).  Focus on critical contraindications.\n2.  **Current Medications**: List the patient's current medications, including the medication name and the reason for prescription (if available).\n3.  **Relevant Medical History**: Extract significant past medical history that is immediately relevant in an emergency setting. This includes conditions that might influence treatment decisions or patient management.\n4.  **Allergies**:  Report any known allergies. If no allergies are explicitly mentioned, state 'No Known Allergies Documented' and emphasize the need for verification.\n\n**Focus on extracting information that is immediately actionable and critical for a doctor/surgeon in an emergency.** Be concise and medically precise.  If a category is not explicitly mentioned or clearly inferable from the journal entries, you can leave it as an empty list or with a 'not found' indication in the JSON, as appropriate for the schema.\n\nAnalyze the following medical journal entries provided below and output the extracted vital information in JSON format.\n\n**Medical Journal Entries:**",
             input_text="**Sarah Miller - Medical Health Records**\n\n**Journal Entries (Chronological Order - Most Recent at the End)**\n\n**Entry 1:**\n**Date:** 2012-08-10\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** New Patient Registration & Initial Consultation\n**Patient Description:** 'Just moved to the area and need to establish care with a new GP. Generally healthy.'\n**Doctor's Notes:**  New patient registration. Reviewed past medical history provided by patient - unremarkable. No known allergies listed.  Discussed family medical history - mother with hypertension, father with type 2 diabetes.  Advised on preventative health measures and scheduled annual check-up.\n\n**Entry 2:**\n**Date:** 2013-05-22\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Feeling well, just my yearly check-up.'\n**Doctor's Notes:**  Annual physical examination. Vital signs stable: Blood pressure 125/80 mmHg, Heart rate 72 bpm, Respiratory rate 16 breaths/min.  BMI 24.5 (healthy weight).  Cardiovascular and respiratory exam normal.  Routine blood work ordered (CBC, CMP, Lipid panel).  Discussed importance of regular exercise and balanced diet.\n\n**Entry 3:**\n**Date:** 2013-06-05\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Review of Blood Work Results\n**Patient Description:** 'Came in to review my blood test results from the check-up.'\n**Doctor's Notes:**  Reviewed blood work results.  Complete blood count (CBC) and Comprehensive Metabolic Panel (CMP) within normal limits.  Lipid panel: Total Cholesterol 190 mg/dL, LDL-C 120 mg/dL (borderline high), HDL-C 55 mg/dL, Triglycerides 110 mg/dL.  Advised on dietary modifications to lower LDL cholesterol. Recommended follow-up lipid panel in 6 months.\n\n**Entry 4:**\n**Date:** 2013-11-20\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Follow-up Lipid Panel\n**Patient Description:** 'Follow-up blood test for cholesterol.'\n**Doctor's Notes:**  Repeat lipid panel performed.  Total Cholesterol 185 mg/dL, LDL-C 115 mg/dL, HDL-C 58 mg/dL, Triglycerides 105 mg/dL.  Slight improvement in LDL-C with dietary changes.  Encouraged continued lifestyle modifications.  Scheduled annual check-up.\n\n**Entry 5:**\n**Date:** 2014-05-10\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual physical, feeling good.'\n**Doctor's Notes:**  Annual check-up.  Vital signs stable. Physical exam unremarkable.  Lipid panel remains borderline elevated LDL-C, but stable.  Discussed increasing physical activity to help manage cholesterol.  Offered and administered influenza vaccine.\n\n**Entry 6:**\n**Date:** 2014-09-18\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Sinus Congestion and Headache\n**Patient Description:** 'Started with a runny nose and now I have a bad headache and feel stuffed up.'\n**Doctor's Notes:**  Symptoms consistent with acute sinusitis, likely viral.  Nasal congestion and sinus tenderness noted.  Advised nasal saline rinses, decongestant, and pain reliever (ibuprofen).  Advised to return if symptoms worsen or no improvement in 7 days.\n\n**Entry 7:**\n**Date:** 2015-03-02\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Cough and Chest Congestion\n**Patient Description:** 'Coughing for a week now, chest feels tight and congested.'\n**Doctor's Notes:**  Acute bronchitis suspected.  Lungs with scattered rhonchi on auscultation.  Oxygen saturation 97% on room air.  Advised rest, fluids, expectorant, and cough suppressant at night.  No antibiotics indicated for likely viral etiology.\n\n**Entry 8:**\n**Date:** 2015-05-29\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly check-up.  Feeling generally well.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable with borderline LDL-C.  Discussed importance of weight management and healthy eating habits.  Recommended routine mammogram and Pap smear (age-appropriate screening).\n\n**Entry 9:**\n**Date:** 2015-07-15\n**Doctor:** Dr. [Name Redacted], Mammography Center (Referral)\n**Reason for Visit:**  Screening Mammogram\n**Patient Description:** (Procedure notes - Patient undergoing mammography, no verbal description)\n**Doctor's Notes:**  Screening mammogram performed.  Results BIRADS 1 - Negative.  Routine follow-up mammogram in one year recommended.\n\n**Entry 10:**\n**Date:** 2015-07-20\n**Doctor:** Dr. [Name Redacted], Gynecology Clinic (Referral)\n**Reason for Visit:**  Routine Pap Smear\n**Patient Description:** (Procedure notes - Patient undergoing Pap smear, no verbal description)\n**Doctor's Notes:**  Routine Pap smear performed.  Results within normal limits.  Routine follow-up Pap smear in 3 years recommended per guidelines.\n\n**Entry 11:**\n**Date:** 2016-01-12\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Sore Throat and Fever\n**Patient Description:** 'Sudden sore throat yesterday, now with fever and body aches.'\n**Doctor's Notes:**  Acute pharyngitis with fever (38.5°C).  Throat erythematous with tonsillar exudates.  Rapid Strep test performed - negative.  Likely viral pharyngitis.  Advised symptomatic treatment with rest, fluids, and antipyretics (acetaminophen).\n\n**Entry 12:**\n**Date:** 2016-06-15\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Just my annual check-up, feeling okay.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Reviewed routine screening recommendations.  Administered tetanus booster vaccine.\n\n**Entry 13:**\n**Date:** 2017-04-05\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Right Ankle Sprain\n**Patient Description:** 'Twisted my ankle jogging yesterday, it's swollen and painful.'\n**Doctor's Notes:**  Right ankle sprain.  Swelling, tenderness, and limited range of motion.  Advised RICE (Rest, Ice, Compression, Elevation).  Prescribed over-the-counter ibuprofen for pain relief.  Recommended ankle brace for support.\n\n**Entry 14:**\n**Date:** 2017-06-22\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly check-up, ankle is mostly healed.'\n**Doctor's Notes:**  Annual check-up.  Ankle sprain resolved.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Discussed ongoing exercise and injury prevention.\n\n**Entry 15:**\n**Date:** 2018-02-28\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Bee Sting Reaction - Localized\n**Patient Description:** 'Stung by a bee in the garden, my arm is red and swollen.'\n**Doctor's Notes:**  Localized allergic reaction to bee sting on right forearm.  Erythema, edema, and pruritus present.  No systemic symptoms.  Advised topical hydrocortisone cream and oral antihistamine (diphenhydramine) for symptomatic relief.  Warned patient about potential for more severe reactions in the future and advised to consider allergy testing.\n\n**Entry 16:**\n**Date:** 2018-06-29\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling fine.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Discussed allergy testing for bee venom allergy due to prior reaction.  Patient expressed interest and referral to allergist made.\n\n**Entry 17:**\n**Date:** 2018-08-15\n**Doctor:** Dr. [Name Redacted], Allergist (Referral)\n**Reason for Visit:**  Allergy Testing - Bee Venom\n**Patient Description:** (Allergy testing notes - Patient undergoing skin prick and intradermal testing)\n**Doctor's Notes:**  Allergy skin testing performed for bee venom allergy.  Positive skin prick and intradermal tests to bee venom confirmed significant bee venom allergy.  Prescribed epinephrine auto-injector (EpiPen) and provided education on use and anaphylaxis recognition and management.  Advised patient to wear medical alert bracelet.\n\n**Entry 18:**\n**Date:** 2019-06-05\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, managing bee allergy with EpiPen.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Reviewed EpiPen prescription and technique.  Reinforced importance of carrying EpiPen at all times and avoiding bee stings.\n\n**Entry 19:**\n**Date:** 2020-01-21\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Upset Stomach and Nausea\n**Patient Description:** 'Upset stomach and nausea for a couple of days, maybe something I ate.'\n**Doctor's Notes:**  Symptoms suggestive of mild gastroenteritis.  Abdomen soft and non-tender.  Advised bland diet, fluids, and anti-nausea medication (ondansetron) if needed.\n\n**Entry 20:**\n**Date:** 2020-06-18\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling okay.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Reviewed EpiPen prescription and expiration date - prescription renewed.\n\n**Entry 21:**\n**Date:** 2021-03-10\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Lower Back Strain\n**Patient Description:** 'Lower back pain after lifting heavy boxes, stiff and sore.'\n**Doctor's Notes:**  Musculoskeletal lower back strain.  Muscle spasm and tenderness.  Advised rest, heat therapy, and muscle relaxant (cyclobenzaprine) as needed.\n\n**Entry 22:**\n**Date:** 2021-06-25\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, back pain resolved.'\n**Doctor's Notes:**  Annual physical exam.  Back pain resolved.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Discussed maintaining good posture and safe lifting techniques.\n\n**Entry 23:**\n**Date:** 2021-11-05\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Upper Respiratory Infection\n**Patient Description:** 'Cold symptoms, runny nose, cough, sore throat.'\n**Doctor's Notes:**  Upper respiratory infection, likely viral.  Nasal congestion and mild sore throat.  Lungs clear.  Advised symptomatic treatment - rest, fluids, decongestant, and cough suppressant.\n\n**Entry 24:**\n**Date:** 2022-06-01\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling good.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Reviewed EpiPen prescription and expiration date - prescription renewed.  Administered influenza vaccine.\n\n**Entry 25:**\n**Date:** 2022-10-20\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Headache - Tension Type\n**Patient Description:** 'Headache for a few days, feels like pressure around my head.'\n**Doctor's Notes:**  Tension type headache.  No neurological deficits.  Advised stress reduction techniques, over-the-counter pain reliever (acetaminophen or ibuprofen).\n\n**Entry 26:**\n**Date:** 2023-01-15\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up Headache - Resolved\n**Patient Description:** 'Headache is gone, feeling better.'\n**Doctor's Notes:**  Headache resolved.  Follow-up visit to confirm resolution.  Advised to return if headaches recur or worsen.\n\n**Entry 27:**\n**Date:** 2023-06-09\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling well.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Reviewed EpiPen prescription and expiration date - prescription renewed.  Discussed colonoscopy screening recommendation for age 50.\n\n**Entry 28:**\n**Date:** 2023-12-01\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Skin Rash - Eczema Flare-up\n**Patient Description:** 'Itchy rash on my arms and legs, I think it's eczema.'\n**Doctor's Notes:**  Eczema flare-up.  Dry, erythematous, and pruritic patches on arms and legs.  Prescribed topical corticosteroid cream (triamcinolone) and emollient.  Advised on skin care measures to manage eczema.\n\n**Entry 29:**\n**Date:** 2024-01-05\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up Eczema - Improved\n**Patient Description:** 'Eczema is much better with the cream.'\n**Doctor's Notes:**  Eczema improved with topical corticosteroid and emollients.  Advised continued skin care regimen and to use topical steroid as needed for flare-ups.\n\n**Entry 30:**\n**Date:** 2024-04-18\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Mild Allergy Symptoms - Seasonal\n**Patient Description:** 'Runny nose, sneezing, itchy eyes - think it's spring allergies.'\n**Doctor's Notes:**  Seasonal allergic rhinitis symptoms.  Advised over-the-counter antihistamine (loratadine) and nasal steroid spray.\n\n**Entry 31:**\n**Date:** 2024-06-14\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling generally good.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable: Blood pressure 128/78 mmHg, Heart rate 70 bpm. Physical exam unremarkable. Lipid panel stable. Reviewed EpiPen prescription and expiration date - prescription renewed.  Discussed upcoming colonoscopy screening next year at age 50.\n\n**Entry 32:**\n**Date:** 2024-07-03\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Urinary Tract Infection Symptoms\n**Patient Description:** 'Burning with urination, frequent urge to urinate.'\n**Doctor's Notes:**  Symptoms suggestive of urinary tract infection (UTI).  Urine dipstick performed in office - positive for leukocytes and nitrites.  Prescribed antibiotic (nitrofurantoin) for UTI.  Advised increased fluid intake.\n\n**Entry 33:**\n**Date:** 2024-07-10\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up UTI - Improved\n**Patient Description:** 'UTI symptoms are much better after starting antibiotics.'\n**Doctor's Notes:**  UTI symptoms improved with antibiotic treatment.  Urine dipstick repeated - negative for leukocytes and nitrites.  Completed course of antibiotics.\n\n**Entry 34:**\n**Date:** 2024-08-22\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Anxiety and Sleep Difficulty\n**Patient Description:** 'Feeling more anxious lately, having trouble sleeping.'\n**Doctor's Notes:**  Reports increased anxiety and insomnia.  Discussed stress management techniques, relaxation exercises, and sleep hygiene.  Recommended starting with lifestyle modifications.  Offered referral to therapist if symptoms persist or worsen.\n\n**Entry 35:**\n**Date:** 2024-09-19\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up Anxiety - Still Present\n**Patient Description:** 'Anxiety and sleep problems are still bothering me.'\n**Doctor's Notes:**  Anxiety and insomnia persisting despite lifestyle modifications.  Patient agreed to start low-dose antidepressant/anti-anxiety medication (sertraline).  Started sertraline 25mg daily.  Scheduled follow-up in 4 weeks to assess efficacy and side effects.\n\n**Entry 36:**\n**Date:** 2024-10-17\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up Sertraline - Initial Check\n**Patient Description:** 'Started the sertraline, feeling a little better, maybe.'\n**Doctor's Notes:**  Initial follow-up after starting sertraline.  Reports slight improvement in anxiety and sleep.  No significant side effects reported.  Continue current dose of sertraline 25mg daily.  Increase dose to 50mg daily after one week if tolerated and if further improvement needed.  Follow-up in 4 weeks.\n\n**Entry 37:**\n**Date:** 2024-11-14\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up Sertraline - Dose Increase\n**Patient Description:** 'Increased sertraline dose to 50mg, feeling more calm now, sleeping better.'\n**Doctor's Notes:**  Follow-up after sertraline dose increase to 50mg daily.  Reports significant improvement in anxiety and sleep.  Tolerating medication well.  Continue sertraline 50mg daily.  Monitor for any side effects and schedule routine follow-up in 3 months.\n\n**Entry 38:**\n**Date:** 2025-02-13\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:**  Follow-up Sertraline - Stable\n**Patient Description:** 'Sertraline is working well, feeling much better overall.'\n**Doctor's Notes:**  Follow-up for sertraline management.  Anxiety and sleep well controlled on sertraline 50mg daily.  Patient feeling stable and functioning well.  Continue current medication regimen.  Schedule routine annual check-up.\n\n**Entry 39:**\n**Date:** 2025-06-20\n**Doctor:** Dr. Mark Johnson, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up, feeling good and stable on my medications.'\n**Doctor's Notes:**  Annual physical exam.  Vital signs stable.  Physical exam unremarkable.  Lipid panel stable.  Mental health stable on sertraline 50mg daily.  Reviewed all medications and allergies.  EpiPen prescription renewed.  Scheduled routine follow-up next year.\n\n**Entry 40:**\n**Date:** 2025-08-29 **(Date of the Bee Sting and Anaphylaxis in Transcript)**\n**Event:**  Severe Allergic Reaction - Bee Sting - Patient experienced anaphylactic reaction after bee sting in garden.  Self-administered EpiPen prior to EMS arrival.  EMS transported to City General Hospital Emergency Department.  **Pre-hospital and Emergency Department care documented in Ambulance and Hospital Records (separate documents). Patient Journal entry created to link to the incident and for follow-up care planning.**\n\nThis health record provides over 40 entries and details Sarah Miller's medical history leading up to and including the anaphylactic reaction to the bee sting. Let me know if you need any adjustments or further details!"),
         "transcription": LLMRequest(
-            prompt="You are an expert medical summarizer. Your task is to analyze medical incident reports and extract key information.\n\nThe JSON output MUST contain the following fields:\n\n*   `concise_summary`: A brief paragraph summarizing the entire medical incident.\n*   `relevant_medical_info`: A list of strings, each string containing immediately relevant medical information for doctors and surgeons.  This should include initial patient condition, changes in condition, medical interventions, vital signs (initial and post-ROSC if applicable), suspected medical problems/diagnoses, and any relevant environmental factors.\n*   `timeline_events`: A list of objects, where each object represents a timeline event with the following keys:\n    *   `timestamp`: The timestamp of the event in the format '[MM:SS]'.\n    *   `event`: A concise description of the event that occurred at that timestamp.\n\nBe concise and focus on the most medically relevant details.\nFor the `relevant_medical_info` section, use bullet points or markdown lists within the strings to format the information clearly, if appropriate.\nAnalyze the following medical incident report and provide the output in the specified JSON format.",
+            prompt="You are an expert medical summarizer. Your task is to analyze medical incident reports and extract key information.\n\nThe JSON output MUST contain the following fields:\n\n*   `concise_summary`: A brief paragraph summarizing the entire medical incident.\n*   `relevant_medical_info`: A list of strings, each string containing immediately relevant medical information for doctors and surgeons.  This should include initial patient condition, changes in condition, medical interventions, vital signs (initial and post-ROSC if applicable), suspected medical problems/diagnoses, and any relevant environmental factors.\n*   `timeline_events`: A list of objects, where each object represents a timeline event with the following keys:\n    *   `timestamp`: The timestamp of the event in the format '[MM:SS]'.\n    *   `description`: A concise description of the event that occurred at that timestamp.\n\nBe concise and focus on the most medically relevant details.\nFor the `relevant_medical_info` section, use bullet points or markdown lists within the strings to format the information clearly, if appropriate.\nAnalyze the following medical incident report and provide the output in the specified JSON format.",
             input_text="[15:03] Dispatch (Voice, English, neutral, calm): Emergency services, 911, what is your emergency?\n\n[15:03] Caller (Voice, English, male, panicked, slightly out of breath): Yes, hello!  My wife… I think she's really sick.  She's been stung by a bee and she's… she's having trouble breathing!\n\n[15:03] Dispatch: Okay, stay calm sir. You said your wife has been stung by a bee? Where are you located?  Please give me your address.\n\n[15:03] Caller: Yes, a bee sting!  She's allergic, really allergic!  We are at 14 Oakwood Lane, apartment 2B.  Oakwood Lane, O-A-K-W-O-O-D, Lane. Apartment 2B.\n\n[15:04] Dispatch: 14 Oakwood Lane, apartment 2B, confirmed.  Is your wife conscious?  How old is she?\n\n[15:04] Caller: Yes, conscious, but… she's gasping for air.  She's 45 years old.  Oh god, she's turning red!  And she's scratching like crazy!\n\n[15:04] Dispatch: Red and scratching, difficulty breathing, 45 years old, apartment 2B, 14 Oakwood Lane.  Ambulance is being dispatched immediately.  Is she able to speak to me?  Does she have an EpiPen, an epinephrine auto-injector?\n\n[15:05] Caller: No, she can barely talk.  Just… wheezing.  EpiPen… yes, yes, we have one!  In the kitchen drawer!  Wait, I'll get it…  (Sound of running footsteps, drawers opening and closing in the background)  Here it is!  EpiPen!  But… I don't know how to use it!  Never had to before!\n\n[15:05] Dispatch: Okay, listen carefully.  This is very important.  The EpiPen is in a yellow case, correct?\n\n[15:05] Caller: Yes, yellow!  With a blue cap!\n\n[15:06] Dispatch: Good.  Remove the blue safety cap.  Hold the EpiPen with the orange tip pointing down.  Press the orange tip firmly against her outer thigh, through her clothes if necessary.  Hold it in place for ten seconds.  Can you do that?\n\n[15:06] Caller: Orange tip down… thigh… okay…  (Sound of rustling clothes, a click sound)  I did it!  I pressed it!  Is that it?\n\n[15:06] Dispatch: Yes, hold it there for ten seconds.  One, two, three…  Keep holding…  seven, eight, nine, ten.  Okay, you can remove it now.  Did you hold it firmly against her thigh for the whole ten seconds?\n\n[15:07] Caller: Yes, I think so.  It was kind of quick.  But I held it.  What now?  Is it working?  She's still breathing really fast.  And she's saying her throat is closing up.\n\n[15:07] Dispatch: Okay, the epinephrine might take a few minutes to work fully.  Tell me exactly what her symptoms are right now. Is she conscious? Is she able to swallow? Is she still scratching?  What color is her skin now?\n\n[15:08] Caller: Conscious, yes.  But… she's really scared.  Swallowing… I don't know, she hasn't tried to drink anything.  Scratching… yes, still scratching, especially her neck and chest.  Skin…  still red and blotchy.  And her lips… they look a little swollen.  And her tongue, she says it feels thick.\n\n[15:08] Dispatch: Swollen lips, thick tongue, throat closing up, red and blotchy skin, scratching, difficulty breathing.  Allergic reaction confirmed.  Ambulance is still en route, they are very close.  Keep her calm.  Have her sit or lie down in a comfortable position.  Is there anything else you notice?  Any vomiting, dizziness, or fainting?\n\n[15:09] Caller: No vomiting.  She said she feels a little dizzy, yes.  And her heart is racing, she says.  She's really, really scared.  I'm scared too.  This is bad.\n\n[15:09] Dispatch: I understand you're scared, sir.  But you're doing a good job.  Stay on the line with me.  The ambulance is almost there.  Can you hear sirens?\n\n[15:10] Caller:  Sirens…  yes, I think I hear them!  Faintly…  yes, they're getting louder!  Oh thank god!  (Sound of sirens approaching in the distance, getting louder)\n\n[15:10] Dispatch:  Okay, the ambulance is arriving.  Go to your front door and wave to guide them to your apartment.  Keep the door open for them.  I will stay on the line until the paramedics arrive.  Do you see them yet?\n\n[15:11] Caller: Yes!  Yes, they're here!  Parking outside!  Red and white ambulance!  I see them getting out!  Thank you, thank you so much!  I'll go open the door!\n\n[15:11] Dispatch:  You're welcome, sir.  I am disconnecting now as the paramedics are on scene.  Please let them take over patient care.  Stay calm and cooperate with the emergency responders.\n\n[15:11] Caller:  Okay, yes, will do.  Thank you again.  Goodbye.  (Line disconnects)\n\n[15:12] (Radio static, sounds of ambulance sirens stopping abruptly, vehicle doors opening, hurried footsteps, voices becoming clearer)\n\n[15:12] Paramedic 1 (Voice, male, English, professional, slightly raised voice to be heard over background noise): Ambulance on scene! Apartment 2B, Oakwood Lane!  Dispatch report of severe allergic reaction, bee sting, female patient, 45 years old, difficulty breathing, EpiPen administered by husband.\n\n[15:12] Paramedic 2 (Voice, female, English, professional, calm):  Got it.  Grab the jump bag and oxygen.  Let's go, quickly!  (Sound of hurried footsteps on stairs or in hallway, approaching apartment door)\n\n[15:13] Paramedic 1 (Knocking loudly on door):  Ambulance!  Emergency medical services!  (Door opens, sound of a man breathing heavily and a woman gasping)\n\n[15:13] Caller (Voice, male, relieved, slightly breathless):  Thank god you're here!  She's in the living room!  Hurry!\n\n[15:13] Paramedic 2 (Entering apartment, voice becoming clearer, professional and reassuring):  Hello, we are paramedics.  Where is your wife?  (Sound of moving quickly into the apartment)\n\n[15:14] Paramedic 1 (Following Paramedic 2, assessing the scene):  Patient in living room, sitting upright on the sofa.  Appears conscious but in distress.  Severe respiratory distress evident.  Let's assess immediately.  (To patient, voice calm and direct)  Hello ma'am, I'm a paramedic.  Can you tell me your name?\n\n[15:14] Patient (Voice, female, English, strained, gasping for breath):  …  Sarah…  Sarah…  Miller…  … Can't…  breathe…\n\n[15:15] Paramedic 2 (Moving closer to patient, starting assessment):  Okay Sarah, we're here to help you breathe.  I'm going to listen to your lungs, okay?  (Sound of stethoscope being unpacked and applied to patient's chest)  Husband, can you tell us what happened?  Bee sting, you said?\n\n[15:15] Caller (Voice, male, anxious):  Yes, bee sting!  In the garden, just five minutes ago.  She's really allergic!  We have an EpiPen, I just gave it to her like the dispatcher told me to.  Just now.\n\n[15:16] Paramedic 1 (Assessing patient's airway and breathing):  Airway patent, but labored breathing.  Significant wheezing and stridor on inspiration and expiration.  Accessory muscle use.  Respiratory rate very rapid and shallow.  Cyanosis around lips and nail beds.  Oxygen saturation…  (Attaching pulse oximeter to patient's finger, sound of gentle beeping)  …  Oxygen saturation is 88% on room air.  That's low.\n\n[15:16] Paramedic 2 (Continuing assessment, taking blood pressure):  Blood pressure…  (Inflating blood pressure cuff, sound of soft whooshing)  Blood pressure is 90 over 60 mmHg.  Pulse is rapid and thready, approximately 120 beats per minute, regular rhythm.  Skin is hot, flushed, and covered in hives.  Generalized urticaria and angioedema evident, especially around face and neck.  Pupils are equal and reactive to light.  Patient is alert but anxious and in severe respiratory distress.\n\n[15:17] Paramedic 1:  Anaphylactic shock, definitely.  EpiPen was administered, but clearly not sufficient.  We need to escalate treatment immediately.  Start high-flow oxygen via non-rebreather mask.  Get the oxygen tank and mask ready.  And prepare for IV access.  Jump bag, get the IV start kit and fluids.\n\n[15:18] Paramedic 2 (Preparing oxygen and IV equipment):  Oxygen tank and non-rebreather mask ready.  Setting oxygen flow rate to 15 liters per minute.  Applying mask now.  (Sound of oxygen hissing softly, mask being placed on patient's face)  IV start kit open.  Saline solution ready.  Let's find a good vein.\n\n[15:18] Paramedic 1 (Monitoring patient's breathing and oxygen saturation):  Oxygen on, 15 liters per minute via non-rebreather.  Monitoring oxygen saturation…  (Pulse oximeter beeping continues)  Oxygen saturation is slowly rising…  now 90%, 91%…  Still low, but improving slightly.  Respiratory rate remains rapid and labored.  Wheezing still prominent.  We need to get another dose of epinephrine in, intravenously this time.  And consider other medications.\n\n[15:19] Paramedic 2 (Preparing IV access, palpating for vein):  Finding a vein…  veins are a bit constricted, probably due to the shock.  Trying the antecubital fossa…  Got a good vein in the left antecubital.  Preparing the site with alcohol swab.  Inserting 18 gauge catheter.  (Sound of needle insertion, soft gasp from patient)  IV access established.  Flushing with saline.  Good flashback, IV line patent.  Securing the IV catheter.\n\n[15:20] Paramedic 1 (Calculating epinephrine dose and preparing medication):  Okay, IV access secured.  Excellent.  Let's prepare epinephrine 0.3mg IV.  We have epinephrine 1:1000 ampules.  We need to dilute it to 1:10,000 for IV administration.  Drawing up 0.3ml of 1:1000 epinephrine.  And diluting it with 2.7ml of normal saline in a 3ml syringe.  Epinephrine 1:10,000, 0.3mg dose prepared for IV push.\n\n[15:21] Paramedic 2 (Connecting IV fluids and preparing to administer epinephrine):  IV fluids connected, running wide open.  Saline bolus infusing rapidly.  Epinephrine dose ready.  Confirming dose and concentration – epinephrine 1:10,000, 0.3mg IV push.  Ready to administer when you say so.\n\n[15:21] Paramedic 1 (Re-assessing patient, confirming need for epinephrine):  Patient's condition remains critical.  Respiratory distress severe, wheezing and stridor persistent.  Oxygen saturation still around 91-92% despite high-flow oxygen.  Blood pressure still low at 90/60.  Pulse rapid.  No contraindications to epinephrine.  Administer epinephrine 0.3mg IV push now.\n\n[15:22] Paramedic 2 (Administering epinephrine):  Administering epinephrine 0.3mg IV push slowly over 1 minute.  Pushing now…  epinephrine administered.  Flushing IV line with 10ml saline.  Flush complete.\n\n[15:23] Paramedic 1 (Monitoring patient closely after epinephrine administration):  Monitoring patient response to IV epinephrine.  Observing for changes in breathing, wheezing, skin signs, and vital signs.  Re-checking oxygen saturation…  (Pulse oximeter beeping)  Oxygen saturation is now 93%, 94%…  Slight improvement.  Respiratory rate still rapid, but maybe slightly less labored.  Wheezing still present, but possibly a little less intense.  Blood pressure…  re-checking blood pressure.\n\n[15:24] Paramedic 2 (Re-checking blood pressure and pulse):  Re-checking blood pressure…  Blood pressure is now 95 over 65 mmHg.  Still low, but a slight increase.  Pulse is still rapid, around 115 beats per minute, but maybe slightly stronger.  Skin still flushed and hives present, but color might be slightly less intense.  Patient still appears anxious and in respiratory distress, but possibly slightly less severe than before epinephrine.\n\n[15:25] Paramedic 1:  Some improvement after IV epinephrine, but still not out of the woods.  We need to consider other medications and rapid transport to the hospital.  Prepare diphenhydramine (Benadryl) 50mg IV and ranitidine (Zantac) 50mg IV.  These are antihistamines to help with the allergic reaction.  And let's also prepare methylprednisolone (Solu-Medrol) 125mg IV, a corticosteroid to reduce inflammation and prevent a biphasic reaction.  Get the medication box and draw up these medications.\n\n[15:26] Paramedic 2 (Preparing antihistamines and corticosteroid):  Medication box open.  Drawing up diphenhydramine 50mg IV.  Diphenhydramine prepared.  Drawing up ranitidine 50mg IV.  Ranitidine prepared.  Drawing up methylprednisolone 125mg IV.  Methylprednisolone prepared.  All three medications drawn up and ready for IV administration.\n\n[15:27] Paramedic 1:  Good.  Administer diphenhydramine 50mg IV push first, followed by ranitidine 50mg IV push, and then methylprednisolone 125mg IV push.  Administer each medication slowly over 1-2 minutes, and flush with saline in between each medication.  And continue to monitor vital signs and oxygen saturation closely.  Let's get ready for rapid transport to the hospital.  Stretcher ready?\n\n[15:28] Paramedic 2 (Administering medications and preparing stretcher):  Administering diphenhydramine 50mg IV push now…  Diphenhydramine administered, flushing with saline.  Administering ranitidine 50mg IV push now…  Ranitidine administered, flushing with saline.  Administering methylprednisolone 125mg IV push now…  Methylprednisolone administered, flushing with saline.  All three medications administered.  Stretcher is ready and in position.\n\n[15:29] Paramedic 1 (Re-assessing patient and preparing for transport):  Re-assessing patient after antihistamines and corticosteroid.  Oxygen saturation now 95%, 96%…  Improving further.  Respiratory rate still elevated but less labored.  Wheezing still present, but less pronounced.  Blood pressure…  Blood pressure is now 100 over 70 mmHg.  Pulse is around 110 beats per minute.  Patient still anxious but appears slightly more comfortable.  We need to transport now.  Let's get her onto the stretcher.  Sir, we need to take your wife to the hospital for further treatment.  She's still having a serious allergic reaction, but we've given her some medication that should help.\n\n[15:30] Caller (Voice, male, still anxious but slightly calmer):  Okay, yes, hospital.  That's good.  Will she be okay?  Is she going to be alright?\n\n[15:30] Paramedic 2 (Reassuring the husband while preparing to move patient):  We've given her medication to help, and we're taking her to the hospital where they can give her more advanced treatment if needed.  We're doing everything we can for her.  Let's carefully move her onto the stretcher now.  We need to maintain spinal precautions as a precaution, even though there's no obvious trauma.  Just to be safe.\n\n[15:31] Paramedic 1 (Guiding the transfer to the stretcher):  Okay Sarah, we're going to help you move onto the stretcher now.  Try to relax and stay as still as possible.  On the count of three, we'll lift and move.  One, two, three.  (Sounds of careful lifting and movement, patient grunting softly)  Gently onto the stretcher.  Good.  Securing straps now.\n\n[15:32] Paramedic 2 (Securing patient on stretcher and preparing for transport):  Patient secured on stretcher.  Oxygen mask in place and secure.  IV line checked and secured.  Monitoring equipment still attached and functioning.  Ready for transport.  Let's move to the ambulance.  Husband, do you want to come with us in the ambulance?\n\n[15:32] Caller (Voice, male, relieved):  Yes, please!  I want to go with her.  Thank you again for everything.\n\n[15:33] Paramedic 1 (Moving stretcher towards the ambulance):  Okay, come with us.  Let's go.  (Sound of stretcher wheels rolling on floor, moving towards the exit)  Paramedic 2, can you call dispatch and give them a patient update and ETA to the nearest hospital with an emergency department?  And request physician notification at the hospital.\n\n[15:33] Paramedic 2 (On radio, while moving stretcher):  Ambulance 1 to Dispatch.  Update on patient at 14 Oakwood Lane, apartment 2B.  45-year-old female, severe anaphylactic reaction to bee sting.  Initial EpiPen administered by husband prior to arrival.  On scene, patient found in severe respiratory distress, wheezing, stridor, cyanosis, hypotension.  Treated with high-flow oxygen, IV epinephrine 0.3mg, diphenhydramine 50mg IV, ranitidine 50mg IV, and methylprednisolone 125mg IV.  Patient showing some improvement but still requires hospital care.  Current vital signs: BP 100/70 mmHg, heart rate 110 bpm, SpO2 96% on 15L O2.  Requesting ETA to nearest hospital with emergency department and physician notification.  Transporting code 2.\n\n[15:34] Dispatch (Radio):  Received Ambulance 1.  Patient update noted.  ETA to City General Hospital Emergency Department is approximately 8 minutes based on current traffic.  Physician notification requested and in progress at City General.  Transport code 2 authorized.  Advise of any changes in patient condition.\n\n[15:34] Paramedic 2 (Radio):  Copy that Dispatch.  8 minutes to City General, physician notification in progress.  Will advise of any changes.  Ambulance 1, out.  (To Paramedic 1)  8 minutes to City General, physician notified.\n\n[15:35] Paramedic 1 (Loading stretcher into ambulance, sounds of ambulance doors opening and closing):  Okay, loading patient into ambulance now.  Careful with the head.  (Sounds of stretcher being rolled into ambulance and secured)  Patient loaded and secured in ambulance.  Husband, please sit in the passenger seat.  Paramedic 2, jump in the back with the patient.  Let's go.  Transporting to City General Hospital Emergency Department.\n\n[15:36] (Ambulance doors closing, sounds become slightly muffled, engine starting, sirens briefly, then fading to background hum of ambulance in motion)\n\n[15:36] Paramedic 2 (Inside ambulance, re-assessing patient and monitoring equipment):  Re-assessing patient en route.  Oxygen saturation remains stable at 96-97% on high-flow oxygen.  Respiratory rate still slightly elevated, but breathing less labored.  Wheezing minimal now.  Blood pressure…  Blood pressure is now 105 over 75 mmHg.  Heart rate around 105 bpm.  Patient is more alert and less anxious.  Sarah, how are you feeling now?  Better than before?\n\n[15:37] Patient (Voice, female, weak but clearer than before):  …  Yes…  a little…  better…  Still…  tired…  and itchy…  but…  breathing…  easier…  Thank you…\n\n[15:37] Paramedic 2:  That's good to hear, Sarah.  You're doing great.  We're almost at the hospital now.  Just a few more minutes.  We're monitoring you closely.  Husband, how are you doing?\n\n[15:38] Caller (Voice, male, quieter, relieved):  I'm okay.  Just…  really worried.  But she seems better now, thank god.  You guys were amazing.  Thank you so much.\n\n[15:38] Paramedic 1 (Driving ambulance, radio communication):  Ambulance 1 to City General Hospital Emergency Department.  ETA approximately 5 minutes.  45-year-old female, anaphylactic reaction to bee sting.  Treated pre-hospitally with oxygen, epinephrine, diphenhydramine, ranitidine, and methylprednisolone.  Patient condition improving but still requires ED evaluation and management.  Vital signs stable: BP 105/75, HR 105, SpO2 97% on 15L O2.  Will be arriving code 2 in approximately 5 minutes.  Requesting resuscitation bay preparation and allergy/respiratory team notification.\n\n[15:39] Hospital Dispatch (Radio, female voice, English, clear, hospital tone):  Received Ambulance 1.  Patient report noted.  Resuscitation bay 2 prepared.  Emergency physician and respiratory nurse notified and awaiting your arrival.  Proceed directly to resuscitation bay 2 upon arrival.  Advise upon arrival at hospital.\n\n[15:39] Paramedic 1 (Radio):  Copy that City General.  Proceeding to resuscitation bay 2.  Will advise upon arrival.  Ambulance 1, out.  (To Paramedic 2)  5 minutes to hospital.  Resuscitation bay 2 is ready.  They are expecting us.\n\n[15:40] Paramedic 2 (Monitoring patient, continuing care):  Patient remains stable.  Vital signs unchanged.  Breath sounds clear.  No signs of worsening condition.  IV fluids infusing well.  Continue to monitor closely.  Almost there, Sarah.  Just a little bit longer.\n\n[15:43] (Sounds of ambulance sirens becoming louder, then slowing down, brakes engaging, ambulance coming to a stop)\n\n[15:43] Paramedic 1:  Arrived at City General Hospital Emergency Department.  Resuscitation bay 2.  (Ambulance doors opening, sounds of hospital environment becoming clearer)  Clear path to resuscitation bay 2!  Ambulance arriving with anaphylaxis patient!\n\n[15:43] Hospital Staff 1 (Voice, male, English, hospital staff, taking charge):  Resuscitation bay 2 is clear!  Bring her in!  Stretcher coming through!  Respiratory team is here!\n\n[15:44] Paramedic 2 (Moving stretcher out of ambulance):  Moving patient to resuscitation bay 2.  Anaphylaxis patient, 45-year-old female, bee sting, pre-hospital treatment given.  (Sound of stretcher wheels rolling rapidly on hospital floor)\n\n[15:44] Paramedic 1 (Giving verbal handover report, slightly louder to be heard over hospital background noise):  Handover report for 45-year-old female, Sarah Miller, anaphylactic reaction to bee sting approximately 20 minutes ago.  Known bee sting allergy.  Initial symptoms: difficulty breathing, hives, angioedema, hypotension.  Pre-hospital treatment: EpiPen by husband, oxygen 15L NRB, IV access established, epinephrine 0.3mg IV, diphenhydramine 50mg IV, ranitidine 50mg IV, methylprednisolone 125mg IV, 1 liter normal saline bolus infused.  Current vital signs: BP 105/75 mmHg, heart rate 105 bpm, SpO2 97% on 15L oxygen.  Patient condition improved after treatment but requires further evaluation and management for anaphylaxis.  Patient is alert and oriented, answers questions appropriately.  Husband is present and will provide further history.\n\n[15:45] Hospital Staff 2 (Voice, female, English, hospital nurse, acknowledging report):  Anaphylaxis, 45-year-old female, report received and understood.  Vital signs noted.  Thank you paramedics.  We will take over patient care now.  Please transfer patient to hospital bed.\n\n[15:45] Paramedic 2 (Transferring patient to hospital bed):  Transferring patient to hospital bed now.  One, two, three.  (Sound of patient being moved from stretcher to hospital bed)  Patient transferred.  IV line and oxygen mask remain in place.  Monitoring equipment transferred to hospital monitor.\n\n[15:46] Hospital Staff 3 (Voice, male, English, hospital physician, examining patient):  Okay, I'm Dr. Lee, the emergency physician.  Let's assess the patient.  Thank you paramedics for the excellent pre-hospital care and thorough report.  We will continue treatment here.\n\n[15:46] Paramedic 1 (To Hospital Staff):  You're welcome, doctor.  We have completed our handover.  We will leave the patient in your care.  Here is our patient care report for documentation. (Sound of paper being handed over)\n\n[15:47] Hospital Staff 2 (Voice, female, English, hospital nurse):  Thank you paramedics.  We have everything we need.  You are free to return to service.\n\n[15:47] Paramedic 2 (To Paramedic 1, quietly):  Okay, handover complete.  Let's pack up our equipment and head back to base.\n\n[15:47] Paramedic 1 (To Hospital Staff):  Thank you.  Have a good day.  (To Paramedic 2)  Let's go.  (Sounds of paramedics gathering equipment, moving away from resuscitation bay, hospital sounds fading slightly)\n\n[15:48] Hospital Dispatch (Radio, final communication):  Ambulance 1, City General Hospital confirming patient handover complete at Emergency Department.  Incident concluded.  Return to base when available.  Good job on scene and transport, Ambulance 1.\n\n[15:48] Paramedic 1 (Radio, relieved voice):  Ambulance 1, received Hospital Dispatch.  Patient handover complete at City General ED.  Returning to base when available.  Thank you.  (To Paramedic 2, quietly)  Well, that was a close one.  Let's get some coffee.\n\n[15:49] (Sound of ambulance doors closing, faint sound of sirens briefly as ambulance pulls away, then fades to silence. Radio static.)"
         )
     },
@@ -24,7 +24,7 @@ demo_data = [
             prompt="You are an expert medical information extractor. Your task is to analyze a patient's medical journal entries and extract **vital information for immediate presentation to a medical doctor or surgeon** in an emergency situation.\n\nBased on the provided medical journal entries, identify and extract the following categories of information, and output them in JSON format according to the schema provided in the API request.\n\nThe categories are:\n\n1.  **Contraindications**: Identify any conditions or history that are absolute or relative contraindications for common emergency treatments (e.g., thrombolysis, certain medications).  Focus on critical contraindications.\n2.  **Current Medications**: List the patient's current medications, including the medication name and the reason for prescription (if available).\n3.  **Relevant Medical History**: Extract significant past medical history that is immediately relevant in an emergency setting. This includes conditions that might influence treatment decisions or patient management.\n4.  **Allergies**:  Report any known allergies. If no allergies are explicitly mentioned, state 'No Known Allergies Documented' and emphasize the need for verification.\n\n**Focus on extracting information that is immediately actionable and critical for a doctor/surgeon in an emergency.** Be concise and medically precise.  If a category is not explicitly mentioned or clearly inferable from the journal entries, you can leave it as an empty list or with a 'not found' indication in the JSON, as appropriate for the schema.\n\nAnalyze the following medical journal entries provided below and output the extracted vital information in JSON format.\n\n**Medical Journal Entries:**",
             input_text="**John Miller - Electronic Medical Records**\n\n**Journal Entries (Chronological Order - Most Recent at the End)**\n\n**Entry 1:**\n**Date:** 2010-07-12\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** New Patient Registration & Initial Consultation\n**Patient Description:** 'Just moved to the area and looking for a new family doctor.  Generally in good health.'\n**Doctor's Notes:** New patient registration. Reviewed patient's self-reported medical history. Reports no major illnesses, no known allergies. Family history significant for heart disease (father had myocardial infarction at age 60).  Advised on preventative health and scheduled annual check-up.\n\n**Entry 2:**\n**Date:** 2011-06-20\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly physical, feeling pretty good.'\n**Doctor's Notes:** Annual physical examination. Vital signs: Blood pressure 135/88 mmHg (slightly elevated), Heart rate 75 bpm, Respiratory rate 16 breaths/min.  BMI 26.0 (overweight). Cardiovascular and respiratory exams unremarkable.  Routine blood work ordered (CBC, CMP, Lipid panel).  Discussed lifestyle modifications to address borderline hypertension and weight.\n\n**Entry 3:**\n**Date:** 2011-07-05\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of Blood Work Results\n**Patient Description:** 'Checking in for my blood test results.'\n**Doctor's Notes:** Reviewed blood work results. CBC and CMP within normal limits. Lipid panel: Total Cholesterol 220 mg/dL (high), LDL-C 150 mg/dL (high), HDL-C 40 mg/dL (low), Triglycerides 180 mg/dL (borderline high).  Diagnosed with hyperlipidemia.  Strongly advised on dietary changes and increased physical activity to lower cholesterol and improve lipid profile.  Repeat lipid panel in 3 months.\n\n**Entry 4:**\n**Date:** 2011-10-10\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Follow-up Lipid Panel\n**Patient Description:** 'Repeat cholesterol test.'\n**Doctor's Notes:** Repeat lipid panel performed. Total Cholesterol 210 mg/dL, LDL-C 140 mg/dL, HDL-C 42 mg/dL, Triglycerides 170 mg/dL.  Some improvement in lipid profile with lifestyle changes, but still significantly elevated LDL-C.  Started patient on low-dose statin medication (atorvastatin 10mg daily) to manage hyperlipidemia.  Discussed potential side effects and importance of medication adherence.  Repeat lipid panel and liver function tests in 6 weeks.\n\n**Entry 5:**\n**Date:** 2011-11-21\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Follow-up Lipid Panel and Medication Check\n**Patient Description:** 'Checking my cholesterol again after starting the medication.'\n**Doctor's Notes:** Repeat lipid panel and liver function tests. Lipid panel: Total Cholesterol 180 mg/dL, LDL-C 110 mg/dL, HDL-C 45 mg/dL, Triglycerides 150 mg/dL.  Significant improvement in lipid profile with atorvastatin 10mg. Liver function tests within normal limits.  Medication tolerated well, no side effects reported.  Continue atorvastatin 10mg daily.  Annual check-up scheduled.\n\n**Entry 6:**\n**Date:** 2012-06-15\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual physical. Feeling okay.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 140/90 mmHg (elevated), Heart rate 70 bpm.  BMI 26.5 (overweight).  Cardiovascular exam: regular rate and rhythm, no murmurs.  Respiratory exam: clear lungs.  Lipid panel well-controlled on atorvastatin 10mg.  Blood pressure consistently elevated.  Diagnosed with hypertension.  Started patient on low-dose antihypertensive medication (hydrochlorothiazide 12.5mg daily).  Advised on low-sodium diet and increased exercise.  Repeat blood pressure check in 4 weeks.\n\n**Entry 7:**\n**Date:** 2012-07-12\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Blood Pressure Follow-up\n**Patient Description:** 'Checking my blood pressure after starting the water pill.'\n**Doctor's Notes:** Blood pressure check after starting hydrochlorothiazide. Blood pressure now 130/82 mmHg. Improvement noted. Medication tolerated well, no side effects reported. Continue current dose of hydrochlorothiazide 12.5mg daily.  Repeat blood pressure and electrolytes in 3 months.\n\n**Entry 8:**\n**Date:** 2012-10-18\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Blood Pressure and Electrolyte Follow-up\n**Patient Description:** 'Follow-up for blood pressure and labs.'\n**Doctor's Notes:** Blood pressure well-controlled on hydrochlorothiazide 12.5mg (128/80 mmHg). Electrolytes within normal limits. Continue current medication regimen.  Encouraged lifestyle modifications for weight loss and blood pressure management.  Annual check-up scheduled.\n\n**Entry 9:**\n**Date:** 2013-06-03\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly check-up. Feeling alright.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 130/84 mmHg, Heart rate 72 bpm. BMI 27.0 (overweight).  Physical exam unremarkable. Lipid panel and blood pressure well-controlled on current medications.  Discussed importance of continued medication adherence and lifestyle modifications.\n\n**Entry 10:**\n**Date:** 2014-05-28\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual physical.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 132/86 mmHg, Heart rate 74 bpm. BMI 27.5 (overweight).  Physical exam unremarkable.  Lipid panel and blood pressure stable.  Recommended colonoscopy screening at age 50 (patient is 50 years old this year).\n\n**Entry 11:**\n**Date:** 2014-08-12\n**Doctor:** Dr. [Name Redacted], Gastroenterologist (Referral)\n**Reason for Visit:** Screening Colonoscopy\n**Patient Description:** (Procedure notes - Patient under sedation, no verbal description)\n**Doctor's Notes:** Screening colonoscopy performed. One small benign polyp removed and sent for histology. No other abnormalities detected. Advised follow-up colonoscopy in 5 years if histology confirms benign findings. Patient tolerated procedure well.\n\n**Entry 12:**\n**Date:** 2014-09-05\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Post-Colonoscopy Follow-up\n**Patient Description:** 'Checking in after my colonoscopy.'\n**Doctor's Notes:** Reviewed colonoscopy results - benign polyp, routine follow-up recommended in 5 years.  Patient doing well post-procedure.\n\n**Entry 13:**\n**Date:** 2015-06-10\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual physical.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 135/88 mmHg, Heart rate 76 bpm. BMI 28.0 (overweight/obese). Physical exam unremarkable. Lipid panel and blood pressure stable.  Reinforced lifestyle modification counseling for weight loss and overall health improvement.\n\n**Entry 14:**\n**Date:** 2016-07-18\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly check-up.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 138/90 mmHg (borderline high), Heart rate 78 bpm. BMI 28.5 (obese). Physical exam unremarkable. Lipid panel and blood pressure slightly less well controlled. Increased hydrochlorothiazide dose to 25mg daily to better manage blood pressure.  Advised stricter dietary control and exercise regimen.\n\n**Entry 15:**\n**Date:** 2016-09-02\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Blood Pressure Follow-up\n**Patient Description:** 'Checking blood pressure after dose increase.'\n**Doctor's Notes:** Blood pressure check after increasing hydrochlorothiazide. Blood pressure now 130/84 mmHg. Improved blood pressure control with dose increase.  Medication tolerated well. Continue hydrochlorothiazide 25mg daily and atorvastatin 10mg daily.\n\n**Entry 16:**\n**Date:** 2017-05-22\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual physical.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 132/85 mmHg, Heart rate 75 bpm. BMI 29.0 (obese). Physical exam unremarkable. Lipid panel and blood pressure stable on current medications.  Continued counseling on weight management, diet, and exercise.\n\n**Entry 17:**\n**Date:** 2018-06-29\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 135/86 mmHg, Heart rate 77 bpm. BMI 29.5 (obese). Physical exam unremarkable. Lipid panel and blood pressure stable. Offered influenza vaccination - accepted and administered.\n\n**Entry 18:**\n**Date:** 2019-07-15\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Yearly check-up.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 138/88 mmHg, Heart rate 79 bpm. BMI 30.0 (obese). Physical exam unremarkable. Lipid panel and blood pressure remain stable but at higher end of normal range.  Discussed increasing atorvastatin dose to 20mg daily to further optimize lipid profile. Patient agreed, atorvastatin increased to 20mg daily.\n\n**Entry 19:**\n**Date:** 2019-09-02\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Follow-up Lipid Panel and Medication Check\n**Patient Description:** 'Checking cholesterol after dose increase.'\n**Doctor's Notes:** Repeat lipid panel after increasing atorvastatin to 20mg daily. Lipid panel: Total Cholesterol 170 mg/dL, LDL-C 100 mg/dL, HDL-C 48 mg/dL, Triglycerides 140 mg/dL.  Further improvement in lipid profile with atorvastatin 20mg. Liver function tests normal. Medication tolerated well. Continue atorvastatin 20mg and hydrochlorothiazide 25mg daily.\n\n**Entry 20:**\n**Date:** 2020-07-22\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 135/85 mmHg, Heart rate 76 bpm. BMI 30.5 (obese). Physical exam unremarkable. Lipid panel and blood pressure stable on current medications.  Discussed repeat colonoscopy screening due next year.\n\n**Entry 21:**\n**Date:** 2021-08-05\n**Doctor:** Dr. [Name Redacted], Gastroenterologist (Referral)\n**Reason for Visit:** Screening Colonoscopy - Follow-up\n**Patient Description:** (Procedure notes - Patient undergoing colonoscopy, no verbal description)\n**Doctor's Notes:** Screening colonoscopy performed. No polyps or abnormalities detected.  Routine follow-up colonoscopy in 10 years recommended. Patient tolerated procedure well.\n\n**Entry 22:**\n**Date:** 2021-08-20\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Post-Colonoscopy Follow-up\n**Patient Description:** 'Checking in after my colonoscopy.'\n**Doctor's Notes:** Reviewed colonoscopy results - normal, no polyps. Routine follow-up in 10 years. Patient doing well post-procedure.\n\n**Entry 23:**\n**Date:** 2022-06-13\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 130/82 mmHg, Heart rate 74 bpm. BMI 31.0 (obese). Physical exam unremarkable. Lipid panel and blood pressure stable.  Discussed increasing physical activity and dietary changes for weight management.\n\n**Entry 24:**\n**Date:** 2023-07-07\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual check-up.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 132/84 mmHg, Heart rate 75 bpm. BMI 31.5 (obese). Physical exam unremarkable. Lipid panel and blood pressure stable.  Discussed knee pain and possible osteoarthritis. Recommended weight loss and low-impact exercise.\n\n**Entry 25:**\n**Date:** 2023-11-15\n**Doctor:** Dr. [Name Redacted], Orthopedic Surgeon (Referral)\n**Reason for Visit:** Right Hip Pain - Evaluation for Hip Replacement\n**Patient Description:** 'Referred for hip pain, getting worse over time.'\n**Doctor's Notes:** Evaluation for right hip osteoarthritis.  X-rays confirm significant osteoarthritis of the right hip joint.  Discussed treatment options including conservative management and total hip replacement. Patient considering hip replacement due to increasing pain and functional limitations.\n\n**Entry 26:**\n**Date:** 2024-01-20\n**Doctor:** Dr. [Name Redacted], Orthopedic Surgeon\n**Reason for Visit:** Pre-operative Consultation - Total Hip Replacement\n**Patient Description:** 'Consultation for hip replacement surgery.'\n**Doctor's Notes:** Pre-operative consultation for right total hip replacement.  Reviewed risks and benefits of surgery.  Patient scheduled for right total hip replacement in 6 weeks.  Pre-operative clearance required from primary care physician.  Discussed post-operative rehabilitation plan and anticoagulation protocol.\n\n**Entry 27:**\n**Date:** 2024-02-05\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Pre-operative Medical Clearance - Hip Replacement\n**Patient Description:** 'Pre-op clearance for hip surgery.'\n**Doctor's Notes:** Pre-operative medical clearance for right total hip replacement.  Reviewed patient's medical history and current medications.  ECG performed - sinus rhythm, no acute changes.  Blood work ordered (CBC, CMP, Coagulation studies).  Patient cleared for surgery from a medical standpoint.  Advised to continue atorvastatin and hydrochlorothiazide pre-operatively.\n\n**Entry 28:**\n**Date:** 2024-02-12\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of Pre-operative Blood Work\n**Patient Description:** 'Checking pre-op blood work results.'\n**Doctor's Notes:** Reviewed pre-operative blood work. CBC and CMP within normal limits. Coagulation studies within normal limits.  Patient medically cleared for hip replacement surgery.\n\n**Entry 29:**\n**Date:** 2024-03-05 **(Approximate date of Hip Replacement Surgery - inferred)**\n**Event:** Right Total Hip Replacement Surgery -  Patient underwent right total hip replacement surgery.  Procedure performed by Dr. [Name Redacted], Orthopedic Surgeon at City General Hospital.  Post-operative course documented in Hospital Records (separate document).\n\n**Entry 30:**\n**Date:** 2024-03-06 to 2024-03-12 **(Approximate dates of Hospital Stay - inferred)**\n**Doctor:** Dr. [Name Redacted], Orthopedic Surgeon (Inpatient Notes - Summarized)\n**Reason for Visit:** Post-operative Care - Total Hip Replacement\n**Patient Description:** (Inpatient notes - Patient recovering post-operatively)\n**Doctor's Notes:** Post-operative care following right total hip replacement.  Patient tolerated surgery well.  Pain controlled with analgesics.  Started on prophylactic anticoagulation with warfarin post-operatively to prevent deep vein thrombosis and pulmonary embolism.  Physical therapy initiated.  Discharged home on post-operative day 7 with prescriptions for warfarin, pain medication (acetaminophen), and instructions for home care and physical therapy.  Warfarin dosage and monitoring instructions provided.\n\n**Entry 31:**\n**Date:** 2024-03-15\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Post-operative Follow-up and Warfarin Management\n**Patient Description:** 'Post-op check after hip replacement and managing my blood thinner.'\n**Doctor's Notes:** Post-operative follow-up visit after hip replacement discharge.  Surgical wound healing well, no signs of infection.  Patient tolerating warfarin, no bleeding complications reported.  Reviewed warfarin dosage and monitoring schedule.  Ordered INR (International Normalized Ratio) blood test to monitor warfarin anticoagulation level.\n\n**Entry 32:**\n**Date:** 2024-03-18\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of INR Result - Warfarin Management\n**Patient Description:** 'Checking my blood thinner blood test result.'\n**Doctor's Notes:** Reviewed INR result. INR is 2.2, within therapeutic range (target range 2.0-3.0 for hip replacement prophylaxis).  Continue current warfarin dosage.  Repeat INR in one week.\n\n**Entry 33:**\n**Date:** 2024-03-25\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of INR Result - Warfarin Management\n**Patient Description:** 'Another blood test result for my warfarin.'\n**Doctor's Notes:** Reviewed INR result. INR is 2.5, within therapeutic range.  Continue current warfarin dosage. Repeat INR in two weeks.\n\n**Entry 34:**\n**Date:** 2024-04-08\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of INR Result - Warfarin Management\n**Patient Description:** 'Checking my blood thinner level again.'\n**Doctor's Notes:** Reviewed INR result. INR is 2.4, within therapeutic range.  Continue current warfarin dosage.  Repeat INR in four weeks.\n\n**Entry 35:**\n**Date:** 2024-05-06\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of INR Result - Warfarin Management\n**Patient Description:** 'Routine blood test for my warfarin.'\n**Doctor's Notes:** Reviewed INR result. INR is 2.6, within therapeutic range.  Continue current warfarin dosage.  Repeat INR in four weeks.\n\n**Entry 36:**\n**Date:** 2024-06-03\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of INR Result - Warfarin Management\n**Patient Description:** 'Routine warfarin blood test result.'\n**Doctor's Notes:** Reviewed INR result. INR is 2.5, within therapeutic range.  Continue current warfarin dosage.  Repeat INR in four weeks.  Plan to discontinue warfarin after 3 months post-operatively as per orthopedic recommendations (approximately early June).  Discussed duration of anticoagulation with patient.\n\n**Entry 37:**\n**Date:** 2024-07-01\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Follow-up Warfarin Discontinuation and Hip Recovery\n**Patient Description:** 'Checking in to stop the blood thinner and see how my hip is doing.'\n**Doctor's Notes:**  Discussed discontinuation of warfarin as anticoagulation course completed (3 months post-hip replacement).  INR last checked and within therapeutic range.  Warfarin discontinued today.  Hip replacement recovery progressing well.  Patient reporting decreasing pain and improving mobility with physical therapy.  Advised continued physical therapy and home exercises.  Scheduled routine annual check-up for next year.\n\n**Entry 38:**\n**Date:** 2025-06-25\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Annual Check-up\n**Patient Description:** 'Annual physical.'\n**Doctor's Notes:** Annual physical exam. Vital signs: Blood pressure 134/86 mmHg, Heart rate 75 bpm. BMI 31.0 (obese). Physical exam unremarkable. Hip replacement recovery successful, good range of motion and minimal pain. Lipid panel and blood pressure stable on current medications.  Reviewed medication list – atorvastatin 20mg and hydrochlorothiazide 25mg daily.  Offered influenza vaccine – accepted and administered.\n\n**Entry 39:**\n**Date:** 2026-03-05\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Right Calf Pain and Swelling\n**Patient Description:** 'Right calf pain and swelling started yesterday, worried about a blood clot.'\n**Doctor's Notes:** Right calf pain and swelling.  Concern for deep vein thrombosis (DVT) given recent hip replacement history (although warfarin discontinued almost 2 years ago).  Right calf tender to palpation and slightly warmer than left.  Lower extremity Doppler ultrasound ordered to rule out DVT.  Advised to elevate leg and avoid prolonged standing until ultrasound results are available.\n\n**Entry 40:**\n**Date:** 2026-03-06\n**Doctor:** Dr. Eleanor Vance, General Practitioner\n**Reason for Visit:** Review of Doppler Ultrasound Results\n**Patient Description:** 'Checking in for ultrasound results on my leg.'\n**Doctor's Notes:** Reviewed lower extremity Doppler ultrasound results.  Negative for deep vein thrombosis (DVT) in the right leg.  Calf pain and swelling likely musculoskeletal strain or superficial thrombophlebitis.  Advised symptomatic treatment with heat, elevation, and over-the-counter pain reliever (ibuprofen).  Advised to return if symptoms worsen or do not improve within a week. Reassured patient regarding negative DVT finding.\n\n**Entry 41:**\n**Date:** 2026-08-29 **(Date of the Chest Pain and Shortness of Breath in Transcript)**\n**Event:** Acute Chest Pain and Shortness of Breath - Patient experienced sudden onset of severe chest pain and shortness of breath at home, one week post-hip replacement surgery (note: this is an error in the transcript scenario - hip replacement was actually over 2 years prior based on EMR chronological order, but we will keep it consistent with the transcript scenario description for this entry).  EMS activated and transported to City General Hospital Emergency Department.  **Pre-hospital and Emergency Department care documented in Ambulance and Hospital Records (separate documents). Patient Journal entry created to link to the incident and for follow-up care planning.**"),
         "transcription": LLMRequest(
-            prompt="You are an expert medical summarizer. Your task is to analyze medical incident reports and extract key information.\n\nThe JSON output MUST contain the following fields:\n\n*   `concise_summary`: A brief paragraph summarizing the entire medical incident.\n*   `relevant_medical_info`: A list of strings, each string containing immediately relevant medical information for doctors and surgeons.  This should include initial patient condition, changes in condition, medical interventions, vital signs (initial and post-ROSC if applicable), suspected medical problems/diagnoses, and any relevant environmental factors.\n*   `timeline_events`: A list of objects, where each object represents a timeline event with the following keys:\n    *   `timestamp`: The timestamp of the event in the format '[MM:SS]'.\n    *   `event`: A concise description of the event that occurred at that timestamp.\n\nBe concise and focus on the most medically relevant details.\nFor the `relevant_medical_info` section, use bullet points or markdown lists within the strings to format the information clearly, if appropriate.\nAnalyze the following medical incident report and provide the output in the specified JSON format.",
+            prompt="You are an expert medical summarizer. Your task is to analyze medical incident reports and extract key information.\n\nThe JSON output MUST contain the following fields:\n\n*   `concise_summary`: A brief paragraph summarizing the entire medical incident.\n*   `relevant_medical_info`: A list of strings, each string containing immediately relevant medical information for doctors and surgeons.  This should include initial patient condition, changes in condition, medical interventions, vital signs (initial and post-ROSC if applicable), suspected medical problems/diagnoses, and any relevant environmental factors.\n*   `timeline_events`: A list of objects, where each object represents a timeline event with the following keys:\n    *   `timestamp`: The timestamp of the event in the format '[MM:SS]'.\n    *   `description`: A concise description of the event that occurred at that timestamp.\n\nBe concise and focus on the most medically relevant details.\nFor the `relevant_medical_info` section, use bullet points or markdown lists within the strings to format the information clearly, if appropriate.\nAnalyze the following medical incident report and provide the output in the specified JSON format.",
             input_text="[09:15] Dispatch (Voice, English, calm, professional): Emergency services, 911, what is your emergency?\n\n[09:15] Caller (Voice, English, female, panicked, breathless):  Help!  Please, I need an ambulance! My husband… he's really sick!\n\n[09:15] Dispatch: Okay, stay calm ma'am.  What is your emergency? Tell me exactly what is happening.  And please provide your address.\n\n[09:15] Caller:  It's my husband, John… John Miller.  He… he just had a hip replacement last week, and now… now he can't breathe!  He's got terrible chest pain!  We're at 22 Willow Creek Drive.  Willow Creek Drive, W-I-L-L-O-W, Creek. Number 22.\n\n[09:16] Dispatch: 22 Willow Creek Drive, confirmed.  And your husband's name is John Miller, is that correct?  He is having difficulty breathing and chest pain?  Is he conscious?\n\n[09:16] Caller:  Yes, John Miller.  He's 68 years old.  Conscious, yes, but… he's in terrible pain.  Gasping for air.  He says it's like… like an elephant sitting on his chest.  And he's sweating, really sweating.\n\n[09:16] Dispatch:  Chest pain, difficulty breathing, sweating, 68-year-old male, recent hip replacement, 22 Willow Creek Drive.  Ambulance is being dispatched immediately.  Has he had any other symptoms?  Coughing?  Pain in his leg?  Dizziness?\n\n[09:17] Caller:  No cough, no.  Leg pain…  well, his surgical hip is always a bit sore, but…  no, nothing different there.  Dizzy…  yes, he said he felt dizzy just before the chest pain started.  And he looks…  pale.  Really pale.\n\n[09:17] Dispatch:  Dizziness, pale, chest pain like an elephant, difficulty breathing, sweating, recent hip surgery.  Noted.  Is he able to speak to me himself?  Or is he too short of breath?\n\n[09:18] Caller:  He can try…  John, honey, can you talk to her?  Just a second…  (Sound of muffled voice, caller speaking to someone else)  Here, he's going to try.\n\n[09:18] Patient (Voice, male, strained, gasping between words):  … Chest…  hurts…  bad…  …  Can't…  breathe…  …  So…  dizzy…\n\n[09:18] Dispatch:  Mr. Miller, can you hear me clearly?  Try to stay as calm as possible.  Help is on the way.  On a scale of one to ten, with ten being the worst pain imaginable, how bad is your chest pain right now?\n\n[09:19] Patient (Voice, male, still strained):  … Ten…  …  Ten out of ten…  …  Worst…  pain…  ever…\n\n[09:19] Dispatch:  Ten out of ten pain, confirmed.  And difficulty breathing.  Ambulance is en route, estimated time of arrival is approximately 5 minutes.  Do you know if he has any allergies to medications?  Or any other medical conditions besides the recent hip replacement?\n\n[09:20] Caller:  Allergies…  no, not that I know of.  Medical conditions…  high blood pressure, yes.  He takes pills for that.  And…  and they said his cholesterol was a bit high last time he saw the doctor.  But nothing else really.  Just the hip surgery last week.\n\n[09:20] Dispatch:  High blood pressure, high cholesterol, recent hip replacement.  No known allergies.  Noted.  Is he taking any pain medication for his hip right now?  Or any blood thinners after the surgery?\n\n[09:21] Caller:  Pain meds, yes.  Just…  just Tylenol, acetaminophen, for the hip pain.  And…  blood thinner…  yes!  They gave him a shot in the hospital, and pills to take home!  Warfarin, I think they called it.  He's supposed to take warfarin every day.  Yes, warfarin.\n\n[09:21] Dispatch:  Warfarin, confirmed.  Acetaminophen for pain.  Okay.  Please have him lie down in a comfortable position if he isn't already.  Try to keep him as still as possible.  And reassure him that help is coming very soon.  Do you hear sirens in the distance yet?\n\n[09:22] Caller:  Warfarin, yes.  He took it this morning, I think.  Lying down now…  on the sofa.  Sirens…  no, not yet.  But…  he's getting worse.  He's really struggling to breathe now.  And he's turning…  blueish, around his lips.  Oh god, this is terrifying.\n\n[09:22] Dispatch:  Blueish lips, cyanosis, confirmed.  This is serious.  Ambulance is still en route, they are doing their best to get there as quickly as possible.  Stay on the line with me.  I'm going to stay with you until they arrive.  Just keep talking to me.  Tell me if anything changes.\n\n[09:23] Caller:  Okay…  okay, I'm here.  He's…  he's just lying here, eyes closed, breathing really fast and shallow.  Making…  making a kind of…  gasping sound.  Like…  like he can't get enough air.  And still sweating.  So pale and sweaty.\n\n[09:23] Dispatch:  Gasping sounds, shallow breathing, still pale and sweaty.  Understood.  Keep talking to him, even if he doesn't respond.  Tell him the ambulance is coming.  Reassure him you are there and help is on the way.  Can you check if you can feel a pulse in his wrist?  If you know how to do that?\n\n[09:24] Caller:  Pulse…  yes, I can try.  Wait a second…  (Sound of caller moving closer to patient, silence for a few seconds)  …  Yes, I feel it…  but it's…  it's really fast.  And…  kind of weak, I think.  Hard to tell.  But definitely fast.\n\n[09:24] Dispatch:  Fast and weak pulse, noted.  That's important information.  Just stay with him.  Don't leave him alone.  The ambulance should be arriving very soon now.  Can you hear sirens yet?  Listen carefully.\n\n[09:25] Caller:  Sirens…  yes!  Yes, I hear them!  Getting louder!  Oh, thank goodness!  They're here!  I see flashing lights outside!  They're here!\n\n[09:25] Dispatch:  Okay, sirens heard, ambulance arriving on scene at 22 Willow Creek Drive.  I am disconnecting now as paramedics are arriving to take over patient care.  Please open the door for them immediately and guide them to your husband.  Stay calm and cooperate with the emergency responders.\n\n[09:25] Caller:  Okay, yes, will do!  Thank you!  Thank you so much!  (Line disconnects)\n\n[09:26] (Radio static, sounds of ambulance sirens stopping abruptly, vehicle doors opening, hurried footsteps, voices becoming clearer)\n\n[09:26] Paramedic 1 (Voice, male, English, professional, slightly raised voice): Ambulance on scene! 22 Willow Creek Drive! Dispatch report of 68-year-old male, chest pain, shortness of breath, post-hip replacement, possible pulmonary embolism.\n\n[09:26] Paramedic 2 (Voice, female, English, professional, calm):  Got it. Jump bag, oxygen, cardiac monitor. Let's move!  (Sound of hurried footsteps approaching house)\n\n[09:27] Paramedic 1 (Knocking loudly on door):  Paramedics! Emergency medical services!  (Door opens, sound of a woman breathing heavily)\n\n[09:27] Caller (Voice, female, relieved, slightly breathless):  Thank god you're here!  He's in the living room, on the sofa!  Hurry, please!\n\n[09:27] Paramedic 2 (Entering house, voice clearer, professional and reassuring):  Hello ma'am, we're paramedics.  Show us to your husband.  (Sound of moving quickly into the house)\n\n[09:28] Paramedic 1 (Following Paramedic 2, assessing scene):  Patient in living room, lying on sofa, appears conscious but in significant distress.  Severe respiratory distress evident.  Pale and diaphoretic.  Let's assess immediately.  (To patient, voice calm and direct)  Sir, I'm a paramedic. Can you hear me?\n\n[09:28] Patient (Voice, male, strained, weak):  …  Yes…  …  Chest…  pain…  …  Can't…  breathe…\n\n[09:28] Paramedic 2 (Moving to patient's side, starting assessment):  Okay sir, we're here to help you breathe.  I'm going to listen to your chest, okay?  (Sound of stethoscope being unpacked and applied to patient's chest)  Ma'am, you said recent hip replacement?  How recent?  And is he taking any blood thinners?\n\n[09:29] Caller (Voice, female, anxious):  Hip replacement last week, exactly one week ago today.  And yes, warfarin!  He's taking warfarin!  They gave it to him at the hospital to prevent clots.\n\n[09:29] Paramedic 1 (Assessing patient's airway and breathing):  Airway patent.  Breathing rapid and shallow.  Significant tachypnea and accessory muscle use.  Auscultation – breath sounds present bilaterally, but diminished, especially in the bases.  No wheezing, but some faint crackles.  Oxygen saturation…  (Attaching pulse oximeter to patient's finger, sound of gentle beeping)  …  Oxygen saturation is 85% on room air.  Very low.  Cyanosis present, perioral and nail beds.\n\n[09:30] Paramedic 2 (Continuing assessment, taking vital signs):  Blood pressure…  (Inflating blood pressure cuff, sound of soft whooshing)  Blood pressure is 90 over 50 mmHg.  Hypotensive.  Pulse is rapid and weak, approximately 140 beats per minute, regular rhythm.  Skin is cold, clammy, and pale.  Pupils are equal and reactive to light.  Patient is alert but very anxious and in severe respiratory distress.  ECG monitor on!  Get a 4-lead ECG running.\n\n[09:30] Paramedic 1:  Suspect pulmonary embolism, high probability given history and presentation.  Severe respiratory distress and hypotension.  We need to act fast.  Start high-flow oxygen immediately via non-rebreather mask.  15 liters per minute.  Get the oxygen tank and mask ready.  And establish IV access.  Jump bag, IV start kit, and normal saline.  Cardiac monitor is on?  Let's get a rhythm strip.\n\n[09:31] Paramedic 2 (Preparing oxygen, IV equipment, and ECG):  Oxygen tank and non-rebreather mask ready.  Setting oxygen flow to 15 liters per minute.  Applying mask now.  (Sound of oxygen hissing softly, mask being placed on patient's face)  IV start kit open.  Saline solution ready.  Cardiac monitor on, 4-lead ECG attached.  Starting rhythm strip…  (Sound of ECG monitor printing briefly)  Rhythm is sinus tachycardia, rate of 140.  No ST elevations or acute ischemic changes noted on initial rhythm strip.\n\n[09:32] Paramedic 1 (Monitoring patient's breathing and oxygen saturation):  Oxygen on, 15 liters per minute non-rebreather.  Monitoring oxygen saturation…  (Pulse oximeter beeping continues)  Oxygen saturation is slowly rising…  now 88%, 89%…  Still hypoxic, but improving slightly.  Respiratory rate remains rapid and shallow.  Patient still in severe distress.  We need IV access and fluid bolus to address hypotension.  And pain management.  Severe chest pain is contributing to his distress.  Do we have fentanyl?\n\n[09:32] Paramedic 2 (Establishing IV access, preparing medications):  IV start kit open.  Finding a vein…  veins are a bit collapsed due to hypotension and possible dehydration.  Trying the right antecubital fossa…  Got a vein.  Preparing site with alcohol swab.  Inserting 18 gauge catheter.  (Sound of needle insertion, soft groan from patient)  IV access established.  Flushing with saline.  Good flashback, IV line patent.  Securing the IV catheter.  Fentanyl is in the drug box.  Drawing up fentanyl 50 mcg IV.  Fentanyl 50 mcg IV prepared.\n\n[09:33] Paramedic 1 (Re-assessing patient and confirming medication orders):  Patient's condition remains critical.  Respiratory distress severe, tachypnea, cyanosis.  Oxygen saturation still below 90%.  Hypotension persistent.  Chest pain 10/10.  No contraindications to fentanyl noted, no known allergies.  Administer fentanyl 50 mcg IV slow push for pain relief.  And start a normal saline bolus, 500 ml, wide open to address hypotension.\n\n[09:34] Paramedic 2 (Administering fentanyl and starting fluid bolus):  Administering fentanyl 50 mcg IV push slowly over 1 minute.  Pushing now…  fentanyl administered.  Flushing IV line with 10ml saline.  Flush complete.  Connecting normal saline bolus, 500 ml bag, setting IV to run wide open.  Fluid bolus infusing rapidly.\n\n[09:35] Paramedic 1 (Monitoring patient closely after fentanyl and fluid administration):  Monitoring patient response to fentanyl and fluids.  Observing for changes in pain level, breathing, and vital signs.  Re-checking oxygen saturation…  (Pulse oximeter beeping)  Oxygen saturation is now 92%, 93%…  Improving further.  Respiratory rate still rapid but maybe slightly less shallow.  Patient still appears anxious but possibly slightly less distressed.  Blood pressure…  re-checking blood pressure.\n\n[09:36] Paramedic 2 (Re-checking blood pressure and pulse):  Re-checking blood pressure…  Blood pressure is now 98 over 60 mmHg.  Slightly improved, but still hypotensive.  Pulse is still rapid, around 130 beats per minute, but maybe a bit stronger.  Skin still pale and clammy, but color might be slightly better.  Patient still complaining of significant chest pain, but maybe slightly less intense than before fentanyl.  Patient is still in respiratory distress, but maybe slightly less severe.\n\n[09:37] Paramedic 1:  Some improvement after fentanyl and fluid bolus, but still critically ill.  We need to expedite transport to the hospital.  Consider another fluid bolus, 500 ml normal saline, to further address hypotension.  And prepare for rapid transport.  Stretcher ready?  Let's call dispatch for hospital notification and ETA to the nearest hospital with a cardiac catheterization lab and ICU.  Possible STEMI or massive PE, needs urgent intervention.\n\n[09:38] Paramedic 2 (Preparing second fluid bolus and stretcher, radio communication):  Preparing second 500 ml normal saline bolus.  Ready to administer.  Stretcher is ready and in position.  Radio to dispatch…  Ambulance 1 to Dispatch, urgent update on patient at 22 Willow Creek Drive. 68-year-old male, severe chest pain, shortness of breath, post-hip replacement, suspect massive pulmonary embolism or STEMI.  Patient treated with oxygen, IV access, fentanyl 50 mcg IV, and 500 ml normal saline bolus.  Current vitals: BP 98/60, HR 130, SpO2 93% on 15L O2.  Requesting hospital notification, nearest hospital with cardiac cath lab and ICU, and ETA to hospital.  Transporting code 3.\n\n[09:39] Dispatch (Radio):  Received Ambulance 1. Patient update noted.  Nearest hospital with cardiac cath lab and ICU is City General Hospital.  ETA to City General is approximately 10 minutes with lights and sirens.  City General Hospital Emergency Department and Cardiac Catheterization Lab notified and prepared for critical patient arrival, possible STEMI/PE.  Transport code 3 authorized.  Advise of any changes in patient condition.\n\n[09:39] Paramedic 2 (Radio):  Copy that Dispatch.  10 minutes to City General, cath lab and ICU notified.  Will advise of any changes.  Ambulance 1, out.  (To Paramedic 1)  10 minutes to City General, cath lab and ICU are ready.  Dispatch is asking for updates.\n\n[09:40] Paramedic 1 (Administering second fluid bolus and preparing for transport):  Okay, good.  Administer second 500 ml normal saline bolus now.  Wide open.  Let's get him onto the stretcher and into the ambulance.  We need to move.  Ma'am, we need to take your husband to the hospital immediately.  He's very sick, and needs urgent treatment.  We suspect a serious problem with his heart or lungs.\n\n[09:40] Caller (Voice, female, tearful, but calmer):  Yes, yes, hospital.  Please, hurry.  Will he be okay?  What's wrong with him?\n\n[09:41] Paramedic 2 (Reassuring caller while preparing to move patient):  We're doing everything we can for him.  We're taking him to a very good hospital that's ready for him.  It sounds like it could be a serious problem, but they have the specialists and equipment to help him there.  Let's carefully move him onto the stretcher now.  We need to be quick but gentle.  Second fluid bolus infusing rapidly.\n\n[09:42] Paramedic 1 (Guiding transfer to stretcher):  Okay sir, we're going to help you move onto the stretcher now.  Try to relax and stay as still as possible.  We're going to take good care of you.  On the count of three, we lift and move.  One, two, three.  (Sounds of careful lifting and movement, patient groaning softly)  Gently onto the stretcher.  Good.  Securing straps now.\n\n[09:43] Paramedic 2 (Securing patient on stretcher and preparing for transport):  Patient secured on stretcher.  Oxygen mask in place and secure.  IV line checked and secured.  Cardiac monitor still attached and functioning.  Ready for transport.  Let's move to the ambulance.  Ma'am, do you want to ride in the ambulance with us?\n\n[09:43] Caller (Voice, female, relieved):  Oh yes, please!  I want to go with him.\n\n[09:43] Paramedic 1 (Moving stretcher towards ambulance):  Okay, come with us.  Let's go.  (Sound of stretcher wheels rolling on floor, moving towards exit)  Paramedic 2, can you call dispatch again and give them another patient update, and confirm ICU bed availability at City General?\n\n[09:44] Paramedic 2 (On radio, while moving stretcher):  Ambulance 1 to Dispatch, update on patient en route to City General.  68-year-old male, possible massive PE or STEMI.  Treated with oxygen, IV access, fentanyl 50 mcg IV, and total 1 liter normal saline bolus.  Current vitals: BP approximately 100/65 mmHg, heart rate around 125 bpm, SpO2 94% on 15L O2.  Requesting confirmation of ICU bed availability at City General upon arrival.  ETA remains approximately 8 minutes.  Transporting code 3.\n\n[09:45] Dispatch (Radio):  Received Ambulance 1.  Patient update noted.  ICU bed confirmed and reserved at City General Hospital.  Emergency Department and ICU teams standing by for your arrival.  Continue transport code 3.  Advise of any critical changes in patient condition.\n\n[09:45] Paramedic 2 (Radio):  Copy that Dispatch.  ICU bed confirmed at City General.  Will advise of any changes.  Ambulance 1, out.  (To Paramedic 1)  ICU bed is confirmed and waiting.  They are ready for us.\n\n[09:46] Paramedic 1 (Loading stretcher into ambulance, sounds of ambulance doors opening and closing):  Okay, loading patient into ambulance now.  Careful with the head.  (Sounds of stretcher being rolled into ambulance and secured)  Patient loaded and secured in ambulance.  Ma'am, please sit in the passenger seat.  Paramedic 2, jump in the back with the patient.  Let's go! Transporting code 3 to City General Hospital.\n\n[09:47] (Ambulance doors closing, sounds become slightly muffled, engine starting, sirens starting, becoming louder as ambulance speeds away)\n\n[09:47] Paramedic 2 (Inside ambulance, re-assessing patient and monitoring equipment):  Re-assessing patient en route.  Oxygen saturation remains stable around 94-95% on high-flow oxygen.  Respiratory rate still elevated, but less labored.  Patient's color slightly improved, less cyanotic.  Blood pressure…  Blood pressure is now 105 over 70 mmHg.  Heart rate around 120 bpm.  Patient still complaining of chest pain, but says it's maybe a little bit less intense now.  How's the pain now, sir, on a scale of 1 to 10?\n\n[09:48] Patient (Voice, male, weaker but slightly clearer):  …  Maybe…  …  Seven…  …  Still…  hurts…  bad…  but…  maybe…  less…\n\n[09:48] Paramedic 2:  Okay, 7 out of 10 pain.  That's some improvement.  We're almost at the hospital now.  Just a few more minutes.  We're monitoring you closely.  Mrs. Miller, how are you doing?\n\n[09:49] Caller (Voice, female, quieter, still anxious):  I'm…  I'm just praying he'll be okay.  Thank you for everything you're doing.\n\n[09:49] Paramedic 1 (Driving ambulance, radio communication):  Ambulance 1 to City General Hospital Emergency Department.  ETA approximately 5 minutes.  68-year-old male, possible massive PE or STEMI.  Treated pre-hospitally with oxygen, fentanyl 50 mcg IV, and 1 liter normal saline bolus.  Patient condition slightly improved, pain level reduced to 7/10, vital signs stable but still critical: BP 105/70, HR 120, SpO2 95% on 15L O2.  Will be arriving code 3 in approximately 5 minutes.  Confirming direct transport to resuscitation bay and cardiac cath lab team activation.\n\n[09:50] Hospital Dispatch (Radio, male voice, English, clear, hospital tone):  Received Ambulance 1.  Patient report updated.  Direct transport to resuscitation bay 1 confirmed.  Cardiac catheterization lab team activated and standing by.  Emergency physician, cardiology fellow, and ICU team awaiting your arrival.  Proceed directly to resuscitation bay 1 upon arrival.  Advise upon arrival at hospital.\n\n[09:50] Paramedic 1 (Radio):  Copy that City General.  Proceeding to resuscitation bay 1.  Will advise upon arrival.  Ambulance 1, out.  (To Paramedic 2)  5 minutes to hospital.  Resuscitation bay 1, cath lab team activated, ICU ready.  They're expecting us to go straight to resuscitation bay 1.\n\n[09:51] Paramedic 2 (Monitoring patient, continuing care):  Patient remains stable.  Vital signs unchanged.  Breath sounds still diminished but no new findings.  ECG monitor still showing sinus tachycardia, no acute ST changes.  Continue to monitor closely.  We're almost there, Mr. Miller.  Just a little bit longer.\n\n[09:54] (Sounds of ambulance sirens becoming louder, then slowing down, brakes engaging, ambulance coming to a stop)\n\n[09:54] Paramedic 1:  Arrived at City General Hospital Emergency Department.  Resuscitation bay 1.  (Ambulance doors opening, sounds of hospital environment becoming clearer)  Clear path to resuscitation bay 1!  Ambulance arriving with critical cardiac/pulmonary patient! Possible massive PE or STEMI!\n\n[09:55] Hospital Staff 1 (Voice, male, English, hospital staff, taking charge):  Resuscitation bay 1 is clear!  Cardiac team is here!  Bring him in!  Stretcher coming through!  ICU bed is ready!\n\n[09:55] Paramedic 2 (Moving stretcher out of ambulance):  Moving patient to resuscitation bay 1.  68-year-old male, possible massive PE or STEMI, pre-hospital treatment given.  (Sound of stretcher wheels rolling rapidly on hospital floor)\n\n[09:56] Paramedic 1 (Giving verbal handover report, slightly louder):  Handover report for 68-year-old male, John Miller, severe chest pain and shortness of breath, sudden onset, post-hip replacement one week ago, suspect massive pulmonary embolism or STEMI.  Pre-hospital treatment: Oxygen 15L NRB, IV access, fentanyl 50 mcg IV, 1 liter normal saline bolus.  Current vital signs: BP 105/70 mmHg, heart rate 120 bpm, SpO2 95% on 15L oxygen.  Patient pain level 7/10.  Taking warfarin post-op.  Patient is alert and oriented, answers questions appropriately.  Wife is present and can provide further history.\n\n[09:57] Hospital Staff 2 (Voice, female, English, hospital nurse, acknowledging report):  Possible massive PE/STEMI, 68-year-old male, report received and understood.  Vital signs noted.  Thank you paramedics.  We will take over patient care immediately.  Please transfer patient to hospital bed and connect to hospital monitor.  Cardiac cath lab team is scrubbed and ready if needed.  ICU bed is prepped.\n\n[09:57] Paramedic 2 (Transferring patient to hospital bed):  Transferring patient to hospital bed now.  One, two, three.  (Sound of patient being moved from stretcher to hospital bed)  Patient transferred.  IV line and oxygen mask remain in place.  Connecting to hospital monitor now.  (Sound of monitor cables being connected, hospital monitor beeping)\n\n[09:58] Hospital Staff 3 (Voice, male, English, hospital physician, examining patient, authoritative):  Okay, I'm Dr. Ramirez, the emergency physician.  Let's assess the patient urgently.  Thank you paramedics for the rapid response and excellent handover.  We will take it from here.  Get ready for immediate cardiac workup and possible cath lab.  Stat ABG, chest X-ray, and 12-lead EKG.\n\n[09:58] Paramedic 1 (To Hospital Staff):  You're welcome, doctor.  We have completed our handover.  We will leave the patient in your care.  Here is our patient care report for documentation. (Sound of paper being handed over)\n\n[09:59] Hospital Staff 2 (Voice, female, English, hospital nurse):  Thank you paramedics.  We have everything we need.  You are free to return to service.  ICU team is here to escort to ICU after initial ED stabilization if needed.\n\n[09:59] Paramedic 2 (To Paramedic 1, quietly):  Okay, handover complete.  Looks like he's in good hands.  Let's gather our gear and head back to base.\n\n[09:59] Paramedic 1 (To Hospital Staff):  Thank you.  Good luck.  (To Paramedic 2)  Let's go.  (Sounds of paramedics gathering equipment, moving away from resuscitation bay, hospital sounds fading slightly)\n\n[10:00] Dispatch (Radio, final communication):  Ambulance 1, City General Hospital confirming patient handover complete at Emergency Department Resuscitation Bay 1.  Incident concluded.  Return to base when available.  Excellent work on scene and transport, Ambulance 1.  Rapid and efficient response.\n\n[10:00] Paramedic 1 (Radio, relieved voice):  Ambulance 1, received Hospital Dispatch.  Patient handover complete at City General ED.  Returning to base when available.  Thank you, Dispatch.  (To Paramedic 2, quietly)  Well, that was intense.  Hopefully, he'll be alright.  Let's get some air.\n\n[10:01] (Sound of ambulance doors closing, faint sound of sirens briefly as ambulance pulls away, then fades to silence. Radio static.)\n\n[10:02] (End of Transcript)"
         )
     },
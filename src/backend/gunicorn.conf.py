@@ -0,0 +1,38 @@
+"""
+Production server settings: gunicorn supervising uvicorn worker processes.
+
+Run from src/backend with:
+    gunicorn -c gunicorn.conf.py main:app
+
+Every worker is a full copy of the app, with its own MongoDB and vLLM connection
+pools, job workers and response caches. Metrics of all workers are aggregated
+through PROMETHEUS_MULTIPROC_DIR.
+"""
+import multiprocessing
+import os
+import shutil
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+# The app is async, so one worker per core keeps every core busy without oversubscribing
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+# Workers are restarted if their event loop stops heartbeating for this long
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+# Time given to in-flight requests and job workers on shutdown
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+accesslog = "-"
+
+
+def on_starting(server):
+    # Samples left by a previous run would be summed into the new one
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, ReturnDocument
+from database import db
+from summary_store import update_summary_document
+import os
+
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "5"))
+
+
+async def ensure_job_indexes():
+    """Creates the indexes backing job claims."""
+    await db.jobs.create_indexes([
+        IndexModel([("status", ASCENDING), ("run_at", ASCENDING)]),
+        IndexModel([("status", ASCENDING), ("lease_expires_at", ASCENDING)]),
+    ])
+
+
+async def _set_summary_job_status(job: dict, summary_update: dict | None = None):
+    """Mirrors a job's status onto the summary it processes, so it shows up on the dashboard, along with any summary_update fields."""
+    if job.get("summary_id") is None:
+        return
+    await update_summary_document(job["summary_id"], {**(summary_update or {}), "job": {
+        "id": str(job["_id"]),
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "last_error": job.get("last_error"),
+    }})
+
+
+async def enqueue_job(job_type: str, payload: dict, summary_id: str | None = None, max_attempts: int = JOB_MAX_ATTEMPTS,
+                      summary_update: dict | None = None) -> str:
+    """
+    Adds a job to the queue.
+
+    Args:
+        job_type (str): The name of the handler to run the job with.
+        payload (dict): The arguments passed to the handler.
+        summary_id (str | None): The summary the job processes, whose "job" field tracks its status.
+        max_attempts (int): How many times the job is run before it is marked failed.
+        summary_update (dict | None): Fields to set on the summary in the same write as its job status.
+
+    Returns:
+        str: The id of the new job.
+    """
+    now = datetime.utcnow()
+    job = {
+        "type": job_type,
+        "payload": payload,
+        "summary_id": summary_id,
+        "status": "queued",
+        "attempts": 0,
+        "max_attempts": max_attempts,
+        "run_at": now,
+        "lease_expires_at": None,
+        "worker_id": None,
+        "last_error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    result = await db.jobs.insert_one(job)
+    await _set_summary_job_status(job, summary_update)
+    return str(result.inserted_id)
+
+
+async def read_job(job_id: str) -> dict | None:
+    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
+    if job:
+        job["_id"] = str(job["_id"])
+    return job
+
+
+async def claim_job(worker_id: str, lease_seconds: int = JOB_LEASE_SECONDS) -> dict | None:
+    """
+    Atomically claims the next due job, or a running job whose lease has expired.
+
+    Returns:
+        dict | None: The claimed job, or None if no job is due.
+    """
+    now = datetime.utcnow()
+    job = await db.jobs.find_one_and_update(
+        {"$or": [
+            {"status": "queued", "run_at": {"$lte": now}},
+            {"status": "running", "lease_expires_at": {"$lt": now}},
+        ]},
+        {
+            "$set": {"status": "running", "worker_id": worker_id, "lease_expires_at": now + timedelta(seconds=lease_seconds), "updated_at": now},
+            "$inc": {"attempts": 1},
+        },
+        sort=[("run_at", ASCENDING)],
+        return_document=ReturnDocument.AFTER,
+    )
+    if job is not None:
+        await _set_summary_job_status(job)
+    return job
+
+
+async def renew_lease(job: dict, lease_seconds: int = JOB_LEASE_SECONDS) -> bool:
+    """Extends the lease of a running job. Returns False if the worker no longer holds it."""
+    now = datetime.utcnow()
+    result = await db.jobs.update_one(
+        {"_id": job["_id"], "status": "running", "worker_id": job["worker_id"]},
+        {"$set": {"lease_expires_at": now + timedelta(seconds=lease_seconds), "updated_at": now}},
+    )
+    return result.matched_count == 1
+
+
+async def complete_job(job: dict):
+    job = await db.jobs.find_one_and_update(
+        {"_id": job["_id"], "worker_id": job["worker_id"]},
+        {"$set": {"status": "succeeded", "lease_expires_at": None, "updated_at": datetime.utcnow()}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if job is not None:
+        await _set_summary_job_status(job)
+
+
+async def fail_job(job: dict, error: str, retry_backoff: float = JOB_RETRY_BACKOFF):
+    """Requeues a failed job with exponential backoff, or marks it and its summary failed once its attempts are used up."""
+    now = datetime.utcnow()
+    summary_update = None
+    if job["attempts"] < job["max_attempts"]:
+        update = {"status": "queued", "run_at": now + timedelta(seconds=retry_backoff * 2 ** (job["attempts"] - 1))}
+    else:
+        update = {"status": "failed"}
+        summary_update = {"status": "failed"}
+    job = await db.jobs.find_one_and_update(
+        {"_id": job["_id"], "worker_id": job["worker_id"]},
+        {"$set": {**update, "last_error": error, "lease_expires_at": None, "updated_at": now}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if job is not None:
+        await _set_summary_job_status(job, summary_update)
@@ -0,0 +1,151 @@
+from contextlib import asynccontextmanager
+from datetime import datetime
+from llm.client import VLLM_MODEL_PATH
+from llm.scheduler import Priority
+from llm.transcription_prompt import prompt_llm_vllm_guided_json_with_transcription_segment
+from models import TranscriptionExtraction, TranscriptionSegmentRequest, TranscriptionTimelineEvent
+from metrics import PIPELINE_STAGE_DURATION
+from pipeline import parse_extraction, summary_base_date
+from summary_store import bulk_update_summary_document, read_summary_document
+from tracing import span
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# How much of the already extracted content is sent back with each segment; bounds the prompt of every update
+LIVE_STATE_MAX_MEDICAL_INFO = int(os.getenv("LIVE_STATE_MAX_MEDICAL_INFO", "10"))
+LIVE_STATE_MAX_EVENTS = int(os.getenv("LIVE_STATE_MAX_EVENTS", "5"))
+# How often a segment is re-extracted when another process updated the running state first
+LIVE_SEGMENT_MAX_CONFLICTS = int(os.getenv("LIVE_SEGMENT_MAX_CONFLICTS", "3"))
+
+
+class SegmentConflictError(Exception):
+    """Raised when a segment kept losing the race to update a summary's running state."""
+
+
+class SegmentOutOfOrderError(SegmentConflictError):
+    """Raised when a segment's sequence number does not follow the last segment applied to the summary."""
+
+
+# Per-summary locks, so segments of one call that reach this process are applied one at a time, in arrival order
+_locks: dict[str, list] = {}
+
+
+@asynccontextmanager
+async def summary_lock(summary_id: str):
+    entry = _locks.setdefault(summary_id, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _locks[summary_id]
+
+
+def merge_segment(state: dict, delta: TranscriptionExtraction) -> tuple[dict, list[str], list[TranscriptionTimelineEvent]]:
+    """
+    Merges the extraction of a segment into the running state.
+
+    Medical information and timeline events the model repeated from the state are dropped.
+
+    Returns:
+        tuple: (the new running state, the new medical information, the new timeline events
+               with their [MM:SS] offsets)
+    """
+    known_info = set(state.get("relevant_medical_info", []))
+    known_events = {(event["timestamp"], event["description"]) for event in state.get("timeline_events", [])}
+    new_info = [info for info in delta.relevant_medical_info if info not in known_info]
+    new_events = [event for event in delta.timeline_events if (event.timestamp, event.description) not in known_events]
+
+    new_state = {
+        "segments": state.get("segments", 0) + 1,
+        "concise_summary": delta.concise_summary or state.get("concise_summary", ""),
+        "relevant_medical_info": (state.get("relevant_medical_info", []) + new_info)[-LIVE_STATE_MAX_MEDICAL_INFO:],
+        "timeline_events": (state.get("timeline_events", []) + [event.model_dump() for event in new_events])[-LIVE_STATE_MAX_EVENTS:],
+    }
+    return new_state, new_info, new_events
+
+
+def build_segment_updates(summary: dict, new_state: dict, new_info: list[str], new_events: list[TranscriptionTimelineEvent], base_date: datetime) -> list[dict]:
+    """
+    Maps a merged segment onto the MongoDB updates of the summary, applied together.
+
+    New medical information and timeline events are pushed onto the stored arrays, so an
+    update writes only what the segment added. Fields that are not arrays yet (such as
+    the empty ambulance_notes of a new summary) are replaced instead.
+    """
+    events = [event.at(base_date).model_dump() for event in new_events]
+    updates = [{"$set": {"ai_summary": new_state["concise_summary"], "transcription_state": new_state}}]
+    for field, items in (("ambulance_notes", new_info), ("timeline_events", events)):
+        if not isinstance(summary.get(field), list):
+            updates.append({"$set": {field: items}})
+        elif items:
+            updates.append({"$push": {field: {"$each": items}}})
+    return updates
+
+
+async def process_transcription_segment(summary_id: str, request: TranscriptionSegmentRequest, endpoint_url: str | None = None,
+                                        model_path: str = VLLM_MODEL_PATH, priority: Priority = Priority.LIVE) -> dict | None:
+    """
+    Extracts the AI content of a new segment of a live call and merges it into the summary.
+
+    The model sees only the summary's bounded running state (transcription_state) and the
+    new segment, so the cost of an update follows the size of the segment rather than
+    the length of the call. The update is applied only if the running state is still the
+    one the segment was extracted against; if another process got there first, the
+    segment is extracted again against the new state. This keeps concurrent segments
+    from overwriting each other, but segments sent to different processes are applied
+    in whichever order they get there. Clients that need call order across processes
+    set request.sequence, and a segment is then only applied right after the previous one.
+
+    Returns:
+        dict | None: The updated summary, or None if it does not exist.
+
+    Raises:
+        ExtractionError: If the LLM returned no usable result.
+        SegmentConflictError: If the running state kept changing under the segment.
+        SegmentOutOfOrderError: If request.sequence does not follow the last segment applied.
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
+    async with summary_lock(summary_id):
+        for _ in range(LIVE_SEGMENT_MAX_CONFLICTS):
+            summary = await read_summary_document(summary_id)
+            if summary is None:
+                return None
+            state = summary.get("transcription_state") or {}
+            applied = state.get("segments", 0)
+            if request.sequence is not None and request.sequence != applied + 1:
+                raise SegmentOutOfOrderError(f"Summary {summary_id} expects segment {applied + 1}, got segment {request.sequence}")
+
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                with span("extract.transcription_segment", segment=state.get("segments", 0) + 1, chars=len(request.segment)):
+                    response = await prompt_llm_vllm_guided_json_with_transcription_segment(
+                        endpoint_url=endpoint_url,
+                        model_path=model_path,
+                        system_prompt=request.prompt,
+                        state=state,
+                        segment=request.segment,
+                        priority=priority
+                    )
+                    delta = await parse_extraction(response, TranscriptionExtraction)
+                outcome = "ok"
+            finally:
+                PIPELINE_STAGE_DURATION.labels("transcription_segment", outcome).observe(time.perf_counter() - start)
+            new_state, new_info, new_events = merge_segment(state, delta)
+            updates = build_segment_updates(summary, new_state, new_info, new_events, summary_base_date(summary))
+
+            # A missing transcription_state matches segments None, so the first segment is guarded too. With a
+            # sequence number, this also makes sure the segment is applied right after segment sequence - 1
+            updated_summary = await bulk_update_summary_document(summary_id, updates, condition={"transcription_state.segments": state.get("segments")})
+            if updated_summary is not None:
+                return updated_summary
+            logger.info(f"Summary {summary_id}: running state changed during segment {state.get('segments', 0) + 1}, extracting again")
+        raise SegmentConflictError(f"Running state of summary {summary_id} kept changing")
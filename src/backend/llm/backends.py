@@ -0,0 +1,197 @@
+from collections import deque
+import asyncio
+import logging
+import os
+import time
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Comma-separated vllm-openai base URLs; a single VLLM_ENDPOINT_URL is used when unset
+VLLM_BACKENDS = os.getenv("VLLM_BACKENDS", "")
+VLLM_HEALTH_INTERVAL = float(os.getenv("VLLM_HEALTH_INTERVAL", "5"))
+VLLM_HEALTH_TIMEOUT = float(os.getenv("VLLM_HEALTH_TIMEOUT", "2"))
+# Consecutive failures that open a backend's circuit breaker, and how long it stays open
+VLLM_BREAKER_FAILURES = int(os.getenv("VLLM_BREAKER_FAILURES", "3"))
+VLLM_BREAKER_COOLDOWN = float(os.getenv("VLLM_BREAKER_COOLDOWN", "30"))
+# A request still running after this quantile of recent latencies is hedged on a second backend (0 disables)
+VLLM_HEDGE_QUANTILE = float(os.getenv("VLLM_HEDGE_QUANTILE", "0.95"))
+VLLM_HEDGE_MIN_DELAY = float(os.getenv("VLLM_HEDGE_MIN_DELAY", "2"))
+VLLM_HEDGE_MIN_SAMPLES = int(os.getenv("VLLM_HEDGE_MIN_SAMPLES", "20"))
+
+
+class NoHealthyBackendError(Exception):
+    """Raised when every vLLM backend is unhealthy or has its circuit breaker open."""
+
+
+class Backend:
+    """
+    One vllm-openai server, with its health, load and circuit breaker state.
+
+    The breaker opens after failure_threshold consecutive failed requests (5xx or
+    connection errors). Once cooldown has passed it lets a single trial request
+    through (half-open); its success closes the breaker, its failure re-opens it.
+    begin() returns a token for that trial request, which is passed back to end().
+    """
+
+    def __init__(self, url: str, failure_threshold: int = VLLM_BREAKER_FAILURES, cooldown: float = VLLM_BREAKER_COOLDOWN):
+        self.url = url.rstrip("/")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.healthy = True
+        self.in_flight = 0
+        self.consecutive_failures = 0
+        self.opened_at: float | None = None
+        self.trial: object | None = None
+        self.latency_ewma: float | None = None
+        self.stats = {"requests": 0, "failures": 0, "breaker_opened": 0}
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    @property
+    def trial_in_flight(self) -> bool:
+        return self.trial is not None
+
+    def available(self) -> bool:
+        state = self.state
+        return self.healthy and (state == "closed" or (state == "half_open" and not self.trial_in_flight))
+
+    def begin(self) -> object | None:
+        """Counts a request as in flight. Returns its trial token if it is the half-open trial, None otherwise."""
+        self.in_flight += 1
+        self.stats["requests"] += 1
+        if self.state == "half_open" and self.trial is None:
+            self.trial = object()
+            return self.trial
+        return None
+
+    def end(self, trial: object | None = None):
+        self.in_flight -= 1
+        # A trial that ended without an outcome (e.g. a cancelled hedge) frees the half-open slot. Other requests,
+        # and a trial whose outcome already re-opened the breaker, leave the current trial alone
+        if trial is not None and trial is self.trial:
+            self.trial = None
+
+    def record_success(self, duration: float | None = None):
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial = None
+        if duration is not None:
+            self.latency_ewma = duration if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * duration
+
+    def record_failure(self):
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        if self.trial_in_flight or self.consecutive_failures >= self.failure_threshold:
+            if self.opened_at is None or self.trial_in_flight:
+                self.stats["breaker_opened"] += 1
+            self.opened_at = time.monotonic()
+            self.trial = None
+
+    def snapshot(self) -> dict:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "breaker": self.state,
+            "in_flight": self.in_flight,
+            "latency_ewma": self.latency_ewma and round(self.latency_ewma, 3),
+            **self.stats,
+        }
+
+
+class BackendPool:
+    """
+    Pool of vllm-openai servers behind the shared client.
+
+    A background task polls every backend's /health endpoint (like the compose
+    healthcheck). Requests are routed to the available backend with the fewest requests
+    in flight from this process, ties broken by recent failures and latency. Adding a replica to
+    VLLM_BACKENDS adds its capacity to the pool.
+    """
+
+    def __init__(self, urls: list[str], health_interval: float = VLLM_HEALTH_INTERVAL, health_timeout: float = VLLM_HEALTH_TIMEOUT,
+                 hedge_quantile: float = VLLM_HEDGE_QUANTILE, hedge_min_delay: float = VLLM_HEDGE_MIN_DELAY,
+                 hedge_min_samples: int = VLLM_HEDGE_MIN_SAMPLES):
+        self.backends = [Backend(url) for url in urls]
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_min_samples = hedge_min_samples
+        self.stats = {"hedged": 0, "hedge_wins": 0}
+        self._latencies = deque(maxlen=256)
+        self._health_task: asyncio.Task | None = None
+
+    @classmethod
+    def from_env(cls, default_url: str) -> "BackendPool":
+        urls = [url.strip() for url in VLLM_BACKENDS.split(",") if url.strip()]
+        return cls(urls or [default_url])
+
+    def start(self, client: httpx.AsyncClient):
+        """Starts polling the backends' health with the given client."""
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._poll_health(client))
+
+    async def stop(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+    def available(self) -> bool:
+        """Whether any backend can take a request."""
+        return any(backend.available() for backend in self.backends)
+
+    def acquire(self, exclude: set | None = None) -> Backend:
+        """
+        Picks the backend for the next request.
+
+        Backends in exclude (those a request already failed on) are only used when no
+        other backend is available.
+
+        Raises:
+            NoHealthyBackendError: If no backend is available.
+        """
+        available = [backend for backend in self.backends if backend.available()]
+        preferred = [backend for backend in available if not exclude or backend not in exclude]
+        candidates = preferred or available
+        if not candidates:
+            raise NoHealthyBackendError(f"No healthy vLLM backend among {len(self.backends)}")
+        return min(candidates, key=lambda backend: (backend.in_flight, backend.consecutive_failures, backend.latency_ewma or 0.0))
+
+    def record_latency(self, duration: float):
+        self._latencies.append(duration)
+
+    def hedge_delay(self) -> float | None:
+        """Returns how long to wait before hedging a request, or None if it should not be hedged."""
+        if self.hedge_quantile <= 0 or len(self.backends) < 2 or len(self._latencies) < self.hedge_min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return max(self.hedge_min_delay, ordered[min(len(ordered) - 1, int(len(ordered) * self.hedge_quantile))])
+
+    def snapshot(self) -> dict:
+        return {"backends": [backend.snapshot() for backend in self.backends], "hedge_delay": self.hedge_delay(), **self.stats}
+
+    async def _poll_health(self, client: httpx.AsyncClient):
+        while True:
+            await asyncio.gather(*(self._check(client, backend) for backend in self.backends))
+            await asyncio.sleep(self.health_interval)
+
+    async def _check(self, client: httpx.AsyncClient, backend: Backend):
+        try:
+            response = await client.get(backend.url + "/health", timeout=self.health_timeout)
+            healthy = response.status_code == 200
+        except httpx.HTTPError:
+            healthy = False
+        if healthy != backend.healthy:
+            logger.log(logging.INFO if healthy else logging.WARNING, f"vLLM backend {backend.url} is now {'healthy' if healthy else 'unhealthy'}")
+        backend.healthy = healthy
@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable
+from pymongo.errors import PyMongoError
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "256"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "3600"))
+LLM_CACHE_PERSIST = os.getenv("LLM_CACHE_PERSIST", "false").lower() == "true"
+LLM_CACHE_PERSIST_TTL = int(os.getenv("LLM_CACHE_PERSIST_TTL", "86400"))
+
+
+def payload_cache_key(payload: dict | bytes) -> str:
+    """
+    Hashes a chat completion payload (model, messages, guided_json schema, sampling parameters).
+
+    Pre-encoded payloads are hashed as they are; templates render the same request to the same bytes.
+    """
+    if isinstance(payload, bytes):
+        return hashlib.sha256(payload).hexdigest()
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed cache of deterministic LLM responses.
+
+    Responses are kept in an in-process LRU with size and TTL eviction, and optionally
+    in a MongoDB collection whose TTL index expires old entries. Concurrent requests
+    for the same key share a single call to the LLM.
+    """
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, ttl: float = LLM_CACHE_TTL, persist_ttl: int = LLM_CACHE_PERSIST_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.persist_ttl = persist_ttl
+        self.stats = {"hits": 0, "persistent_hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._collection = None
+
+    async def attach_collection(self, collection):
+        """Enables the persistent tier on the given collection, creating its TTL index."""
+        await collection.create_index("created_at", expireAfterSeconds=self.persist_ttl)
+        self._collection = collection
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[dict]]) -> dict:
+        """
+        Returns the cached response for key, calling compute on a miss.
+
+        Errors raised by compute are propagated to every waiting caller and are not cached.
+        If the caller running compute is cancelled, one of the waiting callers takes over.
+        """
+        while True:
+            cached = self._get_local(key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return copy.deepcopy(cached)
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            self.stats["coalesced"] += 1
+            try:
+                return copy.deepcopy(await asyncio.shield(inflight))
+            except asyncio.CancelledError:
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # Only the computing caller was cancelled: retry, the first waiter to get here computes
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the exception as retrieved when no other caller is waiting on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            response = await self._get_persistent(key)
+            if response is not None:
+                self.stats["persistent_hits"] += 1
+            else:
+                self.stats["misses"] += 1
+                response = await compute()
+                await self._set_persistent(key, response)
+            self._set_local(key, response)
+            future.set_result(response)
+            return copy.deepcopy(response)
+        except asyncio.CancelledError:
+            # Not passed on as the waiters' own error; they see the future cancelled and retry
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
+
+    def snapshot(self) -> dict:
+        """Returns the hit/miss counters and current size."""
+        return {**self.stats, "entries": len(self._entries), "inflight": len(self._inflight), "persistent": self._collection is not None}
+
+    def _get_local(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.stats["evictions"] += 1
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _set_local(self, key: str, response: dict):
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def _get_persistent(self, key: str) -> dict | None:
+        if self._collection is None:
+            return None
+        try:
+            document = await self._collection.find_one({"_id": key}, {"response": 1})
+        except PyMongoError as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            return None
+        return document["response"] if document else None
+
+    async def _set_persistent(self, key: str, response: dict):
+        if self._collection is None:
+            return
+        try:
+            await self._collection.replace_one({"_id": key}, {"_id": key, "response": response, "created_at": datetime.utcnow()}, upsert=True)
+        except PyMongoError as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+# Shared cache instance used by the vLLM client
+extraction_cache = ExtractionCache()
@@ -0,0 +1,343 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import AsyncIterator
+import httpx
+from llm.backends import Backend, BackendPool, NoHealthyBackendError
+from llm.cache import ExtractionCache, extraction_cache, payload_cache_key
+from llm.scheduler import LLM_SCHEDULER_INITIAL_WINDOW, LLMScheduler, Priority
+from metrics import (LLM_BACKEND_REQUESTS, LLM_HEDGED_REQUESTS, LLM_REQUEST_DURATION, LLM_SCHEDULER_IN_FLIGHT,
+                     LLM_SCHEDULER_QUEUED, LLM_SCHEDULER_WINDOW, LLM_TIME_TO_FIRST_TOKEN, record_llm_usage, set_gauge_function)
+from tracing import record_span, span
+
+logger = logging.getLogger(__name__)
+
+# Connection settings for the vllm-openai endpoint, overridable from the environment
+VLLM_ENDPOINT_URL = os.getenv("VLLM_ENDPOINT_URL", "http://89.169.97.156:1337")
+VLLM_MODEL_PATH = os.getenv("VLLM_MODEL_PATH", "/root/.cache/models--meta-llama--Llama-3.3-70B-Instruct/snapshots/6f6073b423013f6a7d4d9f39144961bfbfbc386b")
+VLLM_CONNECT_TIMEOUT = float(os.getenv("VLLM_CONNECT_TIMEOUT", "5"))
+VLLM_READ_TIMEOUT = float(os.getenv("VLLM_READ_TIMEOUT", "300"))
+VLLM_MAX_CONNECTIONS = int(os.getenv("VLLM_MAX_CONNECTIONS", "64"))
+VLLM_MAX_IN_FLIGHT = int(os.getenv("VLLM_MAX_IN_FLIGHT", "64"))
+VLLM_MAX_RETRIES = int(os.getenv("VLLM_MAX_RETRIES", "3"))
+VLLM_RETRY_BACKOFF = float(os.getenv("VLLM_RETRY_BACKOFF", "0.5"))
+# Keep-alive connections opened to each backend at startup, so the first requests skip the TCP handshake
+VLLM_WARMUP_CONNECTIONS = int(os.getenv("VLLM_WARMUP_CONNECTIONS", "4"))
+VLLM_WARMUP_TIMEOUT = float(os.getenv("VLLM_WARMUP_TIMEOUT", "10"))
+
+CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
+
+
+def _request_body(payload: dict | bytes) -> dict:
+    if isinstance(payload, bytes):
+        return {"content": payload, "headers": {"Content-Type": "application/json"}}
+    return {"json": payload}
+
+
+class VLLMClient:
+    """
+    Shared async client for the vllm-openai chat completions API.
+
+    Holds a single pooled keep-alive httpx.AsyncClient for the lifetime of the app,
+    admits requests through a priority scheduler whose in-flight window is capped at
+    max_in_flight per backend, and retries 5xx responses and connection errors with
+    exponential backoff. Deterministic (temperature 0) requests are served from the
+    extraction cache when possible.
+
+    Requests without an explicit endpoint_url are routed through the backend pool: each
+    attempt goes to the least-loaded healthy backend, retries move to another backend,
+    and a non-streamed request still running after the pool's hedge delay is raced
+    against a copy sent to a second backend.
+    """
+
+    def __init__(self, connect_timeout: float = VLLM_CONNECT_TIMEOUT, read_timeout: float = VLLM_READ_TIMEOUT,
+                 max_connections: int = VLLM_MAX_CONNECTIONS, max_in_flight: int = VLLM_MAX_IN_FLIGHT,
+                 max_retries: int = VLLM_MAX_RETRIES, retry_backoff: float = VLLM_RETRY_BACKOFF,
+                 cache: ExtractionCache | None = extraction_cache, pool: BackendPool | None = None):
+        self.pool = pool or BackendPool.from_env(VLLM_ENDPOINT_URL)
+        backends = len(self.pool.backends)
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(max_connections=max_connections * backends, max_keepalive_connections=max_connections * backends)
+        self.scheduler = LLMScheduler(max_window=max_in_flight * backends, initial_window=LLM_SCHEDULER_INITIAL_WINDOW * backends)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.cache = cache
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self):
+        """Opens the connection pool and starts the backend health checks. Called once at app startup."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+            self.pool.start(self._client)
+
+    async def close(self):
+        """Stops the health checks and closes the connection pool. Called once at app shutdown."""
+        if self._client is not None:
+            await self.pool.stop()
+            await self._client.aclose()
+            self._client = None
+
+    async def warmup(self, connections: int = VLLM_WARMUP_CONNECTIONS, timeout: float = VLLM_WARMUP_TIMEOUT) -> bool:
+        """
+        Opens keep-alive connections to every backend and checks that each serves the model.
+
+        Backends that do not answer are marked unhealthy until the health checks see them up.
+
+        Returns:
+            bool: Whether at least one backend is ready to take requests.
+        """
+        await self.start()
+
+        async def warm(backend: Backend) -> bool:
+            try:
+                responses = await asyncio.gather(*(self._client.get(backend.url + "/v1/models", timeout=timeout) for _ in range(connections)))
+                backend.healthy = all(response.status_code == 200 for response in responses)
+            except httpx.HTTPError as e:
+                logger.warning(f"Warmup of vLLM backend {backend.url} failed: {e}")
+                backend.healthy = False
+            return backend.healthy
+
+        return any(await asyncio.gather(*(warm(backend) for backend in self.pool.backends)))
+
+    async def chat_completion(self, endpoint_url: str | None, payload: dict | bytes, use_cache: bool = True, priority: Priority = Priority.REPROCESS) -> dict:
+        """
+        Sends a chat completion request and returns the decoded JSON response.
+
+        Args:
+            endpoint_url (str | None): The URL of a vllm-openai endpoint, or None to route
+                the request through the backend pool.
+            payload (dict | bytes): The request body for /v1/chat/completions, or its encoding
+                rendered by a GuidedJSONTemplate (always temperature 0).
+            use_cache (bool): Whether a deterministic request may be answered from the cache.
+            priority (Priority): The scheduling class of the request.
+
+        Returns:
+            dict: The decoded JSON response.
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries.
+            QueueFullError: If the scheduler's admission queue is full.
+            NoHealthyBackendError: If no backend of the pool is available.
+        """
+        deterministic = isinstance(payload, bytes) or payload.get("temperature") == 0
+        if use_cache and self.cache is not None and deterministic:
+            return await self.cache.get_or_compute(payload_cache_key(payload), lambda: self._post(endpoint_url, payload, priority))
+        return await self._post(endpoint_url, payload, priority)
+
+    async def _post(self, endpoint_url: str | None, payload: dict | bytes, priority: Priority) -> dict:
+        # Lazily open the pool for callers outside the app lifecycle (scripts, tests)
+        if self._client is None:
+            await self.start()
+
+        label = priority.name.lower()
+        outcome = "error"
+        with span("llm.request", priority=label, stream=False) as trace_span:
+            async with self.scheduler.slot(priority) as queue_wait:
+                start = time.perf_counter()
+                try:
+                    result = await self._send(endpoint_url, payload)
+                    outcome = "ok"
+                finally:
+                    LLM_REQUEST_DURATION.labels(label, "complete", outcome).observe(time.perf_counter() - start)
+            record_llm_usage(label, result.get("usage"))
+            if trace_span is not None:
+                trace_span.set(queue_wait=round(queue_wait, 4), **(result.get("usage") or {}))
+            return result
+
+    async def _send(self, endpoint_url: str | None, payload: dict | bytes) -> dict:
+        tried: set[Backend] = set()
+        for attempt in range(self.max_retries + 1):
+            try:
+                if endpoint_url is None:
+                    response = await self._hedged_post(payload, tried)
+                else:
+                    response = await self._client.post(endpoint_url + CHAT_COMPLETIONS_PATH, **_request_body(payload))
+                if response.status_code >= 500:
+                    self.scheduler.record_overload()
+                if response.status_code < 500 or attempt == self.max_retries:
+                    response.raise_for_status()
+                    return response.json()
+                logger.warning(f"vllm-openai returned {response.status_code}, retrying (attempt {attempt + 1}/{self.max_retries})")
+            except httpx.TransportError as e:
+                self.scheduler.record_overload()
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"Connection error to vllm-openai: {e}, retrying (attempt {attempt + 1}/{self.max_retries})")
+            if not self._can_fail_over(endpoint_url, tried):
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+
+    def _can_fail_over(self, endpoint_url: str | None, tried: set[Backend]) -> bool:
+        # A retry on a backend not tried yet needs no backoff: the failure was not its own
+        return endpoint_url is None and any(backend.available() and backend not in tried for backend in self.pool.backends)
+
+    async def _hedged_post(self, payload: dict | bytes, tried: set[Backend]) -> httpx.Response:
+        primary = self.pool.acquire(exclude=tried)
+        attempts = {asyncio.create_task(self._post_to(primary, payload, tried)): primary}
+        delay = self.pool.hedge_delay()
+        if delay is not None:
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                try:
+                    secondary = self.pool.acquire(exclude=tried)
+                except NoHealthyBackendError:
+                    secondary = None
+                if secondary is not None and secondary is not primary:
+                    self.pool.stats["hedged"] += 1
+                    attempts[asyncio.create_task(self._post_to(secondary, payload, tried))] = secondary
+
+        pending = set(attempts)
+        try:
+            failed = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().status_code < 500:
+                        if len(attempts) > 1:
+                            winner = "primary" if attempts[task] is primary else "hedge"
+                            if winner == "hedge":
+                                self.pool.stats["hedge_wins"] += 1
+                            LLM_HEDGED_REQUESTS.labels(winner).inc()
+                        return task.result()
+                    failed = task
+            # Every attempt failed: surface the last failure to the retry loop
+            return failed.result()
+        finally:
+            # The losing attempt is cancelled, which closes its connection and frees its vLLM sequence
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _post_to(self, backend: Backend, payload: dict | bytes, tried: set[Backend]) -> httpx.Response:
+        tried.add(backend)
+        trial = backend.begin()
+        start = time.perf_counter()
+        try:
+            response = await self._client.post(backend.url + CHAT_COMPLETIONS_PATH, **_request_body(payload))
+            if response.status_code >= 500:
+                backend.record_failure()
+                LLM_BACKEND_REQUESTS.labels(backend.url, "error").inc()
+            else:
+                duration = time.perf_counter() - start
+                backend.record_success(duration)
+                self.pool.record_latency(duration)
+                LLM_BACKEND_REQUESTS.labels(backend.url, "ok").inc()
+            return response
+        except httpx.TransportError:
+            backend.record_failure()
+            LLM_BACKEND_REQUESTS.labels(backend.url, "error").inc()
+            raise
+        finally:
+            backend.end(trial)
+
+    async def stream_chat_completion(self, endpoint_url: str | None, payload: dict | bytes, priority: Priority = Priority.REPROCESS) -> AsyncIterator[str]:
+        """
+        Sends a streaming chat completion request and yields the content deltas as they arrive.
+
+        Connection errors and 5xx responses are retried as in chat_completion, on another
+        backend of the pool when there is one, but only before the first delta has been
+        yielded. Streamed requests bypass the cache and are never hedged.
+
+        Args:
+            endpoint_url (str | None): The URL of a vllm-openai endpoint, or None to route
+                the request through the backend pool.
+            payload (dict | bytes): The request body for /v1/chat/completions without "stream",
+                or its encoding rendered by a GuidedJSONTemplate with stream=True.
+            priority (Priority): The scheduling class of the request.
+
+        Yields:
+            str: The next piece of generated content.
+        """
+        if self._client is None:
+            await self.start()
+
+        if isinstance(payload, dict):
+            payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+        label = priority.name.lower()
+        outcome = "error"
+        usage = {}
+        # The span is recorded when the stream ends rather than opened around it: a context
+        # variable set inside an async generator would leak into the consumer between yields
+        async with self.scheduler.slot(priority) as queue_wait:
+            start = time.perf_counter()
+            first_token = None
+            try:
+                async for content in self._send_stream(endpoint_url, payload, usage):
+                    if first_token is None:
+                        first_token = time.perf_counter() - start
+                        LLM_TIME_TO_FIRST_TOKEN.labels(label).observe(first_token)
+                    yield content
+                outcome = "ok"
+            finally:
+                duration = time.perf_counter() - start
+                LLM_REQUEST_DURATION.labels(label, "stream", outcome).observe(duration)
+                record_llm_usage(label, usage)
+                record_span("llm.request", queue_wait + duration, priority=label, stream=True, outcome=outcome, queue_wait=round(queue_wait, 4),
+                            time_to_first_token=first_token and round(first_token, 4), **usage)
+
+    async def _send_stream(self, endpoint_url: str | None, payload: dict | bytes, usage: dict) -> AsyncIterator[str]:
+        started = False
+        tried: set[Backend] = set()
+        for attempt in range(self.max_retries + 1):
+            backend = trial = None
+            if endpoint_url is None:
+                backend = self.pool.acquire(exclude=tried)
+                tried.add(backend)
+                trial = backend.begin()
+            try:
+                api_endpoint = (backend.url if backend is not None else endpoint_url) + CHAT_COMPLETIONS_PATH
+                async with self._client.stream("POST", api_endpoint, **_request_body(payload)) as response:
+                    if response.status_code >= 500:
+                        self.scheduler.record_overload()
+                        self._record_backend_failure(backend)
+                    if response.status_code >= 500 and attempt < self.max_retries:
+                        logger.warning(f"vllm-openai returned {response.status_code}, retrying (attempt {attempt + 1}/{self.max_retries})")
+                    else:
+                        if response.is_error:
+                            await response.aread()
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            chunk = json.loads(data)
+                            # With include_usage, the last chunk carries the token counts
+                            usage.update(chunk.get("usage") or {})
+                            choices = chunk.get("choices")
+                            content = choices[0].get("delta", {}).get("content") if choices else None
+                            if content:
+                                started = True
+                                yield content
+                        if backend is not None:
+                            backend.record_success()
+                            LLM_BACKEND_REQUESTS.labels(backend.url, "ok").inc()
+                        return
+            except httpx.TransportError as e:
+                self.scheduler.record_overload()
+                self._record_backend_failure(backend)
+                if started or attempt == self.max_retries:
+                    raise
+                logger.warning(f"Connection error to vllm-openai: {e}, retrying (attempt {attempt + 1}/{self.max_retries})")
+            finally:
+                if backend is not None:
+                    backend.end(trial)
+            if not self._can_fail_over(endpoint_url, tried):
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+
+    @staticmethod
+    def _record_backend_failure(backend: Backend | None):
+        if backend is not None:
+            backend.record_failure()
+            LLM_BACKEND_REQUESTS.labels(backend.url, "error").inc()
+
+
+# Shared instance used by the prompt modules, opened and closed by the app
+vllm_client = VLLMClient()
+
+set_gauge_function(LLM_SCHEDULER_WINDOW, lambda: vllm_client.scheduler.window)
+set_gauge_function(LLM_SCHEDULER_IN_FLIGHT, lambda: vllm_client.scheduler.in_flight)
+set_gauge_function(LLM_SCHEDULER_QUEUED, lambda: len(vllm_client.scheduler._queue))
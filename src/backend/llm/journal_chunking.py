@@ -0,0 +1,124 @@
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Journals longer than this are extracted in chunks of at most JOURNAL_CHUNK_CHARS (roughly 4 characters per token)
+JOURNAL_CHUNK_THRESHOLD_CHARS = int(os.getenv("JOURNAL_CHUNK_THRESHOLD_CHARS", "48000"))
+JOURNAL_CHUNK_CHARS = int(os.getenv("JOURNAL_CHUNK_CHARS", "16000"))
+
+# Journal entries start with a "**Entry <n>:**" line
+ENTRY_PATTERN = re.compile(r"^\*\*Entry (\d+):\*\*", re.MULTILINE)
+
+# The field identifying an item of each medical_journal category, used to de-duplicate across chunks
+CATEGORY_KEYS = {
+    "critical_information": "condition",
+    "current_medications": "medication",
+    "allergy_information": "allergy_name",
+}
+
+NO_KNOWN_ALLERGIES = re.compile(r"\bno known allerg", re.IGNORECASE)
+
+
+def split_journal_entries(medical_journal: str) -> tuple[str, list[tuple[int, str]]]:
+    """
+    Splits a medical journal on entry boundaries.
+
+    Returns:
+        tuple: The preamble before the first entry (patient name, headings), and a
+               list of (entry number, entry text) in journal order.
+    """
+    matches = list(ENTRY_PATTERN.finditer(medical_journal))
+    if not matches:
+        return medical_journal, []
+    preamble = medical_journal[:matches[0].start()]
+    entries = []
+    for match, next_match in zip(matches, matches[1:] + [None]):
+        end = next_match.start() if next_match else len(medical_journal)
+        entries.append((int(match.group(1)), medical_journal[match.start():end]))
+    return preamble, entries
+
+
+def chunk_medical_journal(medical_journal: str, chunk_chars: int = JOURNAL_CHUNK_CHARS) -> list[tuple[str, list[int]]]:
+    """
+    Groups consecutive journal entries into chunks of at most chunk_chars characters.
+
+    Entries are never split; an entry longer than chunk_chars gets a chunk of its own.
+    Every chunk repeats the journal's preamble and keeps the original entry numbers, so
+    source_entries in the extraction of a chunk refer to the same entries as for the
+    whole journal.
+
+    Returns:
+        list: (chunk text, entry numbers in the chunk) for each chunk.
+    """
+    preamble, entries = split_journal_entries(medical_journal)
+    if not entries:
+        return [(medical_journal, [])]
+
+    chunks, current, current_numbers = [], [], []
+    size = len(preamble)
+    for number, text in entries:
+        if current and size + len(text) > chunk_chars:
+            chunks.append((preamble + "".join(current), current_numbers))
+            current, current_numbers, size = [], [], len(preamble)
+        current.append(text)
+        current_numbers.append(number)
+        size += len(text)
+    chunks.append((preamble + "".join(current), current_numbers))
+    return chunks
+
+
+def resolve_source_entries(source_entries: list[int], entry_numbers: list[int]) -> list[int]:
+    """
+    Keeps the source_entries of a chunk extraction that refer to entries in the chunk.
+
+    A reference outside the chunk cannot be trusted: it may be a position within the
+    chunk or a hallucinated entry number, so it is dropped rather than guessed.
+    """
+    if not entry_numbers:
+        return source_entries
+    in_chunk = set(entry_numbers)
+    resolved = [entry for entry in source_entries if entry in in_chunk]
+    if len(resolved) < len(source_entries):
+        dropped = [entry for entry in source_entries if entry not in in_chunk]
+        logger.warning(f"Dropping source entries {dropped} outside of chunk entries {entry_numbers[0]}-{entry_numbers[-1]}")
+    return resolved
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def merge_medical_journal_extractions(extractions: list[tuple[dict, list[int]]]) -> dict:
+    """
+    Merges the extractions of journal chunks into one medical_journal object.
+
+    Items with the same condition, medication or allergy name are de-duplicated: their
+    source_entries are combined, and the details of the most recent chunk are kept.
+    "No known allergies" placeholders are dropped when any chunk found an allergy.
+
+    Args:
+        extractions (list): (extraction, entry numbers of its chunk) in journal order.
+
+    Returns:
+        dict: {"medical_journal": {...}} in the same shape as a single extraction.
+    """
+    merged = {}
+    for category, key in CATEGORY_KEYS.items():
+        items = {}
+        for extraction, entry_numbers in extractions:
+            for item in extraction["medical_journal"].get(category, []):
+                item = {**item, "source_entries": resolve_source_entries(item.get("source_entries", []), entry_numbers)}
+                name = _normalize(item[key])
+                if name in items:
+                    item["source_entries"] = items[name]["source_entries"] + item["source_entries"]
+                items[name] = item
+        for item in items.values():
+            item["source_entries"] = sorted(set(item["source_entries"]))
+        merged[category] = list(items.values())
+
+    allergies = merged["allergy_information"]
+    if any(not NO_KNOWN_ALLERGIES.search(item["allergy_name"]) for item in allergies):
+        merged["allergy_information"] = [item for item in allergies if not NO_KNOWN_ALLERGIES.search(item["allergy_name"])]
+    return {"medical_journal": merged}
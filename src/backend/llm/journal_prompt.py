@@ -1,8 +1,80 @@
-import requests
+import asyncio
+import httpx
 import json
-import os
+import logging
+from llm.backends import NoHealthyBackendError
+from llm.client import vllm_client
+from llm.journal_chunking import JOURNAL_CHUNK_CHARS, JOURNAL_CHUNK_THRESHOLD_CHARS, chunk_medical_journal, merge_medical_journal_extractions
+from llm.scheduler import Priority, QueueFullError
+from llm.payloads import GuidedJSONTemplate
+from llm.streaming import IncrementalJSONParser
 
-def prompt_llm_vllm_guided_json_with_medical_journal(endpoint_url:str, model_path: str, system_prompt: str, medical_journal: str):
+logger = logging.getLogger(__name__)
+
+# Define the JSON schema for guided_json - Medical Information Extraction
+MEDICAL_JOURNAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "medical_journal": {
+            "type": "object",
+            "properties": {
+                "critical_information": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "condition": {"type": "string", "description": "Relevant medical history condition"},
+                            "details": {"type": "string", "description": "Details about the relevant medical history"},
+                            "source_entries": {"type": "array", "items": {"type": "integer"}, "description": "List of journal entry numbers supporting this history"}
+                        },
+                        "required": ["condition", "details", "source_entries"]
+                    },
+                    "description": "List of relevant past medical history"
+                },
+                "current_medications": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "medication": {"type": "string", "description": "Name of the current medication"},
+                            "reason": {"type": "string", "description": "Reason for medication prescription"},
+                            "source_entries": {"type": "array", "items": {"type": "integer"}, "description": "List of journal entry numbers mentioning this medication"}
+                        },
+                        "required": ["medication", "reason", "source_entries"]
+                    },
+                    "description": "List of current medications"
+                },
+                "allergy_information": { 
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "allergy_name": {"type": "string", "description": "Name of the allergy"},
+                            "details": {"type": "string", "description": "Further details or caveats regarding the allergy"},
+                            "source_entries": {"type": "array", "items": {"type": "integer"}, "description": "List of journal entry numbers related to the allergy"}
+                        },
+                        "required": ["allergy_name", "details", "source_entries"]
+                    },
+                    "description": "List of allergies"
+                }
+            },
+            "required": ["critical_information", "current_medications", "allergy_information"],
+            "description": "Vital medical information extracted from journal entries"
+        }
+    },
+    "required": ["medical_journal"]
+}
+
+# Serialized once at import, see GuidedJSONTemplate
+MEDICAL_JOURNAL_TEMPLATE = GuidedJSONTemplate(MEDICAL_JOURNAL_SCHEMA)
+
+
+def build_medical_journal_payload(model_path: str, system_prompt: str, medical_journal: str, stream: bool = False) -> bytes:
+    """Builds the encoded guided_json chat completion request for a medical journal extraction."""
+    return MEDICAL_JOURNAL_TEMPLATE.render(model_path, system_prompt, medical_journal, stream=stream)
+
+
+async def prompt_llm_vllm_guided_json_with_medical_journal(endpoint_url: str | None, model_path: str, system_prompt: str, medical_journal: str, priority: Priority = Priority.REPROCESS):
     """
     Prompts an LLM via vllm-openai using 'guided_json' for structured medical information output.
 
@@ -11,105 +83,142 @@ def prompt_llm_vllm_guided_json_with_medical_journal(endpoint_url:str, model_pat
     immediate presentation to medical professionals.
 
     Args:
-        endpoint_url (str): The URL of the vllm-openai endpoint.
+        endpoint_url (str | None): The URL of the vllm-openai endpoint, or None to use the backend pool.
         model_path (str): The model path to use.
         system_prompt (str): The system prompt to provide to the LLM.
         medical_journal (str): The medical journal text to provide to the LLM.
+        priority (Priority): The scheduling class of the request.
+
+    Journals longer than JOURNAL_CHUNK_THRESHOLD_CHARS are split on entry boundaries
+    and the chunks are extracted in parallel, see extract_long_medical_journal.
 
     Returns:
         dict: The generated JSON response containing vital medical information,
               or None if there was an error.
-    """
-
-    # Define the JSON schema for guided_json - Medical Information Extraction
-    json_schema = {
-        "type": "object",
-        "properties": {
-            "medical_journal": {
-                "type": "object",
-                "properties": {
-                    "critical_information": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "condition": {"type": "string", "description": "Relevant medical history condition"},
-                                "details": {"type": "string", "description": "Details about the relevant medical history"},
-                                "source_entries": {"type": "array", "items": {"type": "integer"}, "description": "List of journal entry numbers supporting this history"}
-                            },
-                            "required": ["condition", "details", "source_entries"]
-                        },
-                        "description": "List of relevant past medical history"
-                    },
-                    "current_medications": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "medication": {"type": "string", "description": "Name of the current medication"},
-                                "reason": {"type": "string", "description": "Reason for medication prescription"},
-                                "source_entries": {"type": "array", "items": {"type": "integer"}, "description": "List of journal entry numbers mentioning this medication"}
-                            },
-                            "required": ["medication", "reason", "source_entries"]
-                        },
-                        "description": "List of current medications"
-                    },
-                    "allergy_information": { 
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "allergy_name": {"type": "string", "description": "Name of the allergy"},
-                                "details": {"type": "string", "description": "Further details or caveats regarding the allergy"},
-                                "source_entries": {"type": "array", "items": {"type": "integer"}, "description": "List of journal entry numbers related to the allergy"}
-                            },
-                            "required": ["allergy_name", "details", "source_entries"]
-                        },
-                        "description": "List of allergies"
-                    }
-                },
-                "required": ["critical_information", "current_medications", "allergy_information"],
-                "description": "Vital medical information extracted from journal entries"
-            }
-        },
-        "required": ["medical_journal"]
-    }
-
-
-    payload = {
-        "model": model_path,
-        "messages": [
-            {"role": "system", "content": system_prompt.strip()},
-            {"role": "user", "content": medical_journal.strip()}
-        ],
-        "guided_json": json_schema,
-        "temperature": 0.0  # Set temperature to 0.0 for deterministic output
-    }
 
-    headers = {'Content-Type': 'application/json'}
+    Raises:
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
 
     try:
-        api_endpoint = endpoint_url + "/v1/chat/completions"
-        print(f"Sending request to: {api_endpoint} with guided_json for medical info") # Debug print
+        api_endpoint = endpoint_url + "/v1/chat/completions" if endpoint_url else "vLLM backend pool"
+        if len(medical_journal) > JOURNAL_CHUNK_THRESHOLD_CHARS:
+            logger.debug(f"Sending chunked requests to: {api_endpoint} with guided_json for medical info")
+            return await extract_long_medical_journal(endpoint_url, model_path, system_prompt, medical_journal, priority)
 
-        response = requests.post(api_endpoint, headers=headers, json=payload)
-        response.raise_for_status()
+        payload = build_medical_journal_payload(model_path, system_prompt, medical_journal)
+        logger.debug(f"Sending request to: {api_endpoint} with guided_json for medical info")
 
-        response_json = response.json()
+        response_json = await vllm_client.chat_completion(endpoint_url, payload, priority=priority)
         return response_json
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error during API request to vllm-openai (medical JSON): {e}")
-        print(f"Details: {e}")
-        if response is not None:
-            print(f"Response status code: {response.status_code}")
-            print(f"Response text: {response.text}")
+    except (QueueFullError, NoHealthyBackendError):
+        # Let callers answer with backpressure instead of a generic error
+        raise
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Error during API request to vllm-openai (medical JSON): {e}\nResponse text: {e.response.text}")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"Error during API request to vllm-openai (medical JSON): {e}")
         return None
     except json.JSONDecodeError as e:
-        print(f"Error decoding JSON response from vllm-openai (medical JSON): {e}")
-        if response is not None:
-            print(f"Response text: {response.text}")
+        logger.error(f"Error decoding JSON response from vllm-openai (medical JSON): {e}")
         return None
     except Exception as e:
-        print(f"An unexpected error occurred with vllm-openai (medical JSON): {e}")
+        logger.exception(f"An unexpected error occurred with vllm-openai (medical JSON): {e}")
         return None
+
+
+async def extract_long_medical_journal(endpoint_url: str | None, model_path: str, system_prompt: str, medical_journal: str,
+                                       priority: Priority = Priority.REPROCESS, chunk_chars: int = JOURNAL_CHUNK_CHARS) -> dict:
+    """
+    Extracts a long medical journal as parallel chunks and merges the results.
+
+    Each chunk of whole entries is extracted against the same schema, so prefill is
+    spread over parallel sequences instead of one very long prompt. The partial lists
+    are then merged and de-duplicated with their source_entries kept pointing at the
+    original entry numbers.
+
+    Returns:
+        dict: A chat completion response in the same shape as a single request, whose
+              content is the merged JSON object and whose usage sums all chunks.
+
+    Raises:
+        httpx.HTTPError: If any chunk request fails.
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
+    chunks = chunk_medical_journal(medical_journal, chunk_chars)
+    responses = await asyncio.gather(*[
+        vllm_client.chat_completion(endpoint_url, build_medical_journal_payload(model_path, system_prompt, chunk), priority=priority)
+        for chunk, _ in chunks
+    ])
+    extractions = [
+        (json.loads(response["choices"][0]["message"]["content"]), entry_numbers)
+        for response, (_, entry_numbers) in zip(responses, chunks)
+    ]
+    merged = merge_medical_journal_extractions(extractions)
+
+    usage = {}
+    for response in responses:
+        for key, value in (response.get("usage") or {}).items():
+            if isinstance(value, int):
+                usage[key] = usage.get(key, 0) + value
+    return {
+        "object": "chat.completion",
+        "model": model_path,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": json.dumps(merged)}, "finish_reason": "stop"}],
+        "usage": usage,
+        "chunks": len(chunks),
+    }
+
+
+async def stream_llm_vllm_guided_json_with_medical_journal(endpoint_url: str | None, model_path: str, system_prompt: str, medical_journal: str, priority: Priority = Priority.REPROCESS):
+    """
+    Streams a medical journal extraction, yielding each JSON value as soon as it is complete.
+
+    Uses the same guided_json schema as prompt_llm_vllm_guided_json_with_medical_journal,
+    but with "stream": true, so completed fields can be shown before generation finishes.
+
+    Args:
+        endpoint_url (str | None): The URL of the vllm-openai endpoint, or None to use the backend pool.
+        model_path (str): The model path to use.
+        system_prompt (str): The system prompt to provide to the LLM.
+        medical_journal (str): The medical journal to provide to the LLM.
+        priority (Priority): The scheduling class of the request.
+
+    Yields:
+        tuple: (path, value) for every completed JSON value, innermost first,
+               e.g. (("medical_journal", "current_medications", 0), {...}) as soon as the first medication closes.
+               The last item has the path () and the whole JSON object.
+
+    Long journals are extracted in parallel chunks as in the non-streaming function;
+    their merged items are yielded once all chunks have completed.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
+    if len(medical_journal) > JOURNAL_CHUNK_THRESHOLD_CHARS:
+        response = await extract_long_medical_journal(endpoint_url, model_path, system_prompt, medical_journal, priority)
+        merged = json.loads(response["choices"][0]["message"]["content"])
+        for category, items in merged["medical_journal"].items():
+            for index, item in enumerate(items):
+                yield ("medical_journal", category, index), item
+        yield (), merged
+        return
+
+    payload = build_medical_journal_payload(model_path, system_prompt, medical_journal, stream=True)
+    parser = IncrementalJSONParser()
+    document = None
+    async for content in vllm_client.stream_chat_completion(endpoint_url, payload, priority=priority):
+        for path, value in parser.feed(content):
+            if path == ():
+                # Held back until the stream ends, so the final usage chunk is still read
+                document = value
+            else:
+                yield path, value
+    if document is not None:
+        yield (), document
@@ -0,0 +1,46 @@
+from functools import lru_cache
+import json
+
+
+def _dumps(value) -> str:
+    # Same compact encoding httpx uses for json= request bodies
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+@lru_cache(maxsize=64)
+def _system_message(system_prompt: str) -> str:
+    return _dumps({"role": "system", "content": system_prompt.strip()})
+
+
+@lru_cache(maxsize=16)
+def _model(model_path: str) -> str:
+    return _dumps(model_path)
+
+
+class GuidedJSONTemplate:
+    """
+    Pre-serialized guided_json chat completion request for one schema.
+
+    The schema is serialized once, when the template is built at import, and the
+    serialized system prompt and model are cached, so rendering a request only encodes
+    the user content. Requests always put the static system prompt first, so every
+    request with the same prompt shares a token prefix that vLLM's automatic prefix
+    caching can reuse, and always send the schema as the same string, so the compiled
+    guided decoding grammar can be reused too. Rendered requests use temperature 0, and
+    streamed requests ask for the token usage like dict payloads do.
+    """
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self._schema_json = _dumps(schema)
+        self._suffix = f'}}],"guided_json":{self._schema_json},"temperature":0.0}}'
+        self._stream_suffix = f'}}],"guided_json":{self._schema_json},"temperature":0.0,"stream":true,"stream_options":{{"include_usage":true}}}}'
+
+    def render(self, model_path: str, system_prompt: str, user_content: str, stream: bool = False) -> bytes:
+        """Returns the encoded /v1/chat/completions request body."""
+        return "".join((
+            '{"model":', _model(model_path),
+            ',"messages":[', _system_message(system_prompt),
+            ',{"role":"user","content":', _dumps(user_content.strip()),
+            self._stream_suffix if stream else self._suffix,
+        )).encode()
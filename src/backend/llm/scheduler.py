@@ -0,0 +1,171 @@
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from metrics import LLM_QUEUE_WAIT
+import asyncio
+import heapq
+import itertools
+import os
+import time
+
+LLM_SCHEDULER_MAX_QUEUE = int(os.getenv("LLM_SCHEDULER_MAX_QUEUE", "256"))
+LLM_SCHEDULER_MIN_WINDOW = int(os.getenv("LLM_SCHEDULER_MIN_WINDOW", "4"))
+LLM_SCHEDULER_INITIAL_WINDOW = int(os.getenv("LLM_SCHEDULER_INITIAL_WINDOW", "16"))
+LLM_SCHEDULER_ADAPT_INTERVAL = float(os.getenv("LLM_SCHEDULER_ADAPT_INTERVAL", "10"))
+
+
+class Priority(IntEnum):
+    """Scheduling classes of LLM requests, most urgent first."""
+    LIVE = 0
+    REPROCESS = 1
+    BACKGROUND = 2
+
+
+class QueueFullError(Exception):
+    """Raised when the LLM admission queue is full and the request is rejected."""
+
+
+class _ClassStats:
+    """Queue-wait and service-time samples of one priority class."""
+
+    def __init__(self, samples: int = 1024):
+        self.admitted = 0
+        self.rejected = 0
+        self.queue_wait = deque(maxlen=samples)
+        self.service_time = deque(maxlen=samples)
+
+    def snapshot(self) -> dict:
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "queue_wait": _summarize(self.queue_wait),
+            "service_time": _summarize(self.service_time),
+        }
+
+
+def _summarize(samples: deque) -> dict:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": round(ordered[len(ordered) // 2], 4),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+class LLMScheduler:
+    """
+    Admission control and priority scheduling of requests to the vLLM server.
+
+    At most `window` requests are in flight; the rest wait in a bounded priority queue
+    and are dispatched most urgent class first, FIFO within a class. When the queue is
+    full, new requests are rejected with QueueFullError instead of piling up.
+
+    vLLM batches whatever sequences are in flight, so throughput depends on keeping the
+    window large enough to fill its batches without overloading it. The window adapts
+    every adapt_interval: while requests were queueing, it grows as long as completed
+    requests per second keep rising and shrinks when they fall. Overload errors from the
+    server (record_overload) halve it.
+    """
+
+    def __init__(self, max_queue: int = LLM_SCHEDULER_MAX_QUEUE, min_window: int = LLM_SCHEDULER_MIN_WINDOW,
+                 max_window: int = 64, initial_window: int = LLM_SCHEDULER_INITIAL_WINDOW,
+                 adapt_interval: float = LLM_SCHEDULER_ADAPT_INTERVAL):
+        self.max_queue = max_queue
+        self.min_window = min_window
+        self.max_window = max(max_window, min_window)
+        self.window = min(max(initial_window, min_window), self.max_window)
+        self.adapt_interval = adapt_interval
+        self.in_flight = 0
+        self.stats = {priority: _ClassStats() for priority in Priority}
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._period_start = time.monotonic()
+        self._period_completions = 0
+        self._period_saturated = False
+        self._last_throughput = 0.0
+        self._direction = 1
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.REPROCESS):
+        """
+        Waits for an in-flight slot for one request, yielding the time spent waiting.
+
+        Raises:
+            QueueFullError: If the request would have to wait and the queue is full.
+        """
+        stats = self.stats[priority]
+        queued_at = time.monotonic()
+        if self.in_flight < self.window and not self._queue:
+            self.in_flight += 1
+        else:
+            if len(self._queue) >= self.max_queue:
+                stats.rejected += 1
+                raise QueueFullError(f"LLM queue is full ({self.max_queue} waiting)")
+            self._period_saturated = True
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._queue, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Cancelled after being granted a slot: hand it on
+                    self.in_flight -= 1
+                    self._dispatch()
+                raise
+
+        started_at = time.monotonic()
+        queue_wait = started_at - queued_at
+        stats.admitted += 1
+        stats.queue_wait.append(queue_wait)
+        LLM_QUEUE_WAIT.labels(priority.name.lower()).observe(queue_wait)
+        try:
+            yield queue_wait
+        finally:
+            stats.service_time.append(time.monotonic() - started_at)
+            self.in_flight -= 1
+            self._period_completions += 1
+            self._adapt()
+            self._dispatch()
+
+    def record_overload(self):
+        """Halves the window after the server signalled it is overloaded (5xx, timeouts)."""
+        self.window = max(self.min_window, self.window // 2)
+        self._direction = 1
+
+    def snapshot(self) -> dict:
+        return {
+            "window": self.window,
+            "in_flight": self.in_flight,
+            "queued": len(self._queue),
+            "max_queue": self.max_queue,
+            "throughput": round(self._last_throughput, 3),
+            "classes": {priority.name.lower(): stats.snapshot() for priority, stats in self.stats.items()},
+        }
+
+    def _dispatch(self):
+        while self._queue and self.in_flight < self.window:
+            _, _, future = heapq.heappop(self._queue)
+            if future.cancelled():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    def _adapt(self):
+        now = time.monotonic()
+        elapsed = now - self._period_start
+        if elapsed < self.adapt_interval:
+            return
+        throughput = self._period_completions / elapsed
+        if self._period_saturated:
+            # Hill-climb: keep moving the window while throughput improves, turn around when it drops
+            if throughput < self._last_throughput * 0.95:
+                self._direction = -self._direction
+            self.window = min(self.max_window, max(self.min_window, self.window + self._direction * max(1, self.window // 8)))
+        self._last_throughput = throughput
+        self._period_start = now
+        self._period_completions = 0
+        self._period_saturated = False
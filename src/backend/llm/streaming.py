@@ -0,0 +1,83 @@
+from typing import Any
+import json
+
+
+class IncrementalJSONParser:
+    """
+    Incremental parser for JSON text arriving in chunks, such as a streamed guided_json completion.
+
+    feed() returns every value that was completed by the chunk, as (path, value) pairs,
+    where path is the tuple of object keys and array indices leading to the value.
+    Values are reported innermost first, so for '{"a": [{"b": 1}]}' the parser yields
+    (("a", 0, "b"), 1), (("a", 0), {"b": 1}), (("a",), [{"b": 1}]) and finally ((), {...}).
+    """
+
+    _WHITESPACE = " \t\r\n"
+
+    def __init__(self):
+        self.done = False
+        self._text = ""
+        self._pos = 0
+        # One frame per open container: [kind, start, key or index, expecting_key]
+        self._stack: list[list] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._token_start: int | None = None
+        self._scalar_start: int | None = None
+
+    def feed(self, chunk: str) -> list[tuple[tuple, Any]]:
+        self._text += chunk
+        completed = []
+        text = self._text
+        while self._pos < len(text):
+            char = text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    value = json.loads(text[self._token_start:self._pos + 1])
+                    if self._string_is_key:
+                        self._stack[-1][2] = value
+                    else:
+                        completed.append((self._path(), value))
+                self._pos += 1
+                continue
+
+            if self._scalar_start is not None and (char in self._WHITESPACE or char in ",]}"):
+                completed.append((self._path(), json.loads(text[self._scalar_start:self._pos])))
+                self._scalar_start = None
+
+            if char in self._WHITESPACE:
+                pass
+            elif char == '"':
+                self._in_string = True
+                self._token_start = self._pos
+                self._string_is_key = bool(self._stack) and self._stack[-1][0] == "{" and self._stack[-1][3]
+            elif char in "{[":
+                self._stack.append([char, self._pos, None if char == "{" else 0, char == "{"])
+            elif char in "}]":
+                frame = self._stack.pop()
+                value = json.loads(text[frame[1]:self._pos + 1])
+                completed.append((self._path(), value))
+                if not self._stack:
+                    self.done = True
+            elif char == ":":
+                self._stack[-1][3] = False
+            elif char == ",":
+                frame = self._stack[-1]
+                if frame[0] == "{":
+                    frame[3] = True
+                else:
+                    frame[2] += 1
+            elif self._scalar_start is None:
+                self._scalar_start = self._pos
+            self._pos += 1
+        return completed
+
+    def _path(self) -> tuple:
+        return tuple(frame[2] for frame in self._stack)
+
@@ -1,8 +1,70 @@
-import requests
+import httpx
 import json
-import os
+import logging
+from llm.client import vllm_client
+from llm.backends import NoHealthyBackendError
+from llm.scheduler import Priority, QueueFullError
+from llm.payloads import GuidedJSONTemplate
+from llm.streaming import IncrementalJSONParser
 
-def prompt_llm_vllm_guided_json_with_transcription_text(endpoint_url: str, model_path: str, system_prompt: str, transcription_text: str):
+logger = logging.getLogger(__name__)
+
+# Define the JSON schema for guided_json (same as before)
+TRANSCRIPTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "concise_summary": {"type": "string", "description": "Brief summary of the incident"},
+        "relevant_medical_info": {"type": "array", "items": {"type": "string"}, "description": "List of relevant medical information"},
+        "timeline_events": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "timestamp": {"type": "string", "description": "Timestamp of the event [MM:SS]"},
+                    "description": {"type": "string", "description": "Description of the event"}
+                },
+                "required": ["timestamp", "description"]
+            },
+            "description": "Timeline of events"
+        }
+    },
+    "required": ["concise_summary", "relevant_medical_info", "timeline_events"]
+}
+
+# Serialized once at import, see GuidedJSONTemplate
+TRANSCRIPTION_TEMPLATE = GuidedJSONTemplate(TRANSCRIPTION_SCHEMA)
+
+
+# Appended to the caller's system prompt for segment extractions; a fixed suffix keeps the prompt prefix cacheable
+SEGMENT_INSTRUCTIONS = """
+
+The transcription is sent in segments while the call is still ongoing. You are given what has been
+extracted from the earlier segments and the next segment of the transcription. Update
+`concise_summary` so it summarizes the whole incident so far. In `relevant_medical_info` and
+`timeline_events`, list ONLY information and events from the new segment that are not already recorded."""
+
+
+def render_transcription_segment(state: dict, segment: str) -> str:
+    """
+    Renders the user message of a segment extraction: the running state, then the new segment.
+
+    The state holds the current summary and only the most recent medical information and
+    timeline events, so the message grows with the segment rather than the whole call.
+    """
+    lines = ["Incident so far:", state.get("concise_summary") or "(nothing yet)", "", "Relevant medical information already recorded:"]
+    lines += [f"- {info}" for info in state.get("relevant_medical_info", [])] or ["(none)"]
+    lines += ["", "Latest timeline events already recorded:"]
+    lines += [f"{event.get('timestamp')} {event.get('description')}" for event in state.get("timeline_events", [])] or ["(none)"]
+    lines += ["", "New transcription segment:", segment]
+    return "\n".join(lines)
+
+
+def build_transcription_payload(model_path: str, system_prompt: str, transcription_text: str, stream: bool = False) -> bytes:
+    """Builds the encoded guided_json chat completion request for a transcription text extraction."""
+    return TRANSCRIPTION_TEMPLATE.render(model_path, system_prompt, transcription_text, stream=stream)
+
+
+async def prompt_llm_vllm_guided_json_with_transcription_text(endpoint_url: str | None, model_path: str, system_prompt: str, transcription_text: str, priority: Priority = Priority.REPROCESS):
     """
     Prompts an LLM via vllm-openai using ONLY 'guided_json' for JSON output and schema.
 
@@ -11,76 +73,122 @@ def prompt_llm_vllm_guided_json_with_transcription_text(endpoint_url: str, model
     as it conflicts with 'guided_json'.
 
     Args:
-        endpoint_url (str): The URL of the vllm-openai endpoint (e.g., "http://89.169.97.156:1337").
+        endpoint_url (str | None): The URL of the vllm-openai endpoint (e.g., "http://89.169.97.156:1337"),
+            or None to use the backend pool.
         model_path (str): The model path to use (as configured in vllm).
         system_prompt (str): The system prompt to provide to the LLM.
         transcription_text (str): The transcription text to provide to the LLM.
+        priority (Priority): The scheduling class of the request.
 
     Returns:
         dict: The generated JSON response from the LLM as a Python dictionary,
               or None if there was an error.
-    """
-
-    # Define the JSON schema for guided_json (same as before)
-    json_schema = {
-        "type": "object",
-        "properties": {
-            "concise_summary": {"type": "string", "description": "Brief summary of the incident"},
-            "relevant_medical_info": {"type": "array", "items": {"type": "string"}, "description": "List of relevant medical information"},
-            "timeline_events": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "timestamp": {"type": "string", "description": "Timestamp of the event [MM:SS]"},
-                        "description": {"type": "string", "description": "Description of the event"}
-                    },
-                    "required": ["timestamp", "event"]
-                },
-                "description": "Timeline of events"
-            }
-        },
-        "required": ["concise_summary", "relevant_medical_info", "timeline_events"]
-    }
 
+    Raises:
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
 
-    payload = {
-        "model": model_path,
-        "messages": [
-            {"role": "system", "content": system_prompt.strip()},
-            {"role": "user", "content": transcription_text.strip()}
-        ],
-        "guided_json": json_schema,              # Keep guided_json
-        "temperature": 0.0
-    }
-
-    headers = {'Content-Type': 'application/json'}
+    payload = build_transcription_payload(model_path, system_prompt, transcription_text)
 
     try:
-        api_endpoint = endpoint_url + "/v1/chat/completions"
-        print(f"Sending request to: {api_endpoint} with ONLY guided_json") # Debug print
-
-        response = requests.post(api_endpoint, headers=headers, json=payload)
-        response.raise_for_status()
+        api_endpoint = endpoint_url + "/v1/chat/completions" if endpoint_url else "vLLM backend pool"
+        logger.debug(f"Sending request to: {api_endpoint} with ONLY guided_json")
 
-        response_json = response.json()
+        response_json = await vllm_client.chat_completion(endpoint_url, payload, priority=priority)
 
         # Now we expect the entire response to be a JSON object based on our schema
         # We can directly return the parsed JSON
         return response_json
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error during API request to vllm-openai with guided_json only: {e}")
-        print(f"Details: {e}")
-        if response is not None:
-            print(f"Response status code: {response.status_code}")
-            print(f"Response text: {response.text}")
+    except (QueueFullError, NoHealthyBackendError):
+        # Let callers answer with backpressure instead of a generic error
+        raise
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Error during API request to vllm-openai with guided_json only: {e}\nResponse text: {e.response.text}")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"Error during API request to vllm-openai with guided_json only: {e}")
         return None
     except json.JSONDecodeError as e:
-        print(f"Error decoding JSON response from vllm-openai (guided_json only): {e}")
-        if response is not None:
-            print(f"Response text: {response.text}")
+        logger.error(f"Error decoding JSON response from vllm-openai (guided_json only): {e}")
         return None
     except Exception as e:
-        print(f"An unexpected error occurred with vllm-openai (guided_json only): {e}")
+        logger.exception(f"An unexpected error occurred with vllm-openai (guided_json only): {e}")
+        return None
+
+
+async def stream_llm_vllm_guided_json_with_transcription_text(endpoint_url: str | None, model_path: str, system_prompt: str, transcription_text: str, priority: Priority = Priority.REPROCESS):
+    """
+    Streams a transcription text extraction, yielding each JSON value as soon as it is complete.
+
+    Uses the same guided_json schema as prompt_llm_vllm_guided_json_with_transcription_text,
+    but with "stream": true, so completed fields can be shown before generation finishes.
+
+    Args:
+        endpoint_url (str | None): The URL of the vllm-openai endpoint, or None to use the backend pool.
+        model_path (str): The model path to use.
+        system_prompt (str): The system prompt to provide to the LLM.
+        transcription_text (str): The transcription text to provide to the LLM.
+        priority (Priority): The scheduling class of the request.
+
+    Yields:
+        tuple: (path, value) for every completed JSON value, innermost first,
+               e.g. (("timeline_events", 0), {...}) as soon as the first timeline event closes.
+               The last item has the path () and the whole JSON object.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
+    payload = build_transcription_payload(model_path, system_prompt, transcription_text, stream=True)
+    parser = IncrementalJSONParser()
+    document = None
+    async for content in vllm_client.stream_chat_completion(endpoint_url, payload, priority=priority):
+        for path, value in parser.feed(content):
+            if path == ():
+                # Held back until the stream ends, so the final usage chunk is still read
+                document = value
+            else:
+                yield path, value
+    if document is not None:
+        yield (), document
+
+
+async def prompt_llm_vllm_guided_json_with_transcription_segment(endpoint_url: str | None, model_path: str, system_prompt: str, state: dict, segment: str,
+                                                                 priority: Priority = Priority.LIVE):
+    """
+    Extracts the new content of one segment of an ongoing call's transcription.
+
+    Uses the same guided_json schema as prompt_llm_vllm_guided_json_with_transcription_text,
+    but the model only sees the running state and the new segment, and returns the updated
+    concise summary with only the new medical information and timeline events.
+
+    Args:
+        endpoint_url (str | None): The URL of the vllm-openai endpoint, or None to use the backend pool.
+        model_path (str): The model path to use.
+        system_prompt (str): The transcription system prompt, extended with SEGMENT_INSTRUCTIONS.
+        state (dict): The running state: concise_summary and the latest relevant_medical_info and timeline_events.
+        segment (str): The new transcription text.
+        priority (Priority): The scheduling class of the request.
+
+    Returns:
+        dict: The chat completion response, or None if there was an error.
+
+    Raises:
+        QueueFullError: If the LLM admission queue is full.
+        NoHealthyBackendError: If no vLLM backend is available.
+    """
+    payload = build_transcription_payload(model_path, system_prompt + SEGMENT_INSTRUCTIONS, render_transcription_segment(state, segment))
+
+    try:
+        return await vllm_client.chat_completion(endpoint_url, payload, priority=priority)
+    except (QueueFullError, NoHealthyBackendError):
+        raise
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Error during API request to vllm-openai (transcription segment): {e}\nResponse text: {e.response.text}")
+        return None
+    except httpx.HTTPError as e:
+        logger.error(f"Error during API request to vllm-openai (transcription segment): {e}")
         return None
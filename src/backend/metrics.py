@@ -0,0 +1,179 @@
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from pymongo import monitoring
+from tracing import record_span
+import asyncio
+import os
+import threading
+import time
+
+# Set when several server processes share the metrics (see gunicorn.conf.py); each process writes its samples there
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+METRICS_GAUGE_INTERVAL = float(os.getenv("METRICS_GAUGE_INTERVAL", "5"))
+
+# Buckets reaching up to the multi-minute LLM extractions
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+#########
+## API ##
+#########
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Time to serve an HTTP request, by route template",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge("http_requests_in_progress", "HTTP requests being served", ["method"], multiprocess_mode="livesum")
+
+###########
+## Mongo ##
+###########
+MONGO_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds", "Time of MongoDB commands, measured by the driver",
+    ["command", "collection"], buckets=LATENCY_BUCKETS,
+)
+MONGO_COMMAND_FAILURES = Counter("mongodb_command_failures_total", "Failed MongoDB commands", ["command", "collection"])
+
+#########
+## LLM ##
+#########
+LLM_QUEUE_WAIT = Histogram(
+    "llm_queue_wait_seconds", "Time LLM requests waited in the scheduler queue",
+    ["priority"], buckets=LATENCY_BUCKETS,
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds", "Time from sending a streamed LLM request to its first content delta (mostly prefill)",
+    ["priority"], buckets=LATENCY_BUCKETS,
+)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds", "Time of LLM requests from admission to the last token, including retries",
+    ["priority", "mode", "outcome"], buckets=LATENCY_BUCKETS,
+)
+LLM_PROMPT_TOKENS = Counter("llm_prompt_tokens_total", "Prompt tokens reported in vLLM usage", ["priority"])
+LLM_COMPLETION_TOKENS = Counter("llm_completion_tokens_total", "Completion tokens reported in vLLM usage", ["priority"])
+LLM_SCHEDULER_WINDOW = Gauge("llm_scheduler_window", "In-flight window of the LLM scheduler", multiprocess_mode="livesum")
+LLM_SCHEDULER_IN_FLIGHT = Gauge("llm_scheduler_in_flight", "LLM requests in flight", multiprocess_mode="livesum")
+LLM_SCHEDULER_QUEUED = Gauge("llm_scheduler_queued", "LLM requests waiting for admission", multiprocess_mode="livesum")
+LLM_BACKEND_REQUESTS = Counter("llm_backend_requests_total", "LLM requests sent to each vLLM backend", ["backend", "outcome"])
+LLM_HEDGED_REQUESTS = Counter("llm_hedged_requests_total", "LLM requests hedged on a second backend, by which attempt answered", ["winner"])
+
+##############
+## Pipeline ##
+##############
+PIPELINE_STAGE_DURATION = Histogram(
+    "incident_stage_duration_seconds", "Time of incident processing stages",
+    ["stage", "outcome"], buckets=LATENCY_BUCKETS,
+)
+
+
+# Gauges read from callbacks, sampled by sample_gauges in multiprocess mode
+_gauge_functions: list[tuple[Gauge, callable]] = []
+
+
+def set_gauge_function(gauge: Gauge, function):
+    """
+    Makes a gauge report the value of function, like Gauge.set_function.
+
+    Callback gauges are not visible to the multiprocess collector, so with several server
+    processes the value is instead written every METRICS_GAUGE_INTERVAL by sample_gauges.
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        _gauge_functions.append((gauge, function))
+    else:
+        gauge.set_function(function)
+
+
+async def sample_gauges(interval: float = METRICS_GAUGE_INTERVAL):
+    """Writes the callback gauges of this process until cancelled. Only needed in multiprocess mode."""
+    while True:
+        for gauge, function in _gauge_functions:
+            gauge.set(function())
+        await asyncio.sleep(interval)
+
+
+def render_metrics() -> bytes:
+    """Renders the metrics of this process, or of every server process in multiprocess mode."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def record_llm_usage(priority: str, usage: dict | None):
+    """Counts the tokens of a vLLM usage object."""
+    if not usage:
+        return
+    LLM_PROMPT_TOKENS.labels(priority).inc(usage.get("prompt_tokens") or 0)
+    LLM_COMPLETION_TOKENS.labels(priority).inc(usage.get("completion_tokens") or 0)
+
+
+class PrometheusMiddleware:
+    """
+    ASGI middleware recording the latency of every request by route template.
+
+    Event streams are counted in progress but their (unbounded) duration is not observed.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        start = time.perf_counter()
+        response = {"status": 500, "streaming": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"content-type" and value.startswith(b"text/event-stream"):
+                        response["streaming"] = True
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.labels(method).dec()
+            if not response["streaming"]:
+                route = scope.get("route")
+                # Label by template (/db/summaries/{summary_id}) to keep the series bounded
+                route_label = getattr(route, "path", "unmatched")
+                HTTP_REQUEST_DURATION.labels(method, route_label, str(response["status"])).observe(time.perf_counter() - start)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    Times every command sent by the MongoDB driver.
+
+    Motor runs commands on executor threads with a copy of the caller's context, so the
+    command also shows up as a span in the caller's trace.
+    """
+
+    def __init__(self):
+        self._collections: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            # getMore names the collection separately from the cursor id
+            collection = event.command.get("collection", "")
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event):
+        self._record(event, failed=False)
+
+    def failed(self, event):
+        self._record(event, failed=True)
+
+    def _record(self, event, failed: bool):
+        with self._lock:
+            collection = self._collections.pop((event.connection_id, event.request_id), "")
+        duration = event.duration_micros / 1e6
+        MONGO_COMMAND_DURATION.labels(event.command_name, collection).observe(duration)
+        if failed:
+            MONGO_COMMAND_FAILURES.labels(event.command_name, collection).inc()
+        record_span(f"mongo.{event.command_name}", duration, collection=collection, failed=failed)
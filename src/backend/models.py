@@ -1,17 +1,88 @@
-from pydantic import BaseModel, Field
-from typing import List
+from datetime import datetime, timedelta
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Literal
 
 class LLMRequest(BaseModel):
     prompt: str
     input_text: str
 
+class TranscriptionSegmentRequest(BaseModel):
+    prompt: str = Field(..., description="The transcription system prompt, as for /llm/transcription")
+    segment: str = Field(..., description="The new part of the call's transcription, with [MM:SS] offsets from the start of the call")
+    sequence: int | None = Field(None, ge=1, description="The number of the segment in the call, from 1. When set, the segment is only applied right after segment sequence - 1")
+
+class IncidentProcessingRequest(BaseModel):
+    transcription: LLMRequest
+    journal: LLMRequest
+    stream: bool = Field(True, description="Write fields to the summary as the LLM completes them")
+    priority: Literal["live", "reprocess", "background"] | None = Field(None, description="Defaults to reprocess for already processed summaries, live otherwise")
+
+####################
+## Stored content ##
+####################
+class TimelineEvent(BaseModel):
+    timestamp: datetime = Field(..., example="2021-01-01T00:00:00Z")
+    description: str = Field(..., example="<description>")
+
+class CriticalInformation(BaseModel):
+    condition: str
+    details: str
+    source_entries: List[int] = []
+
+class Medication(BaseModel):
+    medication: str
+    reason: str
+    source_entries: List[int] = []
+
+class Allergy(BaseModel):
+    allergy_name: str
+    details: str
+    source_entries: List[int] = []
+
+class MedicalJournal(BaseModel):
+    critical_information: List[CriticalInformation] = []
+    current_medications: List[Medication] = []
+    allergy_information: List[Allergy] = []
+
 class Summary(BaseModel):
     title: str = Field(..., example="<Title>")
-    date: str = Field(..., example="2021-01-01T00:00:00Z")
-    ambulance_notes: str = Field(..., example="")
-    timeline_events: List[dict] = Field(None, example=[{ "timestamp": "2021-01-01T00:00:00Z", "description": "<description>" }])
-    medical_journal: dict = Field(None, example={"critical_information": [], "current_medications": [], "allergy_information": [] })
+    date: datetime = Field(..., example="2021-01-01T00:00:00Z")
+    ambulance_notes: str | List[str] = Field(..., example="")
+    timeline_events: List[TimelineEvent] = Field(None, example=[{ "timestamp": "2021-01-01T00:00:00Z", "description": "<description>" }])
+    medical_journal: MedicalJournal = Field(None, example={"critical_information": [], "current_medications": [], "allergy_information": [] })
     status: str = Field(..., example="live")
     ai_summary: str = Field(None, example="")
+    job: dict | None = Field(None, example={"id": "<job id>", "status": "queued", "attempts": 0, "last_error": None})
+
+########################
+## Extraction results ##
+########################
+class TranscriptionTimelineEvent(BaseModel):
+    """A timeline event as generated from a transcription, timestamped with its [MM:SS] offset into the call."""
+    timestamp: str
+    description: str
+
+    @field_validator("timestamp")
+    @classmethod
+    def check_offset(cls, value: str) -> str:
+        parts = value.strip().strip("[]").split(":")
+        if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts):
+            raise ValueError(f"Expected an [MM:SS] offset, got {value!r}")
+        return value
+
+    @property
+    def offset(self) -> timedelta:
+        *hours, minutes, seconds = map(int, self.timestamp.strip().strip("[]").split(":"))
+        return timedelta(hours=hours[0] if hours else 0, minutes=minutes, seconds=seconds)
+
+    def at(self, base_date: datetime) -> TimelineEvent:
+        """Resolves the offset against the start of the call."""
+        return TimelineEvent(timestamp=base_date + self.offset, description=self.description)
 
+class TranscriptionExtraction(BaseModel):
+    concise_summary: str
+    relevant_medical_info: List[str]
+    timeline_events: List[TranscriptionTimelineEvent]
 
+class MedicalJournalExtraction(BaseModel):
+    medical_journal: MedicalJournal
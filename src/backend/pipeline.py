@@ -0,0 +1,390 @@
+from datetime import datetime
+from typing import Awaitable, Callable, TypeVar
+from pydantic import BaseModel, ValidationError
+from models import (Allergy, CriticalInformation, LLMRequest, MedicalJournal, MedicalJournalExtraction, Medication,
+                    TranscriptionExtraction, TranscriptionTimelineEvent)
+from llm.backends import NoHealthyBackendError
+from llm.scheduler import Priority, QueueFullError
+from metrics import PIPELINE_STAGE_DURATION
+from tracing import span
+from llm.journal_prompt import prompt_llm_vllm_guided_json_with_medical_journal, stream_llm_vllm_guided_json_with_medical_journal
+from llm.transcription_prompt import prompt_llm_vllm_guided_json_with_transcription_text, stream_llm_vllm_guided_json_with_transcription_text
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Extraction contents longer than this are parsed and validated in a worker thread, keeping the event loop responsive
+EXTRACTION_PARSE_THREAD_CHARS = int(os.getenv("EXTRACTION_PARSE_THREAD_CHARS", "65536"))
+
+# Models of the items streamed in each medical journal category
+JOURNAL_ITEM_MODELS = {
+    "critical_information": CriticalInformation,
+    "current_medications": Medication,
+    "allergy_information": Allergy,
+}
+
+# Summary fields each streamed extraction overwrites, restored if the extraction fails
+STREAMED_FIELDS = {
+    "transcription": ("ai_summary", "timeline_events", "ambulance_notes"),
+    "medical_journal": ("medical_journal",),
+}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ExtractionError(Exception):
+    """Raised when an LLM extraction returns no usable result."""
+
+
+def validate_extraction(model: type[ModelT], value: dict | str) -> ModelT:
+    """
+    Validates LLM output against the model of the extraction, from a parsed value or JSON text.
+
+    Raises:
+        ExtractionError: If the output is not valid JSON or does not match the model.
+    """
+    try:
+        if isinstance(value, str):
+            return model.model_validate_json(value)
+        return model.model_validate(value)
+    except ValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        raise ExtractionError(f"LLM output does not match {model.__name__} ({e.error_count()} errors, first at {location or 'root'}: {error['msg']})")
+
+
+async def parse_extraction(response: dict | None, model: type[ModelT]) -> ModelT:
+    """
+    Parses and validates the guided_json content of a chat completion response.
+
+    Large contents, such as merged extractions of long journals, are handled in a
+    worker thread so that parsing them does not block the event loop.
+
+    Args:
+        response (dict | None): The chat completion response returned by a prompt function.
+        model (type): The model of the extraction.
+
+    Returns:
+        The validated extraction.
+
+    Raises:
+        ExtractionError: If the response is missing, has no choices, or does not match the model.
+    """
+    if response is None:
+        raise ExtractionError("No response from LLM")
+    if "choices" not in response or len(response["choices"]) == 0:
+        raise ExtractionError("No choices found in LLM response")
+    content = response["choices"][0]["message"]["content"]
+    if len(content) > EXTRACTION_PARSE_THREAD_CHARS:
+        return await asyncio.to_thread(validate_extraction, model, content)
+    return validate_extraction(model, content)
+
+
+def _validated_item(model: type[ModelT], value) -> ModelT | None:
+    # A malformed streamed item is skipped; the whole document is validated when the stream ends
+    try:
+        return model.model_validate(value)
+    except ValidationError as e:
+        logger.warning(f"Skipping streamed {model.__name__} that does not validate: {e.error_count()} errors")
+        return None
+
+
+def summary_base_date(summary: dict) -> datetime:
+    """Returns the start of a summary's call, also for summaries stored before dates were stored natively."""
+    date = summary["date"]
+    return date if isinstance(date, datetime) else datetime.fromisoformat(date)
+
+
+async def extract_transcription(endpoint_url: str | None, model_path: str, request: LLMRequest, priority: Priority = Priority.REPROCESS) -> TranscriptionExtraction:
+    response = await prompt_llm_vllm_guided_json_with_transcription_text(
+        endpoint_url=endpoint_url,
+        model_path=model_path,
+        system_prompt=request.prompt,
+        transcription_text=request.input_text,
+        priority=priority
+    )
+    return await parse_extraction(response, TranscriptionExtraction)
+
+
+async def extract_medical_journal(endpoint_url: str | None, model_path: str, request: LLMRequest, priority: Priority = Priority.REPROCESS) -> MedicalJournalExtraction:
+    response = await prompt_llm_vllm_guided_json_with_medical_journal(
+        endpoint_url=endpoint_url,
+        model_path=model_path,
+        system_prompt=request.prompt,
+        medical_journal=request.input_text,
+        priority=priority
+    )
+    return await parse_extraction(response, MedicalJournalExtraction)
+
+
+async def _timed(stage: str, coro: Awaitable, timings: dict):
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        with span(f"extract.{stage}"):
+            result = await coro
+        outcome = "ok"
+        return result
+    finally:
+        timings[stage] = round(time.perf_counter() - start, 3)
+        PIPELINE_STAGE_DURATION.labels(stage, outcome).observe(time.perf_counter() - start)
+
+
+class SummaryWriter:
+    """
+    Coalesces partial summary updates produced while extractions stream.
+
+    At most one write is in flight; fields set and items appended meanwhile are merged
+    into the next write. Appended items are pushed onto the stored arrays, so streaming
+    a long list does not rewrite it on every item.
+    """
+
+    def __init__(self, summary_id: str, update_summary: Callable[..., Awaitable[dict]]):
+        self.summary_id = summary_id
+        self.update_summary = update_summary
+        self._pending = {}
+        self._pushes = {}
+        self._appended = set()
+        # Top-level summary fields written so far
+        self.written: set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    def set(self, fields: dict):
+        for field in fields:
+            self._pushes.pop(field, None)
+            self.written.add(field.split(".", 1)[0])
+        self._pending.update(fields)
+        self._schedule()
+
+    def append(self, field: str, item):
+        """Appends an item to an array field, replacing whatever the field held before the first item."""
+        if field not in self._appended:
+            self._appended.add(field)
+            self.set({field: [item]})
+        elif field in self._pending:
+            self._pending[field] = self._pending[field] + [item]
+        else:
+            self._pushes.setdefault(field, []).append(item)
+            self._schedule()
+
+    async def drain(self):
+        """Waits until every pending field has been written."""
+        if self._task is not None:
+            await self._task
+
+    def _schedule(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    async def _flush(self):
+        while self._pending or self._pushes:
+            update_data, push = self._pending, self._pushes
+            self._pending, self._pushes = {}, {}
+            try:
+                if push:
+                    await self.update_summary(self.summary_id, update_data, push=push)
+                else:
+                    await self.update_summary(self.summary_id, update_data)
+            except Exception as e:
+                logger.warning(f"Summary {self.summary_id}: partial update failed: {e}")
+
+
+async def stream_transcription(endpoint_url: str | None, model_path: str, request: LLMRequest, base_date: datetime,
+                               writer: SummaryWriter, timings: dict, priority: Priority = Priority.REPROCESS) -> TranscriptionExtraction:
+    """Streams the transcription extraction, writing the summary, medical info and each timeline event as they complete."""
+    start = time.perf_counter()
+    async for path, value in stream_llm_vllm_guided_json_with_transcription_text(
+        endpoint_url=endpoint_url,
+        model_path=model_path,
+        system_prompt=request.prompt,
+        transcription_text=request.input_text,
+        priority=priority
+    ):
+        if path == ():
+            return validate_extraction(TranscriptionExtraction, value)
+        if path == ("concise_summary",):
+            writer.set({"ai_summary": value})
+        elif len(path) == 2 and path[0] == "timeline_events":
+            event = _validated_item(TranscriptionTimelineEvent, value)
+            if event is None:
+                continue
+            writer.append("timeline_events", event.at(base_date).model_dump())
+        elif len(path) == 2 and path[0] == "relevant_medical_info":
+            writer.append("ambulance_notes", value)
+        else:
+            continue
+        timings.setdefault("transcription_first_field", round(time.perf_counter() - start, 3))
+    raise ExtractionError("Transcription stream ended before the JSON object was complete")
+
+
+async def stream_medical_journal(endpoint_url: str | None, model_path: str, request: LLMRequest,
+                                 writer: SummaryWriter, timings: dict, priority: Priority = Priority.REPROCESS) -> MedicalJournalExtraction:
+    """Streams the medical journal extraction, writing each critical information, medication and allergy entry as it completes."""
+    start = time.perf_counter()
+    # The entries are written to medical_journal.<category>, which MongoDB cannot create while medical_journal is
+    # null (its default), so the empty journal is written first, on its own so no entry is merged into the same update
+    writer.set({"medical_journal": MedicalJournal().model_dump()})
+    await writer.drain()
+    async for path, value in stream_llm_vllm_guided_json_with_medical_journal(
+        endpoint_url=endpoint_url,
+        model_path=model_path,
+        system_prompt=request.prompt,
+        medical_journal=request.input_text,
+        priority=priority
+    ):
+        if path == ():
+            return validate_extraction(MedicalJournalExtraction, value)
+        if len(path) == 3 and path[0] == "medical_journal" and path[1] in JOURNAL_ITEM_MODELS:
+            item = _validated_item(JOURNAL_ITEM_MODELS[path[1]], value)
+            if item is None:
+                continue
+            writer.append(f"medical_journal.{path[1]}", item.model_dump())
+            timings.setdefault("medical_journal_first_field", round(time.perf_counter() - start, 3))
+    raise ExtractionError("Medical journal stream ended before the JSON object was complete")
+
+
+async def _gather_extractions(transcription: Awaitable, journal: Awaitable, timings: dict) -> dict:
+    start = time.perf_counter()
+    transcription, journal = await asyncio.gather(
+        _timed("transcription", transcription, timings),
+        _timed("medical_journal", journal, timings),
+        return_exceptions=True
+    )
+    timings["total"] = round(time.perf_counter() - start, 3)
+
+    # A full LLM queue or an outage of every backend is transient; surface it so the job is retried rather than failed
+    for result in (transcription, journal):
+        if isinstance(result, (QueueFullError, NoHealthyBackendError)):
+            raise result
+
+    errors = {}
+    if isinstance(transcription, BaseException):
+        errors["transcription"] = str(transcription) or type(transcription).__name__
+        transcription = None
+    if isinstance(journal, BaseException):
+        errors["medical_journal"] = str(journal) or type(journal).__name__
+        journal = None
+    return {"transcription": transcription, "journal": journal, "errors": errors, "timings": timings}
+
+
+async def run_incident_extractions(endpoint_url: str | None, model_path: str, transcription_request: LLMRequest, journal_request: LLMRequest,
+                                   priority: Priority = Priority.REPROCESS) -> dict:
+    """
+    Runs the transcription and medical journal extractions concurrently.
+
+    A failure in one extraction does not cancel the other; its exception is
+    collected under "errors" instead. QueueFullError and NoHealthyBackendError are raised
+    rather than collected.
+
+    Returns:
+        dict: {"transcription": TranscriptionExtraction | None, "journal": MedicalJournalExtraction | None,
+               "errors": dict, "timings": dict}
+    """
+    timings = {}
+    return await _gather_extractions(
+        extract_transcription(endpoint_url, model_path, transcription_request, priority),
+        extract_medical_journal(endpoint_url, model_path, journal_request, priority),
+        timings
+    )
+
+
+async def stream_incident_extractions(endpoint_url: str | None, model_path: str, transcription_request: LLMRequest, journal_request: LLMRequest,
+                                      base_date: datetime, writer: SummaryWriter, priority: Priority = Priority.REPROCESS) -> dict:
+    """
+    Streams the transcription and medical journal extractions concurrently.
+
+    Completed fields are written to the summary through writer as soon as they close,
+    and the time to each extraction's first field is recorded in the timings. Returns
+    the same structure as run_incident_extractions once both streams have finished.
+    """
+    timings = {}
+    try:
+        return await _gather_extractions(
+            stream_transcription(endpoint_url, model_path, transcription_request, base_date, writer, timings, priority),
+            stream_medical_journal(endpoint_url, model_path, journal_request, writer, timings, priority),
+            timings
+        )
+    finally:
+        await writer.drain()
+
+
+def build_summary_update(transcription: TranscriptionExtraction | None, journal: MedicalJournalExtraction | None, base_date: datetime) -> dict:
+    """Maps the extraction results onto the Summary fields they populate, with timeline timestamps resolved to datetimes."""
+    update_data = {}
+    if transcription is not None:
+        update_data["ai_summary"] = transcription.concise_summary
+        update_data["timeline_events"] = [event.at(base_date).model_dump() for event in transcription.timeline_events]
+        update_data["ambulance_notes"] = transcription.relevant_medical_info
+    if journal is not None:
+        update_data["medical_journal"] = journal.medical_journal.model_dump()
+    return update_data
+
+
+async def process_incident(summary_id: str, base_date: datetime, endpoint_url: str | None, model_path: str,
+                           transcription_request: LLMRequest, journal_request: LLMRequest,
+                           update_summary: Callable[..., Awaitable[dict]], stream: bool = False,
+                           priority: Priority = Priority.REPROCESS, summary: dict | None = None) -> dict:
+    """
+    Extracts the AI content of an incident and writes it to its summary.
+
+    Both extractions run concurrently and their results are merged into a single
+    update_summary call. If only one extraction fails, the other's data is still
+    written and the summary is completed; if both fail the summary is marked failed.
+
+    In streaming mode, fields are also written to the summary as soon as the LLM
+    completes them, before the final update. If a streamed extraction fails, the fields
+    it already overwrote are restored from summary, so a failed stream does not leave
+    truncated data behind.
+
+    Args:
+        summary_id (str): The id of the summary to update.
+        base_date (datetime): The start of the call, used to resolve [MM:SS] timeline offsets.
+        endpoint_url (str | None): The URL of the vllm-openai endpoint, or None to use the backend pool.
+        model_path (str): The model path to use.
+        transcription_request (LLMRequest): The prompt and transcription text.
+        journal_request (LLMRequest): The prompt and medical journal text.
+        update_summary: Coroutine function persisting a partial update to the summary. While
+            streaming, it is also called with push={field: items} to append to array fields.
+        stream (bool): Whether to stream the extractions and write fields as they complete.
+        priority (Priority): The scheduling class of the LLM requests.
+        summary (dict | None): The summary as it was before processing. Required in streaming mode.
+
+    Returns:
+        dict: The updated summary.
+
+    Raises:
+        QueueFullError: If the LLM admission queue rejected an extraction.
+        NoHealthyBackendError: If no vLLM backend was available.
+        ValueError: If stream is set without summary.
+    """
+    if stream:
+        if summary is None:
+            raise ValueError("Streaming needs the summary to restore the fields of a failed extraction")
+        writer = SummaryWriter(summary_id, update_summary)
+        try:
+            result = await stream_incident_extractions(endpoint_url, model_path, transcription_request, journal_request, base_date, writer, priority)
+        except (QueueFullError, NoHealthyBackendError):
+            # The job is retried, so the summary is left as it was rather than with what streamed so far
+            if writer.written:
+                await update_summary(summary_id, {field: summary.get(field) for field in writer.written})
+            raise
+    else:
+        result = await run_incident_extractions(endpoint_url, model_path, transcription_request, journal_request, priority)
+    for stage, error in result["errors"].items():
+        logger.error(f"Summary {summary_id}: {stage} extraction failed: {error}")
+    logger.info(f"Summary {summary_id}: extraction timings {result['timings']}")
+
+    update_data = build_summary_update(result["transcription"], result["journal"], base_date)
+    update_data["status"] = "completed" if update_data else "failed"
+    if result["errors"]:
+        update_data["processing_errors"] = result["errors"]
+    if stream:
+        for stage in result["errors"]:
+            for field in STREAMED_FIELDS[stage]:
+                if field in writer.written:
+                    update_data[field] = summary.get(field)
+    with span("write_summary", status=update_data["status"]):
+        return await update_summary(summary_id, update_data)
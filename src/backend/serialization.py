@@ -0,0 +1,36 @@
+from bson import ObjectId
+from fastapi import Response
+import orjson
+
+
+def _default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value) -> bytes:
+    """
+    Encodes a value, such as a list of summary documents, straight to JSON bytes.
+
+    datetimes are encoded natively in ISO 8601 and ObjectIds as strings. The naive
+    datetimes MongoDB returns are UTC and encoded with a +00:00 offset, so clients do not
+    read them as local times.
+    """
+    return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC)
+
+
+class JSONBytesResponse(Response):
+    """
+    JSON response encoded with dumps.
+
+    Returning it from a route skips FastAPI's jsonable_encoder pass and response_model
+    validation, which for summary documents only repeat work the database already did.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
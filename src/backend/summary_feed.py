@@ -0,0 +1,151 @@
+from pymongo.errors import OperationFailure, PyMongoError
+from serialization import dumps
+import asyncio
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Error code returned by MongoDB when change streams are used on a standalone server
+CHANGE_STREAMS_UNSUPPORTED = 40573
+
+# How long to wait before re-opening a change stream after a transient error
+WATCH_RETRY_DELAY = 5
+
+
+def encode_event(event: dict) -> str:
+    """Encodes a feed event as JSON, handling the ObjectId and datetime fields of summary documents."""
+    return dumps(event).decode()
+
+
+class SummaryFeed:
+    """
+    Fans summary changes out to every live subscriber.
+
+    A single watcher follows db.summary through a MongoDB change stream. When the
+    server does not support change streams (no replica set), the feed falls back to
+    an internal pub/sub bus fed by the create/update/delete handlers via publish().
+
+    Each subscriber gets its own bounded queue of {"type", "data"} messages, where data
+    is the JSON-encoded event. A subscriber that falls too far behind has its queue
+    replaced by a single "resync" message, telling it to reload a snapshot.
+
+    The feed also keeps a collection version, bumped on every change it sees, which
+    lets readers tell cheaply whether the collection changed (see version_tag).
+    """
+
+    def __init__(self, queue_size: int = 256):
+        self.queue_size = queue_size
+        self.mode = "bus"
+        self._subscribers: set[asyncio.Queue] = set()
+        self._watch_task: asyncio.Task | None = None
+        self._resume_token = None
+        self.version = 0
+        # Versions are counted per process; the epoch keeps tags from different processes apart
+        self._epoch = uuid.uuid4().hex[:8]
+
+    async def start(self, collection):
+        """Starts the change stream watcher on the given collection."""
+        if self._watch_task is None:
+            self._watch_task = asyncio.create_task(self._watch(collection))
+
+    async def stop(self):
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def version_tag(self) -> str | None:
+        """
+        Returns a tag that changes whenever a summary is created, updated or deleted.
+
+        Only the change stream sees writes made by other API replicas and workers, so
+        in bus mode there is no trustworthy version and None is returned.
+        """
+        if self.mode != "change_stream":
+            return None
+        return f"{self._epoch}-{self.version}"
+
+    def publish(self, event: dict):
+        """
+        Publishes a change made by this process.
+
+        Ignored while the change stream is active, since the watcher already sees every
+        write, including those from other API replicas and workers.
+        """
+        if self.mode != "change_stream":
+            self._broadcast(event)
+
+    def _broadcast(self, event: dict):
+        self.version += 1
+        # Encode once, however many subscribers there are
+        message = {"type": event["type"], "data": encode_event(event)}
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync"})
+
+    async def _watch(self, collection):
+        while True:
+            try:
+                async with collection.watch(full_document="updateLookup", resume_after=self._resume_token) as stream:
+                    # Changes made while no stream was open may not be replayed
+                    self.version += 1
+                    self.mode = "change_stream"
+                    logger.info("Summary feed following MongoDB change stream")
+                    async for change in stream:
+                        self._resume_token = stream.resume_token
+                        event = self._event_from_change(change)
+                        if event is not None:
+                            self._broadcast(event)
+            except OperationFailure as e:
+                if e.code == CHANGE_STREAMS_UNSUPPORTED:
+                    self.mode = "bus"
+                    # The bus only carries this process's writes: with several server or job worker
+                    # processes, subscribers here miss the changes made by the others
+                    logger.warning("MongoDB change streams unavailable (no replica set), summary feed using internal bus; "
+                                   "changes made by other processes will not reach this process's subscribers")
+                    return
+                self._resume_token = None
+                self._on_watch_error(e)
+            except PyMongoError as e:
+                self._on_watch_error(e)
+            # The bus covers this process's writes until the stream is re-opened
+            self._broadcast({"type": "resync"})
+            await asyncio.sleep(WATCH_RETRY_DELAY)
+
+    def _on_watch_error(self, error: Exception):
+        self.mode = "bus"
+        logger.warning(f"Summary change stream interrupted: {error}, retrying in {WATCH_RETRY_DELAY}s")
+
+    @staticmethod
+    def _event_from_change(change: dict) -> dict | None:
+        operation = change["operationType"]
+        if operation == "delete":
+            return {"type": "delete", "_id": str(change["documentKey"]["_id"])}
+        if operation in ("insert", "update", "replace"):
+            document = change.get("fullDocument")
+            if document is None:
+                # Deleted before the update could be looked up; the delete event follows
+                return None
+            document["_id"] = str(document["_id"])
+            return {"type": "insert" if operation == "insert" else "update", "summary": document}
+        return None
+
+
+# Shared feed instance, started and stopped by the app
+summary_feed = SummaryFeed()
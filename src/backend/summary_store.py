@@ -0,0 +1,143 @@
+from datetime import datetime
+from bson import ObjectId
+from pymongo import ReturnDocument
+from database import db
+from summary_feed import summary_feed
+
+
+def serialize_mongo_document(document):
+    if document:
+        document["_id"] = str(document["_id"])
+    return document
+
+
+def _now() -> datetime:
+    # MongoDB stores milliseconds; truncating keeps returned documents identical to stored ones
+    now = datetime.utcnow()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+async def read_summary_document(summary_id: str) -> dict | None:
+    return serialize_mongo_document(await db.summary.find_one({"_id": ObjectId(summary_id)}))
+
+
+async def create_summary_document(summary_dict: dict) -> dict:
+    """Inserts a new summary, stamping created_at and edited_at, and publishes it to the feed."""
+    summary_dict["created_at"] = summary_dict["edited_at"] = _now()
+    await db.summary.insert_one(summary_dict)
+    # insert_one sets _id on the dict, which is then exactly the stored document
+    new_summary = serialize_mongo_document(dict(summary_dict))
+    summary_feed.publish({"type": "insert", "summary": new_summary})
+    return new_summary
+
+
+def merge_summary_updates(updates: list[dict]) -> dict:
+    """
+    Combines MongoDB update documents into one, in order.
+
+    Later $set values win and $push values for the same field are concatenated into one
+    $each. Any other operator is merged key by key.
+
+    Raises:
+        ValueError: If two operators touch the same field, which MongoDB rejects in one update.
+    """
+    merged: dict[str, dict] = {}
+    for update in updates:
+        for operator, fields in update.items():
+            target = merged.setdefault(operator, {})
+            for field, value in fields.items():
+                if operator == "$push":
+                    values = value["$each"] if isinstance(value, dict) and "$each" in value else [value]
+                    target.setdefault(field, {"$each": []})["$each"].extend(values)
+                else:
+                    target[field] = value
+
+    seen = set()
+    for operator, fields in merged.items():
+        conflicts = seen & fields.keys()
+        if conflicts:
+            raise ValueError(f"Conflicting updates to {', '.join(sorted(conflicts))}")
+        seen |= fields.keys()
+    return merged
+
+
+async def modify_summary_document(summary_id: str, update: dict, condition: dict | None = None) -> dict | None:
+    """
+    Applies a MongoDB update document to a summary in a single round trip, stamping
+    edited_at, and publishes the updated summary to the feed.
+
+    Args:
+        summary_id (str): The id of the summary.
+        update (dict): The MongoDB update document.
+        condition (dict | None): Extra filter the summary must match for the update to apply,
+            e.g. the value of a field read before computing the update.
+
+    Returns:
+        dict | None: The updated summary, or None if it does not exist or does not match condition.
+    """
+    update = {**update, "$set": {**update.get("$set", {}), "edited_at": _now()}}
+    query = {**(condition or {}), "_id": ObjectId(summary_id)}
+    updated_summary = await db.summary.find_one_and_update(query, update, return_document=ReturnDocument.AFTER)
+    if updated_summary is None:
+        return None
+
+    updated_summary = serialize_mongo_document(updated_summary)
+    summary_feed.publish({"type": "update", "summary": updated_summary})
+    return updated_summary
+
+
+async def update_summary_document(summary_id: str, update_data: dict, push: dict[str, list] | None = None) -> dict | None:
+    """
+    Sets the given fields on a summary and appends to array fields, in a single round trip.
+
+    Args:
+        summary_id (str): The id of the summary.
+        update_data (dict): Fields to set.
+        push (dict | None): Array fields and the items to append to each.
+
+    Returns:
+        dict | None: The updated summary, or None if it does not exist.
+    """
+    update = {"$set": dict(update_data)}
+    if push:
+        update["$push"] = {field: {"$each": list(values)} for field, values in push.items()}
+    return await modify_summary_document(summary_id, update)
+
+
+async def append_timeline_events(summary_id: str, events: list[dict], expected_length: int | None = None) -> dict | None:
+    """
+    Appends events to a summary's timeline without rewriting the events already stored.
+
+    Args:
+        summary_id (str): The id of the summary.
+        events (list[dict]): The events to append.
+        expected_length (int | None): Only append if the timeline holds exactly this many
+            events, so replaying the same append (e.g. from a retried job) is a no-op.
+
+    Returns:
+        dict | None: The updated summary, or None if it does not exist or the timeline
+            does not have the expected length.
+    """
+    update = {"$push": {"timeline_events": {"$each": list(events)}}}
+    condition = None if expected_length is None else {"timeline_events": {"$size": expected_length}}
+    return await modify_summary_document(summary_id, update, condition=condition)
+
+
+async def bulk_update_summary_document(summary_id: str, updates: list[dict], condition: dict | None = None) -> dict | None:
+    """
+    Applies several MongoDB update documents to one summary in a single round trip.
+
+    The updates are merged with merge_summary_updates and applied atomically, so
+    readers never see some of them without the others. condition is passed on to
+    modify_summary_document.
+    """
+    return await modify_summary_document(summary_id, merge_summary_updates(updates), condition=condition)
+
+
+async def delete_summary_document(summary_id: str) -> bool:
+    """Deletes a summary and publishes the deletion to the feed. Returns False if it did not exist."""
+    result = await db.summary.delete_one({"_id": ObjectId(summary_id)})
+    if result.deleted_count == 0:
+        return False
+    summary_feed.publish({"type": "delete", "_id": summary_id})
+    return True
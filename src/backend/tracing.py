@@ -0,0 +1,108 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import json
+import logging
+import os
+import time
+import uuid
+
+logger = logging.getLogger("trace")
+
+# Spans are logged as one JSON object per line on the "trace" logger
+TRACE_SPANS = os.getenv("TRACE_SPANS", "true").lower() == "true"
+
+
+class Span:
+    """A timed stage of a trace. Attributes can be added while the span is open."""
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = time.time()
+        self._started = time.perf_counter()
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def finish(self, error: BaseException | None = None):
+        duration = time.perf_counter() - self._started
+        if error is not None:
+            self.attributes["error"] = str(error) or type(error).__name__
+        emit(self.name, duration, self.trace_id, self.span_id, self.parent_id, self.start, self.attributes)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def trace(trace_id: str, name: str, **attributes):
+    """
+    Opens the root span of a trace, such as the processing of one incident.
+
+    Spans opened in the same task, in tasks it starts, and in Motor calls it makes
+    (Motor copies the context to its executor threads) become part of this trace.
+
+    Args:
+        trace_id (str): The id tying the spans together, the summary id for incidents.
+        name (str): The name of the root span.
+    """
+    root = Span(name, trace_id, None, attributes)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.finish(e)
+        raise
+    else:
+        root.finish()
+    finally:
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Opens a child span of the current span. Outside of a trace this does nothing."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = Span(name, parent.trace_id, parent.span_id, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.finish(e)
+        raise
+    else:
+        child.finish()
+    finally:
+        _current_span.reset(token)
+
+
+def record_span(name: str, duration: float, **attributes):
+    """Records a finished child span of the current span, for stages timed elsewhere (e.g. Mongo command events)."""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    emit(name, duration, parent.trace_id, uuid.uuid4().hex[:16], parent.span_id, time.time() - duration, attributes)
+
+
+def emit(name: str, duration: float, trace_id: str, span_id: str, parent_id: str | None, start: float, attributes: dict):
+    if not TRACE_SPANS:
+        return
+    logger.info(json.dumps({
+        "trace_id": trace_id,
+        "span_id": span_id,
+        "parent_id": parent_id,
+        "name": name,
+        "start": round(start, 6),
+        "duration_ms": round(duration * 1000, 3),
+        "attributes": attributes,
+    }, default=str))
@@ -0,0 +1,173 @@
+from pymongo.errors import PyMongoError
+from models import LLMRequest
+from demo_data import demo_data
+from jobs import JOB_LEASE_SECONDS, claim_job, complete_job, ensure_job_indexes, fail_job, renew_lease
+from llm.client import VLLM_MODEL_PATH, vllm_client
+from llm.scheduler import Priority
+from pipeline import process_incident, summary_base_date
+from summary_store import append_timeline_events, read_summary_document, update_summary_document
+from tracing import trace
+import asyncio
+import logging
+import os
+import random
+import signal
+import socket
+
+logger = logging.getLogger(__name__)
+
+# Number of concurrent jobs per process, and how often idle workers look for new jobs
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+
+
+##################
+## Job handlers ##
+##################
+async def handle_process_incident(job: dict):
+    """Runs the AI extractions for a summary. Payload: transcription, journal (LLMRequest dicts), stream and priority."""
+    summary = await read_summary_document(job["summary_id"])
+    if summary is None:
+        logger.info(f"Job {job['_id']}: summary {job['summary_id']} no longer exists")
+        return
+    await update_summary_document(job["summary_id"], {"status": "processing"})
+    await process_incident(
+        summary_id=job["summary_id"],
+        base_date=summary_base_date(summary),
+        endpoint_url=None,
+        model_path=VLLM_MODEL_PATH,
+        transcription_request=LLMRequest(**job["payload"]["transcription"]),
+        journal_request=LLMRequest(**job["payload"]["journal"]),
+        update_summary=update_summary_document,
+        stream=job["payload"].get("stream", True),
+        priority=Priority[job["payload"].get("priority", "live").upper()],
+        summary=summary
+    )
+
+
+async def handle_demo_incident(job: dict):
+    """Plays back a live demo call on a summary, then processes it. Payload: timeline_events and i, the index into demo_data."""
+    summary_id = job["summary_id"]
+    timeline_events = job["payload"]["timeline_events"]
+
+    # Wait and append the next timeline event. An event is only appended while the timeline holds exactly
+    # the events before it, so a retried or re-claimed job does not play back the same events twice
+    for position, event in enumerate(timeline_events[1:], start=1):
+        await asyncio.sleep(5)
+        await append_timeline_events(summary_id, [event], expected_length=position)
+    await asyncio.sleep(1)
+
+    i = job["payload"]["i"]
+    job["payload"]["transcription"] = demo_data[i]["transcription"].dict()
+    job["payload"]["journal"] = demo_data[i]["journal"].dict()
+    await handle_process_incident(job)
+
+
+JOB_HANDLERS = {
+    "process_incident": handle_process_incident,
+    "demo_incident": handle_demo_incident,
+}
+
+
+#################
+## Worker pool ##
+#################
+class WorkerPool:
+    """
+    Pool of asyncio workers claiming jobs from the MongoDB job queue.
+
+    Runs inside the API process (JOB_WORKERS > 0) or standalone with `python -m worker`.
+    Each running job's lease is renewed while its handler runs; if a worker dies, the
+    lease expires and another worker picks the job up again.
+    """
+
+    def __init__(self, concurrency: int = JOB_WORKERS, poll_interval: float = JOB_POLL_INTERVAL):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        if self._tasks or self.concurrency <= 0:
+            return
+        await ensure_job_indexes()
+        self._tasks = [asyncio.create_task(self._run(f"{self.worker_id}-{n}")) for n in range(self.concurrency)]
+        logger.info(f"Started {self.concurrency} job workers")
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self, worker_id: str):
+        while True:
+            try:
+                job = await claim_job(worker_id)
+            except PyMongoError as e:
+                logger.warning(f"Worker {worker_id} failed to claim a job: {e}")
+                job = None
+            if job is None:
+                # Jitter keeps idle workers from polling in lockstep
+                await asyncio.sleep(self.poll_interval * random.uniform(0.5, 1.5))
+                continue
+            try:
+                await self._execute(job)
+            except Exception as e:
+                # E.g. a MongoDB error while completing or failing the job; its lease expires and it is claimed again
+                logger.error(f"Worker {worker_id} failed to run job {job['_id']}: {e}")
+
+    async def _execute(self, job: dict):
+        handler = JOB_HANDLERS.get(job["type"])
+        if handler is None:
+            await fail_job(job, f"Unknown job type {job['type']}")
+            return
+
+        logger.info(f"Job {job['_id']} ({job['type']}) started, attempt {job['attempts']}/{job['max_attempts']}")
+        # Incident jobs are traced under their summary id, tying together every attempt
+        with trace(job.get("summary_id") or job["_id"], f"job.{job['type']}", job_id=job["_id"], attempt=job["attempts"]) as root:
+            task = asyncio.create_task(handler(job))
+            try:
+                while not task.done():
+                    await asyncio.wait({task}, timeout=JOB_LEASE_SECONDS / 3)
+                    if not task.done() and not await renew_lease(job):
+                        logger.warning(f"Job {job['_id']}: lease lost, abandoning")
+                        root.set(outcome="lease_lost")
+                        task.cancel()
+                        return
+                task.result()
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            except Exception as e:
+                # Also reached when renewing the lease fails, so the handler is stopped before the job is requeued
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                logger.error(f"Job {job['_id']} failed: {e}")
+                root.set(outcome="failed", error=str(e) or type(e).__name__)
+                await fail_job(job, str(e) or type(e).__name__)
+                return
+            root.set(outcome="succeeded")
+            await complete_job(job)
+        logger.info(f"Job {job['_id']} succeeded")
+
+
+# Shared pool instance, started by the app when JOB_WORKERS > 0
+worker_pool = WorkerPool()
+
+
+async def main():
+    await vllm_client.warmup()
+    await worker_pool.start()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+    await worker_pool.stop()
+    await vllm_client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
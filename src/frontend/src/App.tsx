@@ -18,6 +18,11 @@ import EmergencyTimeline from "./components/EmergencyTimeline";
 import LiveEmergencyView from "./components/LiveEmergencyView";
 import NeutralView from "./components/NeutralView";
 
+const withId = (summary: Summary & { _id?: string }): Summary => ({
+  ...summary,
+  id: summary.id || summary._id || String(Date.now()),
+});
+
 function App() {
   const [summaries, setSummaries] = useState<Summary[]>([]);
   const [selectedSummary, setSelectedSummary] = useState<Summary | null>(null);
@@ -29,12 +34,7 @@ function App() {
       setError(null);
       const data: (Summary & { _id?: string })[] = await mongoDb.getSummaries();
       if (data) {
-        const mappedData: Summary[] = data
-          .map(summary => ({
-            ...summary,
-            id: summary.id || summary._id || String(Date.now()),
-          }))
-        setSummaries(mappedData);
+        setSummaries(data.map(withId));
       }
     } catch (error) {
       console.error("Error fetching summaries:", error);
@@ -64,24 +64,29 @@ function App() {
   }, [selectedSummary]);
 
   useEffect(() => {
-    const setupMongoConnection = async () => {
-      try {
-        await fetchSummaries();
-        const intervalId = setInterval(fetchSummaries, 1000);
-        return () => {
-          clearInterval(intervalId);
-          mongoDb.disconnect();
-          mongoDb.removeAllListeners("INSERT");
-          mongoDb.removeAllListeners("UPDATE");
-        };
-      } catch (error) {
-        console.error("MongoDB connection error:", error);
-        setError("Failed to connect to database. Please refresh the page.");
-      }
-    };
+    mongoDb.onSnapshot((data) => {
+      setError(null);
+      setSummaries(data.map(withId));
+    });
+    mongoDb.onInsert((summary) => {
+      setSummaries((current) => [withId(summary), ...current.filter((s) => s._id !== summary._id)]);
+    });
+    mongoDb.onUpdate((summary) => {
+      setSummaries((current) => current.map((s) => (s._id === summary._id ? withId(summary) : s)));
+    });
+    mongoDb.onDelete((id) => {
+      setSummaries((current) => current.filter((s) => s._id !== id));
+    });
+    mongoDb.onError((error) => {
+      // EventSource reconnects on its own and receives a fresh snapshot
+      console.error("Summary stream error:", error);
+    });
+    mongoDb.subscribe();
 
-    setupMongoConnection();
-  }, [fetchSummaries]);
+    return () => {
+      mongoDb.disconnect();
+    };
+  }, []);
 
   const getStatusBadge = (status: Summary["status"]) => {
     if (status === "live") {
@@ -105,6 +110,14 @@ function App() {
       );
     }
 
+    if (status === "failed") {
+      return (
+        <span className="text-xs font-medium px-3 py-1 rounded-full bg-red-100 text-red-700">
+          Failed
+        </span>
+      );
+    }
+
     return (
       <span className="text-xs font-medium px-3 py-1 rounded-full bg-green-100 text-green-700">
         Completed
@@ -49,6 +49,29 @@ class DatabaseClient {
     }
   }
 
+  subscribe() {
+    if (this.eventSource) {
+      return;
+    }
+    // The server sends a snapshot on (re)connect, then one event per changed summary
+    this.eventSource = new EventSource(`${API_BASE_URL}/db/summaries/stream`);
+    this.eventSource.addEventListener("snapshot", (event) => {
+      this.eventEmitter.emit("SNAPSHOT", JSON.parse((event as MessageEvent).data));
+    });
+    this.eventSource.addEventListener("insert", (event) => {
+      this.eventEmitter.emit("INSERT", JSON.parse((event as MessageEvent).data).summary);
+    });
+    this.eventSource.addEventListener("update", (event) => {
+      this.eventEmitter.emit("UPDATE", JSON.parse((event as MessageEvent).data).summary);
+    });
+    this.eventSource.addEventListener("delete", (event) => {
+      this.eventEmitter.emit("DELETE", JSON.parse((event as MessageEvent).data)._id);
+    });
+    this.eventSource.onerror = (error) => {
+      this.eventEmitter.emit("ERROR", error);
+    };
+  }
+
   async getSummaries(): Promise<Summary[]> {
     const response = await fetch(`${API_BASE_URL}/db/summaries`, {
       headers: {
@@ -105,6 +128,18 @@ class DatabaseClient {
     // Simulate real-time updates if needed
   }
 
+  onSnapshot(callback: (summaries: Summary[]) => void) {
+    this.eventEmitter.on("SNAPSHOT", callback);
+  }
+
+  onDelete(callback: (id: string) => void) {
+    this.eventEmitter.on("DELETE", callback);
+  }
+
+  onError(callback: (error: Event) => void) {
+    this.eventEmitter.on("ERROR", callback);
+  }
+
   removeAllListeners(event?: string) {
     this.eventEmitter.removeAllListeners(event);
   }
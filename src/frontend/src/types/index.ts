@@ -30,6 +30,6 @@ export interface Summary {
     current_medications?: Medication[];
     allergy_information?: Allergy[];
   };
-  status: "processing" | "completed" | "live";
+  status: "processing" | "completed" | "live" | "failed";
   ai_summary?: string;
 }
\ No newline at end of file